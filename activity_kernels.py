@@ -0,0 +1,112 @@
+"""
+Array kernels behind the activity heatmap and the stat chart.
+
+Per-day activity from the daily rollup ({"YYYY-MM-DD": {"count", "seconds"}})
+becomes dense per-day series for a date range, and those become weekday
+histograms, chart bars and the heatmap's week x weekday grid.
+
+With NumPy the rollup's dates are parsed into one datetime64 array and each
+histogram is a single np.bincount / reshape; without it the same results
+come from plain Python loops. Calling into NumPy has a fixed cost (and
+importing it ~100ms), more than the loops take for a year of days, so the
+NumPy path is only used for long series: over NUMPY_MIN_ITEMS items once
+NumPy is loaded (the daemon preloads it), over NUMPY_IMPORT_MIN_ITEMS if it
+would have to be imported first. Every kernel returns plain lists either way.
+"""
+import importlib.util
+import sys
+from datetime import date
+from typing import Dict, List, Tuple
+
+from lazy_imports import lazy_module
+
+np = lazy_module("numpy")
+
+NUMPY_AVAILABLE = importlib.util.find_spec("numpy") is not None
+
+# Series length from which NumPy beats the loops, once imported / counting the import
+NUMPY_MIN_ITEMS = 1_000
+NUMPY_IMPORT_MIN_ITEMS = 50_000
+
+
+def use_numpy(size: int) -> bool:
+    """Whether the NumPy path pays off for a series of `size` items."""
+    if not NUMPY_AVAILABLE:
+        return False
+    return size >= (NUMPY_MIN_ITEMS if "numpy" in sys.modules else NUMPY_IMPORT_MIN_ITEMS)
+
+
+def preload():
+    """Import NumPy now (for long-lived processes), if installed."""
+    if NUMPY_AVAILABLE:
+        import numpy  # noqa: F401
+
+
+def day_series(daily: Dict[str, Dict], start: date, end: date) -> Tuple[List[int], List[int]]:
+    """
+    (tasks per day, seconds per day) for every day from start to end inclusive.
+
+    Args:
+        daily: The rollup's "days" mapping
+    """
+    days = max(0, (end - start).days + 1)
+    if not use_numpy(days):
+        counts, seconds = [0] * days, [0] * days
+        first = start.toordinal()
+        for offset in range(days):
+            entry = daily.get(date.fromordinal(first + offset).isoformat())
+            if entry:
+                counts[offset] = entry["count"]
+                seconds[offset] = entry["seconds"]
+        return counts, seconds
+
+    if not daily or not days:
+        return [0] * days, [0] * days
+    offsets = (np.array(list(daily), dtype="datetime64[D]") - np.datetime64(start.isoformat(), "D")).astype(np.int64)
+    inside = (offsets >= 0) & (offsets < days)
+    entries = list(daily.values())
+    counts = np.fromiter((entry["count"] for entry in entries), np.int64, len(entries))
+    seconds = np.fromiter((entry["seconds"] for entry in entries), np.int64, len(entries))
+    return (
+        np.bincount(offsets[inside], weights=counts[inside], minlength=days).astype(np.int64).tolist(),
+        np.bincount(offsets[inside], weights=seconds[inside], minlength=days).astype(np.int64).tolist(),
+    )
+
+
+def weekday_totals(values: List[int], start: date) -> List[int]:
+    """Sum of a per-day series (first day `start`) by weekday, Mon..Sun."""
+    first = start.weekday()
+    if not use_numpy(len(values)):
+        totals = [0] * 7
+        for offset, value in enumerate(values):
+            totals[(first + offset) % 7] += value
+        return totals
+    weekdays = (np.arange(len(values)) + first) % 7
+    return np.bincount(weekdays, weights=np.asarray(values, dtype=np.int64), minlength=7).astype(np.int64).tolist()
+
+
+def chunk_sums(values: List[int], span: int) -> List[int]:
+    """Sums of consecutive runs of `span` values (the last run may be shorter)."""
+    if not values:
+        return []
+    if span <= 1:
+        return list(values)
+    if not use_numpy(len(values)):
+        return [sum(values[i:i + span]) for i in range(0, len(values), span)]
+    return np.add.reduceat(np.asarray(values, dtype=np.int64), np.arange(0, len(values), span)).tolist()
+
+
+def heatmap_grid(values: List[int], first_weekday: int, weeks: int = 54) -> List[List[int]]:
+    """
+    Lay a per-day series out as 7 weekday rows (Mon..Sun) of `weeks` columns,
+    the first day falling on `first_weekday`. Cells before the first day or
+    after the last one are -1.
+    """
+    cells = weeks * 7
+    if not use_numpy(cells):
+        padded = [-1] * cells
+        padded[first_weekday:first_weekday + len(values)] = values[:cells - first_weekday]
+        return [padded[row::7] for row in range(7)]
+    padded = np.full(cells, -1, dtype=np.int64)
+    padded[first_weekday:first_weekday + len(values)] = values[:cells - first_weekday]
+    return padded.reshape(weeks, 7).T.tolist()
@@ -0,0 +1,124 @@
+"""
+Archiving completed tasks: a move from the active task store to the history.
+
+The move is done in two phases, tracked by a marker file (ARCHIVE_MARKER):
+
+    {"tasks": ["<task id>", ...]}    -> archived, not yet removed from the store
+
+1. The tasks are appended to their history segments. The marker is written
+   in the same atomic_io commit, so the history never holds the batch
+   without the marker.
+2. The tasks are deleted from the active store (JSON journal or SQLite), then
+   the marker is removed.
+
+If a run dies between the two, resume() finishes phase 2 before the next
+archive (and on `TDL clear`), so tasks are neither archived twice nor lost.
+The marker is the commit point: a task of the batch reopened before phase 2
+ran is removed all the same, since its copy is already in the history (left
+active, it would be archived - and counted in the stats - a second time).
+This holds on the SQLite backend too, whose deletes can't join a file commit.
+The cost follows the number of archived tasks: history segments are only
+appended to (along with the small manifest and rollup), never read back.
+
+auto_archive() applies the policy from config.json (auto_archive_days,
+auto_archive_keep) so completed tasks don't pile up in the active store. It
+runs with the first command of each day (AUTO_ARCHIVE_STAMP holds the day it
+last ran), when the dashboard's display IDs are renumbered for the new day
+anyway; every other command only reads that one-line file.
+"""
+import os
+from datetime import date
+from typing import Iterable, List, Optional
+
+from models import Task
+from task_table import completed_ordinal
+import atomic_io
+import history_storage
+
+ARCHIVE_MARKER = os.path.join(history_storage.HISTORY_DIR, "archive.pending.json")
+AUTO_ARCHIVE_STAMP = os.path.join(history_storage.HISTORY_DIR, "auto_archive.day")
+
+
+def _pending_ids() -> Optional[List[str]]:
+    marker = atomic_io.read_json(ARCHIVE_MARKER, None)
+    if not isinstance(marker, dict) or not isinstance(marker.get("tasks"), list):
+        return None
+    return marker["tasks"]
+
+
+def resume() -> int:
+    """
+    Finish an interrupted archive: remove the tasks it already filed in the
+    history from the active store. Returns how many were removed.
+    """
+    from storage import delete_tasks, get_tasks
+
+    ids = _pending_ids()
+    if ids is None:
+        if atomic_io.exists(ARCHIVE_MARKER):
+            atomic_io.remove(ARCHIVE_MARKER)  # Unreadable: nothing to finish
+        return 0
+    # Past the commit point: even a task reopened meanwhile is in the history
+    removing = list(get_tasks(ids))
+    delete_tasks(removing)
+    atomic_io.remove(ARCHIVE_MARKER)
+    return len(removing)
+
+
+def archive(tasks: Iterable[Task]) -> int:
+    """Move completed tasks to the history. Returns how many were archived."""
+    from storage import delete_tasks
+
+    resume()
+    tasks = [task for task in tasks if task.completed]
+    if not tasks:
+        return 0
+    ids = [task.id for task in tasks]
+
+    # Phase 1: history segments, manifest, rollup and marker in one commit
+    with atomic_io.deferred_writes():
+        history_storage.add_to_history(tasks)
+        atomic_io.write_json(ARCHIVE_MARKER, {"tasks": ids}, indent=None)
+
+    # Phase 2: drop them from the active store
+    delete_tasks(ids)
+    atomic_io.remove(ARCHIVE_MARKER)
+    return len(tasks)
+
+
+def expired(tasks: Iterable[Task], days: int, keep: int, today: Optional[date] = None) -> List[Task]:
+    """
+    Completed tasks the policy moves out: completed more than `days` days
+    before `today`, or beyond the `keep` most recently completed (0 disables
+    either rule). Tasks without a completion time (completed before it was
+    recorded) have no age: only the `keep` cap applies to them, as the oldest.
+    """
+    completed = [task for task in tasks if task.completed]
+    if not completed:
+        return []
+    completed.sort(key=completed_ordinal, reverse=True)
+    cutoff = (today or date.today()).toordinal() - days if days > 0 else None
+    moved = []
+    for position, task in enumerate(completed):
+        ordinal = completed_ordinal(task)
+        if (keep > 0 and position >= keep) or (cutoff is not None and 0 < ordinal < cutoff):
+            moved.append(task)
+    return moved
+
+
+def auto_archive(today: Optional[date] = None) -> int:
+    """Apply the auto-archive policy, once per day. Returns how many tasks were archived."""
+    from config_storage import get_auto_archive_policy
+    from storage import find_tasks
+
+    days, keep = get_auto_archive_policy()
+    if not days and not keep:
+        return 0
+    today = today or date.today()
+    if (atomic_io.read_text(AUTO_ARCHIVE_STAMP) or "").strip() == today.isoformat():
+        return 0
+
+    archived = archive(expired(find_tasks(completed=True), days, keep, today))
+    os.makedirs(history_storage.HISTORY_DIR, exist_ok=True)
+    atomic_io.write_text(AUTO_ARCHIVE_STAMP, today.isoformat())
+    return archived
@@ -0,0 +1,355 @@
+"""
+Crash-safe file writes shared by all *_storage modules.
+
+Every write goes to a temp file in the same directory, is fsync'ed and then
+renamed over the target, so a crash or Ctrl-C can never leave a truncated
+JSON file behind.
+
+Writes can also be deferred with `deferred_writes()`: everything written inside
+the block is kept in memory (reads see it) and committed together when the
+block exits, e.g. `check` saving tasks and then the streak. If the block raises,
+nothing is written.
+
+A commit touching several files first stages every new file next to its
+target, then records the whole batch in a commit marker (COMMIT_FILE) before
+renaming and appending. If the process dies half way, the next process to use
+the directory finds the marker and finishes the batch, so readers never see
+some files of a commit without the others.
+"""
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# path -> ("write", text) | ("append", text) | ("remove", None) while deferring
+_pending: Dict[str, Tuple[str, Optional[str]]] = {}
+_defer_depth = 0
+
+# Callbacks to run once the deferred writes are on disk, or when they are dropped
+_after_commit: List[Callable[[], None]] = []
+_on_rollback: List[Callable[[], None]] = []
+
+# Marker listing the steps of a multi-file commit until they are all done
+COMMIT_FILE = ".zenith-commit.json"
+
+# Directories already checked for an unfinished commit in this process
+_recovered = set()
+
+
+def _key(path: str) -> str:
+    return os.path.abspath(path)
+
+
+def _fsync_dir(directory: str):
+    """Persist renames in a directory (no-op where directories can't be opened)."""
+    if os.name == "nt":
+        return
+    try:
+        fd = os.open(directory or ".", os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _write_temp(path: str, text: str) -> str:
+    """Write text to a synced temp file next to `path` and return its name."""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return tmp_path
+
+
+def _append_now(path: str, text: str):
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+# --- Writes ---
+
+def write_text(path: str, text: str):
+    """Atomically replace `path` with `text`."""
+    _recover_once()
+    if _defer_depth:
+        _pending[_key(path)] = ("write", text)
+        return
+    tmp_path = _write_temp(path, text)
+    os.replace(tmp_path, path)
+    _fsync_dir(os.path.dirname(os.path.abspath(path)))
+
+
+def write_json(path: str, data: Any, indent: Optional[int] = 4):
+    """Atomically replace `path` with JSON-encoded `data`."""
+    write_text(path, json.dumps(data, indent=indent))
+
+
+def append_text(path: str, text: str):
+    """Durably append `text` to `path` (used by append-only logs)."""
+    if not text:
+        return
+    _recover_once()
+    if _defer_depth:
+        key = _key(path)
+        kind, existing = _pending.get(key, (None, None))
+        if kind in ("write", "append"):
+            _pending[key] = (kind, existing + text)
+        elif kind == "remove":
+            _pending[key] = ("write", text)
+        else:
+            _pending[key] = ("append", text)
+        return
+    _append_now(path, text)
+
+
+def remove(path: str):
+    """Delete `path` if it exists."""
+    _recover_once()
+    if _defer_depth:
+        _pending[_key(path)] = ("remove", None)
+        return
+    if os.path.exists(path):
+        os.remove(path)
+
+
+# --- Reads (see deferred writes) ---
+
+def read_text(path: str) -> Optional[str]:
+    """Return the current contents of `path`, or None if it doesn't exist."""
+    _recover_once()
+    kind, text = _pending.get(_key(path), (None, None)) if _defer_depth else (None, None)
+    if kind == "write":
+        return text
+    if kind == "remove":
+        return None
+
+    if not os.path.exists(path):
+        on_disk = None
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            on_disk = f.read()
+
+    if kind == "append":
+        return (on_disk or "") + text
+    return on_disk
+
+
+def exists(path: str) -> bool:
+    _recover_once()
+    return read_text(path) is not None if _defer_depth else os.path.exists(path)
+
+
+def getsize(path: str) -> int:
+    """Size of `path` in bytes (0 if missing)."""
+    _recover_once()
+    if _defer_depth and _key(path) in _pending:
+        text = read_text(path)
+        return len(text.encode("utf-8")) if text else 0
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def quarantine(path: str) -> Optional[str]:
+    """
+    Move an unreadable file aside (e.g. tasks.json.corrupt-20260105-101500)
+    so the next save can't overwrite the user's data with an empty list.
+    """
+    if not os.path.exists(path):
+        return None
+    backup = f"{path}.corrupt-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+    try:
+        os.replace(path, backup)
+    except OSError:
+        return None
+    return backup
+
+
+def read_json(path: str, default: Any = None) -> Any:
+    """
+    Load JSON from `path`.
+
+    Returns `default` if the file is missing. A file that exists but can't be
+    parsed is quarantined first, then `default` is returned.
+    """
+    try:
+        text = read_text(path)
+    except (IOError, UnicodeDecodeError):
+        return default
+    if text is None:
+        return default
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        quarantine(path)
+        return default
+
+
+# --- Deferred (batched) commits ---
+
+def deferring() -> bool:
+    """True inside a deferred_writes() block."""
+    return _defer_depth > 0
+
+
+def pending(path: str) -> bool:
+    """True if `path` has writes waiting in the current deferred_writes() block."""
+    return bool(_defer_depth) and _key(path) in _pending
+
+
+def after_commit(callback: Callable[[], None]):
+    """
+    Run `callback` once pending writes are on disk (immediately when not
+    deferring). Callbacks of a block that raises are dropped with its writes.
+    """
+    if _defer_depth:
+        if callback not in _after_commit:
+            _after_commit.append(callback)
+        return
+    callback()
+
+
+def on_rollback(callback: Callable[[], None]):
+    """
+    Run `callback` if the current deferred_writes() block raises and its
+    writes are dropped (e.g. to forget in-memory state built on them).
+    Does nothing when not deferring.
+    """
+    if _defer_depth and callback not in _on_rollback:
+        _on_rollback.append(callback)
+
+
+@contextmanager
+def deferred_writes():
+    """Buffer all writes in the block and commit them together on exit."""
+    global _defer_depth
+    _defer_depth += 1
+    try:
+        yield
+    except BaseException:
+        _defer_depth -= 1
+        if _defer_depth == 0:
+            _pending.clear()
+            _after_commit.clear()
+            callbacks = list(_on_rollback)
+            _on_rollback.clear()
+            for callback in callbacks:
+                callback()
+        raise
+    _defer_depth -= 1
+    if _defer_depth == 0:
+        _on_rollback.clear()
+        flush()
+        callbacks = list(_after_commit)
+        _after_commit.clear()
+        for callback in callbacks:
+            callback()
+
+
+def flush():
+    """
+    Commit deferred writes: sync every temp file first, then rename them all.
+
+    When more than one file is involved the steps are recorded in COMMIT_FILE
+    first, so an interrupted commit is completed by recover().
+    """
+    pending = list(_pending.items())
+    _pending.clear()
+    if not pending:
+        return
+
+    staged = []
+    try:
+        for path, (kind, text) in pending:
+            if kind == "write":
+                staged.append((_write_temp(path, text), path))
+    except BaseException:
+        for tmp_path, _ in staged:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        raise
+
+    steps = {
+        "renames": staged,
+        "appends": [(path, _size(path), text) for path, (kind, text) in pending if kind == "append"],
+        "removes": [path for path, (kind, _) in pending if kind == "remove"],
+    }
+    if len(pending) == 1:
+        _apply(steps)
+        return
+
+    marker = _write_temp(COMMIT_FILE, json.dumps(steps))
+    os.replace(marker, COMMIT_FILE)
+    _fsync_dir(os.path.dirname(os.path.abspath(COMMIT_FILE)))
+    _apply(steps)
+    os.remove(COMMIT_FILE)
+
+
+def _size(path: str) -> int:
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def _apply(steps: Dict):
+    """
+    Carry out the steps of a commit. Safe to repeat: renames already done are
+    skipped and appends are cut back to the recorded size before rewriting.
+    """
+    directories = set()
+    for tmp_path, path in steps["renames"]:
+        if os.path.exists(tmp_path):
+            os.replace(tmp_path, path)
+        directories.add(os.path.dirname(path))
+    for path, size, text in steps["appends"]:
+        if _size(path) > size:
+            with open(path, "r+b") as f:
+                f.truncate(size)
+        _append_now(path, text)
+        directories.add(os.path.dirname(path))
+    for path in steps["removes"]:
+        if os.path.exists(path):
+            os.remove(path)
+        directories.add(os.path.dirname(path))
+
+    for directory in directories:
+        _fsync_dir(directory)
+
+
+def recover():
+    """Finish a multi-file commit that was interrupted in the current directory."""
+    if not os.path.exists(COMMIT_FILE):
+        return
+    try:
+        with open(COMMIT_FILE, "r", encoding="utf-8") as f:
+            steps = json.load(f)
+    except (OSError, ValueError):
+        # Unreadable marker: drop it rather than fail every command
+        os.remove(COMMIT_FILE)
+        return
+    _apply(steps)
+    os.remove(COMMIT_FILE)
+
+
+def _recover_once():
+    directory = os.getcwd()
+    if directory not in _recovered:
+        _recovered.add(directory)
+        recover()
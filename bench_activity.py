@@ -0,0 +1,98 @@
+"""
+Benchmark: activity heatmap grid and stat series, built with the former
+cell-by-cell loop vs the activity_kernels Python and NumPy paths
+
+Times one year (the welcome-screen heatmap) and a long custom window, from a
+synthetic daily rollup. The NumPy path assumes NumPy is already imported (as
+in the daemon); its import cost is printed separately.
+
+Usage:
+    python bench_activity.py [years]    (default: 30)
+"""
+import sys
+import time
+from datetime import date, timedelta
+
+import activity_kernels
+
+
+def make_daily(years: int) -> dict:
+    first = date.today() - timedelta(days=365 * years)
+    return {
+        (first + timedelta(days=i)).isoformat(): {"count": i % 7, "seconds": (i % 5) * 900}
+        for i in range(365 * years + 1)
+        if i % 3
+    }
+
+
+def legacy_grid(daily: dict, year: int) -> list:
+    """The former render_activity_heatmap loop: a timedelta and dict lookup per cell."""
+    jan1 = date(year, 1, 1)
+    rows = [[] for _ in range(7)]
+    for c in range(54):
+        for r in range(7):
+            offset = c * 7 + r - jan1.weekday()
+            day = jan1 + timedelta(days=offset)
+            if offset < 0 or day.year != year:
+                rows[r].append(-1)
+                continue
+            entry = daily.get(day.isoformat())
+            rows[r].append(entry["count"] if entry else 0)
+    return rows
+
+
+def kernel_grid(daily: dict, year: int) -> list:
+    jan1 = date(year, 1, 1)
+    counts, _ = activity_kernels.day_series(daily, jan1, date(year, 12, 31))
+    return activity_kernels.heatmap_grid(counts, jan1.weekday())
+
+
+def window_stats(daily: dict, start: date, end: date) -> list:
+    counts, seconds = activity_kernels.day_series(daily, start, end)
+    return [activity_kernels.weekday_totals(counts, start), activity_kernels.chunk_sums(seconds, 31)]
+
+
+def timed(run, *args, runs: int = 20) -> float:
+    best = None
+    for _ in range(runs):
+        started = time.perf_counter()
+        run(*args)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    years = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    daily = make_daily(years)
+    today = date.today()
+    start = today - timedelta(days=365 * years)
+
+    results = {"legacy grid": timed(legacy_grid, daily, today.year)}
+    choose = activity_kernels.use_numpy
+    for numpy_path in (False, True):
+        if numpy_path and not activity_kernels.NUMPY_AVAILABLE:
+            print("NumPy not installed: skipping the NumPy path\n")
+            break
+        if numpy_path:
+            started = time.perf_counter()
+            activity_kernels.preload()
+            print(f"NumPy import: {(time.perf_counter() - started) * 1000:.1f}ms\n")
+        activity_kernels.use_numpy = lambda size, numpy_path=numpy_path: numpy_path
+        label = "numpy" if numpy_path else "python"
+        assert kernel_grid(daily, today.year) == legacy_grid(daily, today.year)
+        results[f"{label} grid"] = timed(kernel_grid, daily, today.year)
+        results[f"{label} {years}y window"] = timed(window_stats, daily, start, today)
+
+    # What render/stat get with NumPy loaded: the faster path for each size
+    activity_kernels.use_numpy = choose
+    results["auto grid"] = timed(kernel_grid, daily, today.year)
+    results[f"auto {years}y window"] = timed(window_stats, daily, start, today)
+
+    print(f"Activity kernels benchmark - {len(daily):,} rollup days\n")
+    for label, elapsed in results.items():
+        print(f"{label:<24}{elapsed * 1000:>10.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
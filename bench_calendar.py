@@ -0,0 +1,103 @@
+"""
+Benchmark: a calendar session (moving across months and opening days),
+with the former per-month scans vs the CalendarIndex day buckets
+
+Each session pages forward through `months` months and opens one day per
+month, like render_calendar_interactive does. The former code rebuilt a
+date -> tasks map from the whole list for every month rendered and scanned
+the list again for every day opened. Rich rendering is left out: both sides
+draw the same cells.
+
+Usage:
+    python bench_calendar.py [tasks] [months]    (default: 50000 24)
+"""
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+from calendar_index import CalendarIndex
+from models import Task
+
+RECURRING = 20
+
+
+def make_rows(count: int, months: int) -> list:
+    """Task rows (raw ISO due dates, as loaded from disk) spread over the window."""
+    first = datetime.now().replace(day=1, hour=9, minute=0, second=0, microsecond=0)
+    span = months * 30
+    rows = []
+    for i in range(count):
+        due = first + timedelta(days=i % span, minutes=15 * (i % 40))
+        rows.append({"id": f"t{i}", "title": f"📅 Event {i}", "due_date": due.isoformat(),
+                     "completed": i % 10 == 0, "category": [f"Cat{i % 12}"]})
+    for i in range(RECURRING):
+        rows.append({"id": f"r{i}", "title": f"Routine {i}", "due_date": (first + timedelta(days=i)).isoformat(),
+                     "recurrent": True, "recurrence_type": ("daily", "weekly", "monthly", "weekdays")[i % 4]})
+    return rows
+
+
+def walk(months: int):
+    """(year, month, day opened) for each step of the session."""
+    today = date.today()
+    year, month = today.year, today.month
+    for step in range(months):
+        yield year, month, 1 + step % 28
+        month += 1
+        if month > 12:
+            month, year = 1, year + 1
+
+
+def legacy_session(rows: list, months: int) -> int:
+    tasks = [Task.from_dict(row) for row in rows]
+    tasks.sort(key=lambda t: t.due_date if t.due_date else datetime.max)
+    seen = 0
+    for year, month, day in walk(months):
+        tasks_by_date = {}
+        for task in tasks:
+            if task.due_date and not task.completed:
+                tasks_by_date.setdefault(task.due_date.date(), []).append(task)
+        target = date(year, month, day)
+        day_tasks = [t for t in tasks if t.due_date and t.due_date.date() == target and not t.completed]
+        seen += len(day_tasks)
+    return seen
+
+
+def indexed_session(rows: list, months: int) -> int:
+    tasks = [Task.from_dict(row) for row in rows]
+    index = CalendarIndex(tasks, [t for t in tasks if t.recurrent])
+    seen = 0
+    for year, month, day in walk(months):
+        index.month(year, month)
+        seen += sum(1 for _, preview in index.day(date(year, month, day)) if not preview)
+    return seen
+
+
+def timed(run, *args, runs: int = 3) -> float:
+    best = None
+    for _ in range(runs):
+        started = time.perf_counter()
+        run(*args)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    months = int(sys.argv[2]) if len(sys.argv) > 2 else 24
+    rows = make_rows(count, months)
+    assert legacy_session(rows, months) == indexed_session(rows, months)
+
+    results = {
+        "load only": timed(lambda: [Task.from_dict(row) for row in rows]),
+        "former scans": timed(legacy_session, rows, months),
+        "calendar index": timed(indexed_session, rows, months),
+    }
+
+    print(f"Calendar benchmark - {len(rows):,} tasks, {months} months, one day opened per month\n")
+    for label, elapsed in results.items():
+        print(f"{label:<18}{elapsed * 1000:>10.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Benchmark: rendering the dashboard line by line (markup strings, one print per
+task) vs the single-buffer renderer (styled Text, one print)
+
+Both render to a console writing to os.devnull, so only building and rendering
+the output is measured, not the terminal.
+
+Usage:
+    python bench_dashboard.py [tasks]    (default: 10000)
+"""
+import os
+import sys
+import time
+import tempfile
+from datetime import datetime, timedelta
+
+from rich.console import Console
+
+from models import Task
+from task_table import TaskTable
+import ui
+
+
+def make_tasks(count: int) -> list:
+    now = datetime.now()
+    categories = [["Work"], ["Home", "Errands"], ["Health"], None, ["Work", "Urgent"]]
+    return [
+        Task(
+            title=f"Task number {i}",
+            category=categories[i % len(categories)],
+            due_date=now + timedelta(days=i % 60 - 5) if i % 7 else None,
+            completed=i % 5 == 0,
+            priority=(i % 3) - 1,
+            time_duration=1800 if i % 4 == 0 else None,
+            recurrent=i % 11 == 0,
+            description="notes" if i % 13 == 0 else None,
+        )
+        for i in range(count)
+    ]
+
+
+def legacy_render(tasks: list):
+    """The former render_dashboard loop: a markup string and a console.print per task."""
+    table = TaskTable(tasks)
+    console = ui.console
+    group_colors = ui.get_current_theme()["header_colors"]
+    task_id = 1
+    for idx, rows in enumerate(table.dashboard_buckets()):
+        if not rows:
+            continue
+        color = group_colors[idx % len(group_colors)]
+        console.print(f"\n[bold {color}]{ui.GROUP_NAMES[idx]}[/bold {color}]")
+        for row in rows:
+            task = table.tasks[row]
+            theme = ui.get_current_theme()
+            tags = " ".join(
+                f"#[bold {ui.get_category_color(cat)}]{cat}[/bold {ui.get_category_color(cat)}]"
+                for cat in (task.category or [])
+            )
+            due_str = task.due_date.strftime('%a %b %d') if task.due_date else ""
+            style = "dim strike" if task.completed else ("red" if task.priority == 1 else ("dim" if task.priority == -1 else ""))
+            parts = [
+                f"[bold {theme['primary']}]{task_id}[/bold {theme['primary']}]",
+                "[dim][✓][/dim]" if task.completed else "[ ]",
+                f"[{style}]{due_str}[/{style}]" if due_str and style else due_str,
+                tags,
+                f"[{style}]{task.title}[/{style}]" if style else task.title,
+                task.get_duration_str(),
+                f"[{theme['secondary']}]🔁[/{theme['secondary']}]" if task.recurrent else "",
+                f"[{theme['warning']}]📝[/{theme['warning']}]" if task.description else "",
+            ]
+            console.print("  ".join(part for part in parts if part))
+            task_id += 1
+    console.print()
+
+
+def timed(render, tasks, runs: int) -> float:
+    best = None
+    for _ in range(runs):
+        started = time.perf_counter()
+        render(tasks)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    tasks = make_tasks(count)
+
+    with tempfile.TemporaryDirectory() as workdir, open(os.devnull, "w", encoding="utf-8") as null:
+        os.chdir(workdir)  # Category colors get saved to a scratch config.json
+        ui.console = Console(file=null, width=120, force_terminal=True, color_system="truecolor")
+        ui.task_palette(tasks)  # Assign colors once, outside the timings
+
+        old = timed(legacy_render, tasks, runs=3)
+        new = timed(ui.render_dashboard, tasks, runs=3)
+
+    print(f"Dashboard render benchmark - {count:,} tasks, output to os.devnull\n")
+    print(f"{'line by line (old)':<24}{old * 1000:>10.1f}ms")
+    print(f"{'single buffer (new)':<24}{new * 1000:>10.1f}ms")
+    print(f"\nSpeedup: {old / new:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark: per-command latency of the REPL, in-process vs one subprocess per command
+
+Usage:
+    python bench_repl.py [tasks] [rounds]    (default: 2000 tasks, 5 rounds)
+"""
+import io
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from datetime import datetime, timedelta
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, SCRIPT_DIR)
+
+COMMANDS = [["today"], ["tomorrow"], ["this-week"], ["this-month"], ["rc"], ["db"]]
+
+
+def seed(count: int):
+    import storage
+    from models import Task
+
+    now = datetime.now()
+    tasks = [
+        Task(
+            title=f"Task {i}",
+            category=[["Work", "Home", "Errands"][i % 3]],
+            due_date=now + timedelta(days=i % 45 - 5) if i % 5 else None,
+            priority=i % 3 - 1,
+            recurrent=i % 50 == 0,
+            recurrence_type="daily" if i % 50 == 0 else None,
+        )
+        for i in range(count)
+    ]
+    storage.save_tasks(tasks)
+
+
+def time_subprocess(args, workdir):
+    started = time.perf_counter()
+    subprocess.run([sys.executable, os.path.join(SCRIPT_DIR, "main.py")] + args,
+                   cwd=workdir, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return time.perf_counter() - started
+
+
+def time_in_process(args):
+    import repl
+    started = time.perf_counter()
+    with redirect_stdout(io.StringIO()):
+        repl.dispatch(args)
+    return time.perf_counter() - started
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        seed(count)
+
+        # Warm-up: the REPL imports the app once on start
+        started = time.perf_counter()
+        time_in_process(["today"])
+        warm_up = time.perf_counter() - started
+
+        print(f"REPL benchmark - {count:,} tasks, median of {rounds} runs\n")
+        print(f"{'command':<14}{'subprocess':>12}{'in-process':>12}{'speedup':>9}")
+        for args in COMMANDS:
+            sub = statistics.median(time_subprocess(args, workdir) for _ in range(rounds))
+            warm = statistics.median(time_in_process(args) for _ in range(rounds))
+            print(f"{' '.join(args):<14}{sub * 1000:>10.1f}ms{warm * 1000:>10.1f}ms{sub / warm:>8.1f}x")
+        print(f"\nOne-time in-process warm-up: {warm_up * 1000:.1f}ms")
+        os.chdir(SCRIPT_DIR)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark: `TDL search` over a large archive, with the former approach
+(load every archived task and scan titles) vs the search index
+
+Builds a history of `archived` completed tasks plus `active` open ones in a
+temporary directory, then times the first search (building the index), a
+search after a few more tasks were archived (only their lines are read) and
+repeated queries against the warm index.
+
+Usage:
+    python bench_search.py [archived] [active]    (default: 500000 5000)
+"""
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+WORDS = ("milk bread invoice report call email dentist budget review plan garden fence car insurance "
+         "meeting slides backup server deploy refactor groceries laundry taxes passport flight hotel").split()
+QUERIES = ("invoice", "budget review", "dent*", '"call dentist"', "passport flight hotel")
+
+
+def make_tasks(count: int, completed: bool, start: int = 0) -> list:
+    from models import Task
+    first = datetime(2020, 1, 1, 9, 0)
+    tasks = []
+    for i in range(start, start + count):
+        title = " ".join(WORDS[(i * k) % len(WORDS)] for k in (1, 7, 13)) + f" {i}"
+        when = first + timedelta(hours=i % 50_000)
+        tasks.append(Task(title=title, category=[f"Cat{i % 12}"], description=WORDS[i % 5],
+                          completed=completed, completed_at=when if completed else None))
+    return tasks
+
+
+def matches(task, query: str) -> bool:
+    text = f"{task.title} {task.description or ''}".lower()
+    return all(word.strip('"*') in text for word in query.lower().split())
+
+
+def legacy_search(query: str) -> int:
+    from history_storage import load_history
+    from storage import load_tasks
+    return sum(1 for task in load_tasks() + load_history() if matches(task, query))
+
+
+def timed(run, *args, runs: int = 1) -> float:
+    best = None
+    for _ in range(runs):
+        started = time.perf_counter()
+        run(*args)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    archived = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    active = int(sys.argv[2]) if len(sys.argv) > 2 else 5_000
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    os.chdir(tempfile.mkdtemp(prefix="tdl-bench-search-"))
+
+    import history_storage
+    import search_index
+    import storage
+
+    history_storage.add_to_history(make_tasks(archived, True))
+    storage.add_tasks(make_tasks(active, False, start=archived))
+
+    results = {
+        "former scan": timed(legacy_search, QUERIES[0]),
+        "index build": timed(search_index.search, QUERIES[0]),
+    }
+    history_storage.add_to_history(make_tasks(100, True, start=archived + active))
+    storage.add_tasks(make_tasks(10, False, start=archived + active + 100))
+    results["catch up +110"] = timed(search_index.search, QUERIES[0])
+    for query in QUERIES:
+        results[f"query {query}"] = timed(search_index.search, query, runs=20)
+
+    print(f"Search benchmark - {archived:,} archived + {active:,} active tasks\n")
+    for label, elapsed in results.items():
+        print(f"{label:<32}{elapsed * 1000:>10.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
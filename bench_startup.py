@@ -0,0 +1,76 @@
+"""
+Benchmark: cold-start import time of `TDL add` and `TDL check 1` (regression gate)
+
+Runs each command under `python -X importtime` in a scratch data directory and
+sums the cumulative time of the top-level imports. Exits with status 1 if a
+command goes over the budget or imports a module it shouldn't need.
+
+Usage:
+    python bench_startup.py [--budget MS] [--runs N]    (default: 200ms, best of 5)
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+COMMANDS = [["add", "Benchmark task"], ["add", "Dated task", "-d", "next fri 14:00"], ["check", "1"]]
+
+# Only needed by commands that prompt, render dashboards/stats or parse fuzzy dates
+HEAVY_MODULES = ["questionary", "prompt_toolkit", "dateutil.parser", "ui", "ui_stats", "deep_work",
+                 "rich.table", "rich.layout", "rich.panel", "rich.columns"]
+
+
+def import_profile(args, workdir):
+    """Return ({top-level module: cumulative us}, set of all imported modules)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", os.path.join(SCRIPT_DIR, "main.py")] + args,
+        cwd=workdir, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, encoding="utf-8"
+    )
+    if result.returncode != 0:
+        sys.exit(f"'{' '.join(args)}' exited with status {result.returncode}:\n{result.stderr.strip()}")
+    top_level, imported = {}, set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        imported.add(name.strip())
+        if name.startswith(" ") and not name.startswith("  "):
+            top_level[name.strip()] = int(cumulative)
+    return top_level, imported
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--budget", type=float, default=200.0, help="Import time budget per command (ms)")
+    parser.add_argument("--runs", type=int, default=5, help="Runs per command (best is kept)")
+    options = parser.parse_args()
+
+    failed = False
+    with tempfile.TemporaryDirectory() as workdir:
+        print(f"Startup import benchmark - budget {options.budget:.0f}ms, best of {options.runs}\n")
+        for args in COMMANDS:
+            best, slowest, heavy = None, None, set()
+            for _ in range(options.runs):
+                top_level, imported = import_profile(args, workdir)
+                total = sum(top_level.values()) / 1000
+                if best is None or total < best:
+                    best = total
+                    slowest = sorted(top_level.items(), key=lambda item: -item[1])[:3]
+                heavy |= {m for m in HEAVY_MODULES if m in imported}
+
+            over = best > options.budget
+            status = "FAIL" if over or heavy else "ok"
+            failed = failed or over or bool(heavy)
+            print(f"{' '.join(args):<34}{best:>8.1f}ms  {status}")
+            print("    slowest: " + ", ".join(f"{name} {us / 1000:.1f}ms" for name, us in slowest))
+            if heavy:
+                print(f"    unexpected imports: {', '.join(sorted(heavy))}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
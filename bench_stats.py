@@ -0,0 +1,66 @@
+"""
+Benchmark: `TDL stat` statistics as three passes over the history
+(calculate_daily_time, calculate_daily_task_count, find_longest_task) vs
+the single-pass aggregate()
+
+Tasks are built with Task.from_dict, as when read from the history segments,
+so completion dates start out as raw ISO strings.
+
+Usage:
+    python bench_stats.py [tasks]    (default: 1000000)
+"""
+import sys
+import time
+from datetime import datetime, timedelta
+
+from models import Task
+import stats_calculator
+
+
+def make_history(count: int) -> list:
+    now = datetime.now()
+    categories = [["Work"], ["Home", "Errands"], ["Health"], None]
+    return [
+        Task.from_dict({
+            "id": f"{i:08x}",
+            "title": f"Task number {i}",
+            "category": categories[i % len(categories)],
+            "completed": True,
+            "completed_at": (now - timedelta(minutes=i * 7)).isoformat(),
+            "time_duration": (i % 8) * 900 or None,
+        })
+        for i in range(count)
+    ]
+
+
+def three_passes(history: list, days: int):
+    daily_time = stats_calculator.calculate_daily_time(history, days)
+    daily_count = stats_calculator.calculate_daily_task_count(history, days)
+    return (daily_time, daily_count, stats_calculator.find_longest_task(history),
+            stats_calculator.get_date_range(days))
+
+
+def single_pass(history: list, days: int):
+    return stats_calculator.aggregate(history, days=days, by_category=True, by_weekday=True)
+
+
+def timed(run, count: int, days: int) -> float:
+    history = make_history(count)  # Fresh tasks: parsed dates would be cached on them
+    started = time.perf_counter()
+    run(history, days)
+    return time.perf_counter() - started
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    print(f"Statistics benchmark - {count:,} history tasks\n")
+    print(f"{'window':<10}{'three passes':>16}{'single pass':>16}{'speedup':>10}")
+    for days in (7, 30, 365):
+        old = timed(three_passes, count, days)
+        new = timed(single_pass, count, days)
+        print(f"{days:>4} days{old * 1000:>14.0f}ms{new * 1000:>14.0f}ms{old / new:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Benchmark: memory and load time of the slotted Task vs the former dataclass Task
+
+Usage:
+    python bench_task_model.py [rows]    (default: 100000)
+"""
+import gc
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from models import Task
+
+
+@dataclass
+class DataclassTask:
+    """Replica of the previous models.Task (dict-backed, eager date parsing)."""
+    id: str = ""
+    title: str = ""
+    category: Optional[List[str]] = None
+    due_date: Optional[datetime] = None
+    completed: bool = False
+    completed_at: Optional[datetime] = None
+    priority: int = 0
+    time_duration: Optional[int] = None
+    description: Optional[str] = None
+    recurrent: bool = False
+    recurrence_type: Optional[str] = None
+    recurrence_days: Optional[List[int]] = None
+    recurrence_interval: int = 1
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            id=data.get("id"),
+            title=data.get("title"),
+            category=data.get("category"),
+            due_date=datetime.fromisoformat(data["due_date"]) if data.get("due_date") else None,
+            completed=data.get("completed", False),
+            completed_at=datetime.fromisoformat(data["completed_at"]) if data.get("completed_at") else None,
+            priority=data.get("priority", 0),
+            time_duration=data.get("time_duration"),
+            description=data.get("description"),
+            recurrent=data.get("recurrent", False),
+            recurrence_type=data.get("recurrence_type"),
+            recurrence_days=data.get("recurrence_days"),
+            recurrence_interval=data.get("recurrence_interval", 1)
+        )
+
+
+def make_rows(count: int) -> list:
+    start = datetime(2026, 1, 1, 9, 0)
+    rows = []
+    for i in range(count):
+        done = i % 3 == 0
+        rows.append({
+            "id": f"{i:08x}",
+            "title": f"Task number {i}",
+            "category": ["Work"] if i % 2 else ["Home", "Errands"],
+            "due_date": (start + timedelta(hours=i)).isoformat(),
+            "completed": done,
+            "completed_at": (start + timedelta(hours=i, minutes=30)).isoformat() if done else None,
+            "priority": (i % 3) - 1,
+            "time_duration": 1800 if i % 4 == 0 else None,
+            "description": None,
+            "recurrent": False,
+            "recurrence_type": None,
+            "recurrence_days": None,
+            "recurrence_interval": 1
+        })
+    return rows
+
+
+def measure(cls, rows):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    started = time.perf_counter()
+    tasks = [cls.from_dict(r) for r in rows]
+    load_time = time.perf_counter() - started
+    memory = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    started = time.perf_counter()
+    titles = [t.title for t in tasks]
+    titles_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    dates = [t.due_date.date() for t in tasks]
+    dates_time = time.perf_counter() - started
+    assert len(titles) == len(dates) == len(rows)
+
+    return {
+        "load": load_time,
+        "bytes_per_task": memory / len(rows),
+        "titles": titles_time,
+        "first_date_access": dates_time,
+        "instance_size": sys.getsizeof(tasks[0]) + (sys.getsizeof(tasks[0].__dict__) if hasattr(tasks[0], "__dict__") else 0),
+    }
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rows = make_rows(count)
+
+    results = {
+        "dataclass (old)": measure(DataclassTask, rows),
+        "slotted (new)": measure(Task, rows),
+    }
+
+    print(f"Task model benchmark - {count:,} rows\n")
+    print(f"{'model':<18}{'from_dict':>12}{'bytes/task':>12}{'instance':>10}{'titles':>10}{'1st dates':>11}")
+    for name, r in results.items():
+        print(
+            f"{name:<18}{r['load'] * 1000:>10.1f}ms{r['bytes_per_task']:>12.0f}{r['instance_size']:>9}B"
+            f"{r['titles'] * 1000:>8.1f}ms{r['first_date_access'] * 1000:>9.1f}ms"
+        )
+
+    old, new = results["dataclass (old)"], results["slotted (new)"]
+    print(f"\nLoad speedup: {old['load'] / new['load']:.2f}x, "
+          f"memory per task: {new['bytes_per_task'] / old['bytes_per_task']:.0%} of before")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Day buckets behind the calendar views.
+
+A CalendarIndex is built once per calendar session. One pass over the tasks
+groups every open, dated task by month and then by due date ordinal (read
+from the raw ISO strings, see task_table.due_parts). The first time a month
+is shown its buckets are completed with the virtual occurrences of the
+recurring tasks (see recurrence.previews) and kept:
+
+    month key -> {date ordinal: [(task id, is preview), ...]}
+
+Moving to a month costs its task count once, then nothing; opening a day
+costs the tasks of that day. The caller's task list is never reordered.
+"""
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import recurrence
+from models import Task
+from task_table import NO_DUE, due_parts
+
+Bucket = List[Tuple[str, bool]]
+
+
+def month_key(year: int, month: int) -> int:
+    return year * 12 + month - 1
+
+
+def _month_bounds(key: int) -> Tuple[date, date]:
+    year, month = divmod(key, 12)
+    first = date(year, month + 1, 1)
+    following = date(year + (month + 1) // 12, (month + 1) % 12 + 1, 1)
+    return first, date.fromordinal(following.toordinal() - 1)
+
+
+def _due_order(task: Task) -> Tuple[int, int]:
+    ordinal, seconds = due_parts(task)
+    return (ordinal, seconds) if ordinal else (NO_DUE, 0)
+
+
+class CalendarIndex:
+    """Open tasks (and recurring previews) bucketed by month and day."""
+
+    def __init__(self, tasks: Iterable[Task], recurring: Optional[Iterable[Task]] = None):
+        self.tasks: Dict[str, Task] = {}
+        self._order: List[Task] = []
+        self._recurring = [t for t in recurring or () if t.recurrent and not t.completed]
+        self._months: Dict[int, Dict[int, Bucket]] = {}
+        self._local_ids: Optional[Dict[str, int]] = None
+
+        # month key -> [(ordinal, seconds into the day, load position, id, is preview)]
+        self._dated: Dict[int, List[Tuple[int, int, int, str, bool]]] = {}
+        keys: Dict[int, int] = {}  # ordinal -> month key (few distinct days)
+        for position, task in enumerate(tasks):
+            self.tasks[task.id] = task
+            self._order.append(task)
+            if task.completed:
+                continue
+            ordinal, seconds = due_parts(task)
+            if not ordinal:
+                continue
+            key = keys.get(ordinal)
+            if key is None:
+                day = date.fromordinal(ordinal)
+                key = keys[ordinal] = month_key(day.year, day.month)
+            self._dated.setdefault(key, []).append((ordinal, seconds, position, task.id, False))
+
+        for task in self._recurring:
+            self.tasks.setdefault(task.id, task)
+
+    def month(self, year: int, month: int) -> Dict[int, Bucket]:
+        """Buckets of one month: date ordinal -> [(task id, is preview)], by time of day."""
+        key = month_key(year, month)
+        buckets = self._months.get(key)
+        if buckets is not None:
+            return buckets
+
+        rows = list(self._dated.get(key, ()))
+        listed = {row[3] for row in rows}
+        first, last = _month_bounds(key)
+        for when, task in recurrence.previews(self._recurring, first, last):
+            if task.id in listed and when == task.due_date:
+                continue  # The real instance is listed already
+            rows.append((when.toordinal(), when.hour * 3600 + when.minute * 60 + when.second, len(self._order), task.id, True))
+        rows.sort()
+
+        buckets = {}
+        for row in rows:
+            buckets.setdefault(row[0], []).append((row[3], row[4]))
+        self._months[key] = buckets
+        return buckets
+
+    def day(self, day: date) -> List[Tuple[Task, bool]]:
+        """(task, is preview) pairs due on a day."""
+        bucket = self.month(day.year, day.month).get(day.toordinal(), ())
+        return [(self.tasks[task_id], preview) for task_id, preview in bucket]
+
+    def local_id(self, task_id: str) -> int:
+        """1-based position of a task in due date order (for lists without global IDs)."""
+        if self._local_ids is None:
+            ranked = sorted(range(len(self._order)), key=lambda row: _due_order(self._order[row]))
+            self._local_ids = {self._order[row].id: rank for rank, row in enumerate(ranked, 1)}
+        return self._local_ids.get(task_id, 0)
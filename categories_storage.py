@@ -1,19 +1,11 @@
-import json
-import os
 from typing import List
+import atomic_io
 
 CATEGORIES_FILE = "categories.json"
 
 def load_categories() -> List[str]:
-    if not os.path.exists(CATEGORIES_FILE):
-        return []
-    try:
-        with open(CATEGORIES_FILE, "r") as f:
-            data = json.load(f)
-            return data if isinstance(data, list) else []
-    except (json.JSONDecodeError, IOError):
-        return []
+    data = atomic_io.read_json(CATEGORIES_FILE, [])
+    return data if isinstance(data, list) else []
 
 def save_categories(categories: List[str]):
-    with open(CATEGORIES_FILE, "w") as f:
-        json.dump(categories, f, indent=4)
+    atomic_io.write_json(CATEGORIES_FILE, categories, indent=4)
@@ -0,0 +1,86 @@
+"""
+Command-line argument helpers shared by main.py, the REPL and the daemon client.
+
+Only uses the standard library, so the thin daemon client can import it
+without paying for typer/rich.
+"""
+from typing import List
+
+# Commands that never prompt or clear the screen, so they can run inside the daemon
+DAEMON_COMMANDS = {
+    "today", "tomorrow", "this-week", "this-month", "dashboard", "db", "rc",
+    "categories", "cat", "hist", "info", "goal", "goaladd", "goalcheck", "stat", "storage",
+    "streak", "search",
+}
+
+
+def normalize_argv(args: List[str]) -> List[str]:
+    """Expand CLI shortcuts (e.g. '1 -c 2' -> 'update 1 -c 2', 'cat add' -> 'addcat')."""
+    args = list(args)
+    if not args:
+        return args
+    
+    # Handle shortcut: if first arg is a digit or #ID, insert 'update' command
+    if args[0].isdigit() or args[0].startswith("#"):
+        args.insert(0, "update")
+        
+    # Handle 'add cat' shortcut
+    elif len(args) >= 2 and args[0] == "add" and args[1] == "cat":
+        args[0] = "addcat"
+        args.pop(1)
+    
+    # Handle 'cat add' shortcut (alternative syntax)
+    elif len(args) >= 2 and args[0] == "cat" and args[1] == "add":
+        args[0] = "addcat"
+        args.pop(1)
+        
+    # Handle 'goal' shortcuts
+    elif args[0] == "goal":
+        # TDL goal add ...
+        if len(args) >= 2:
+            sub = args[1]
+            if sub == "add":
+                args[0] = "goaladd"
+                args.pop(1)
+            elif sub == "check":
+                args[0] = "goalcheck"
+                args.pop(1)
+            elif sub == "del":
+                args[0] = "goaldel"
+                args.pop(1)
+    
+    # Handle 'rc del' shortcut
+    elif len(args) >= 2 and args[0] == "rc" and args[1] == "del":
+        args[0] = "rcdel"
+        args.pop(1)
+    
+    # Handle 'template del' shortcut
+    elif len(args) >= 2 and args[0] == "template" and args[1] == "del":
+        args[0] = "templatedel"
+        args.pop(1)
+        
+    # Handle '?' shortcut for intro
+    elif args[0] == "?":
+        args[0] = "intro"
+    
+    return args
+
+
+def can_run_in_daemon(args: List[str]) -> bool:
+    """Whether a (normalized) command can be served by the daemon without a terminal."""
+    if not args:
+        return False
+    command = args[0]
+    if command in ("dashboard", "db"):
+        # The interactive pager reads keys from the terminal
+        return "-i" not in args and "--interactive" not in args
+    if command in DAEMON_COMMANDS:
+        return True
+    if command == "add":
+        # Without a title (or with -r) add asks questions, and so can a recurring *template
+        return (len(args) > 1 and not args[1].startswith(("-", "*"))
+                and "-r" not in args and "--rc" not in args)
+    if command == "check":
+        # Without IDs check opens a checklist
+        return len(args) > 1 and not args[1].startswith("-")
+    return False
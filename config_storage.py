@@ -1,5 +1,16 @@
-import json
+"""
+App settings stored in config.json.
+
+config.json is parsed once per process and kept in memory; every access
+checks the file's size and mtime and re-reads it only when they changed
+(e.g. edited by another process). `read_count()` tells how many times the
+file was actually parsed, so hot paths can be checked for repeated reads.
+"""
+import copy
 import os
+from typing import Dict, Optional, Tuple
+
+import atomic_io
 
 CONFIG_FILE = "config.json"
 
@@ -8,53 +19,119 @@ DEFAULT_CONFIG = {
     "show_streak": True,
     "show_heatmap": True,
     "simplicity": False,
-    "category_colors": {}
+    "category_colors": {},
+    "storage_backend": "json",
+    # Completed tasks leave tasks.json for the history once completed more than
+    # this many days ago, or beyond this many completed tasks (0 = no limit;
+    # both 0 by default: auto-archive is opt-in, from Settings)
+    "auto_archive_days": 0,
+    "auto_archive_keep": 0
 }
 
-def load_config():
-    if not os.path.exists(CONFIG_FILE):
-        return DEFAULT_CONFIG
+# Parsed config, the (path, size, mtime) it was read at, and the number of parses
+_config: Optional[Dict] = None
+_config_stamp: Optional[Tuple] = None
+_reads = 0
+
+
+def _stamp() -> Tuple:
+    path = os.path.abspath(CONFIG_FILE)
     try:
-        with open(CONFIG_FILE, "r") as f:
-            config = json.load(f)
-            # Ensure default values for missing keys
-            for key, value in DEFAULT_CONFIG.items():
-                if key not in config:
-                    config[key] = value
-            return config
-    except (json.JSONDecodeError, IOError):
-        return DEFAULT_CONFIG
+        stat = os.stat(path)
+    except OSError:
+        return path, None, None
+    return path, stat.st_size, stat.st_mtime_ns
+
+
+def _read() -> Dict:
+    global _reads
+    _reads += 1
+    config = atomic_io.read_json(CONFIG_FILE, None)
+    if not isinstance(config, dict):
+        return copy.deepcopy(DEFAULT_CONFIG)
+    # Ensure default values for missing keys
+    for key, value in DEFAULT_CONFIG.items():
+        if key not in config:
+            config[key] = copy.deepcopy(value)
+    return config
+
+
+def _current() -> Dict:
+    """The cached config, re-read if config.json changed (shared: don't mutate)."""
+    global _config, _config_stamp
+    if atomic_io.pending(CONFIG_FILE):
+        # Written in an uncommitted deferred_writes() block: not on disk yet
+        return _read()
+    stamp = _stamp()
+    if _config is None or stamp != _config_stamp:
+        _config = _read()
+        _config_stamp = stamp
+    return _config
+
+
+def read_count() -> int:
+    """How many times config.json has been parsed in this process."""
+    return _reads
+
+
+def load_config() -> Dict:
+    """A copy of the whole config (safe to modify and pass to save_config)."""
+    return copy.deepcopy(_current())
+
 
 def save_config(config):
+    global _config, _config_stamp
     try:
-        with open(CONFIG_FILE, "w") as f:
-            json.dump(config, f, indent=4)
+        atomic_io.write_json(CONFIG_FILE, config, indent=4)
     except IOError:
-        pass
+        return
+    _config = None
+    _config_stamp = None
 
-def get_theme():
-    config = load_config()
-    return config.get("theme", "rainbow")
 
-def get_show_streak():
-    config = load_config()
-    return config.get("show_streak", True)
+def get_theme() -> str:
+    return _current().get("theme", "rainbow")
 
-def get_show_heatmap():
-    config = load_config()
-    return config.get("show_heatmap", True)
 
-def get_simplicity():
-    config = load_config()
-    return config.get("simplicity", False)
+def get_show_streak() -> bool:
+    return _current().get("show_streak", True)
+
+
+def get_show_heatmap() -> bool:
+    return _current().get("show_heatmap", True)
+
+
+def get_simplicity() -> bool:
+    return _current().get("simplicity", False)
+
+
+def get_storage_backend() -> str:
+    return _current().get("storage_backend", "json")
+
+
+def get_auto_archive_policy() -> Tuple[int, int]:
+    """(days, keep) of the auto-archive policy, 0 disabling either limit."""
+    config = _current()
+    try:
+        return max(0, int(config.get("auto_archive_days") or 0)), max(0, int(config.get("auto_archive_keep") or 0))
+    except (TypeError, ValueError):
+        return 0, 0
+
+
+def get_category_colors() -> Dict[str, str]:
+    return dict(_current().get("category_colors", {}))
 
-def get_category_colors():
-    config = load_config()
-    return config.get("category_colors", {})
 
 def update_category_color(category: str, color: str):
+    update_category_colors({category: color})
+
+
+def update_category_colors(colors: Dict[str, str]):
+    """Set the colors of several categories with a single write."""
+    if not colors:
+        return
     config = load_config()
     if "category_colors" not in config:
         config["category_colors"] = {}
-    config["category_colors"][category] = color
+    config["category_colors"].update(colors)
     save_config(config)
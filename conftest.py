@@ -0,0 +1,52 @@
+"""
+Shared test fixtures.
+
+The storage modules keep per-process caches (task snapshot, SQLite and search
+connections, display index, parsed config, streak calendar, task table) so
+hot paths don't re-read files. Tests that touch data files run in a fresh
+directory through `data_dir`, which resets all of them before and after.
+"""
+import pytest
+
+import config_storage
+import display_index
+import search_index
+import sqlite_storage
+import storage
+import streak_storage
+import task_table
+
+
+def reset_caches():
+    """Forget everything the storage modules cached about the data directory."""
+    sqlite_storage.close()
+    search_index.close()
+    search_index._pending = None
+    storage._snapshot = None
+    storage._snapshot_version = None
+    display_index._index = None
+    display_index._index_path = None
+    display_index._pending = None
+    config_storage._config = None
+    config_storage._config_stamp = None
+    streak_storage._calendar = None
+    streak_storage._calendar_stamp = None
+    task_table._table = None
+    task_table._table_version = None
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """An empty working directory, with no cached state from other tests."""
+    monkeypatch.chdir(tmp_path)
+    reset_caches()
+    yield tmp_path
+    reset_caches()
+
+
+@pytest.fixture(params=storage.BACKENDS)
+def store(request, data_dir):
+    """A data directory using each task storage backend in turn; yields its name."""
+    if request.param != storage.DEFAULT_BACKEND:
+        storage.migrate_tasks(request.param)
+    yield request.param
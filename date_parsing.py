@@ -0,0 +1,110 @@
+"""
+Due date parsing for add, update, event and templates (-d).
+
+Common forms are matched by one compiled pattern without importing dateutil:
+
+    today | tomorrow | 2026-03-14 | fri | friday | next fri | +2d | +3w
+    14:00 | 9am | 2:30pm            (alone = today at that time)
+    <day> <time>                     e.g. "tomorrow 3pm", "next fri 14:00"
+
+"fri" is the next Friday on or after today (like dateutil), "next fri" the
+first one after today. "today", "tomorrow" and "+N" without a time keep the
+current time of day; weekdays and dates without a time are at midnight.
+Anything else falls back to dateutil's fuzzy parser.
+
+Results are memoized per (input, current date) in an LRU cache, so bulk
+imports and templates don't parse the same strings again.
+"""
+import re
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from typing import Optional, Tuple
+
+WEEKDAYS = {
+    "mon": 0, "monday": 0, "tue": 1, "tues": 1, "tuesday": 1, "wed": 2, "wednesday": 2,
+    "thu": 3, "thur": 3, "thurs": 3, "thursday": 3, "fri": 4, "friday": 4,
+    "sat": 5, "saturday": 5, "sun": 6, "sunday": 6,
+}
+
+_FAST = re.compile(
+    r"(?:(?P<keyword>today|tomorrow)"
+    r"|(?P<iso>\d{4}-\d{2}-\d{2})"
+    r"|(?P<next>next\s+)?(?P<weekday>" + "|".join(sorted(WEEKDAYS, key=len, reverse=True)) + r")"
+    r"|\+(?P<count>\d+)(?P<unit>[dw]))?"
+    r"(?:(?:^|\s+|t)(?P<hour>\d{1,2})(?::(?P<minute>\d{2})(?::(?P<second>\d{2}))?)?\s*(?P<ampm>am|pm)?)?"
+)
+
+CACHE_SIZE = 1024
+
+
+def _match_fast(text: str, today: date) -> Optional[Tuple[date, Optional[time]]]:
+    match = _FAST.fullmatch(text)
+    if not match or not any(match.group(g) for g in ("keyword", "iso", "weekday", "count", "hour")):
+        return None
+    groups = match.groupdict()
+    keeps_time = False
+
+    if groups["keyword"]:
+        day = today + timedelta(days=1 if groups["keyword"] == "tomorrow" else 0)
+        keeps_time = True
+    elif groups["iso"]:
+        try:
+            day = date.fromisoformat(groups["iso"])
+        except ValueError:
+            return None
+    elif groups["weekday"]:
+        ahead = (WEEKDAYS[groups["weekday"]] - today.weekday()) % 7
+        if groups["next"] and not ahead:
+            ahead = 7
+        day = today + timedelta(days=ahead)
+    elif groups["count"]:
+        amount = int(groups["count"]) * (7 if groups["unit"] == "w" else 1)
+        day = today + timedelta(days=amount)
+        keeps_time = True
+    else:
+        day = today
+
+    if groups["hour"] is None:
+        return day, None if keeps_time else time()
+    if groups["minute"] is None and not groups["ampm"]:
+        return None  # A bare number is not a time ("2026", "15")
+    hour = int(groups["hour"])
+    if groups["ampm"]:
+        if not 1 <= hour <= 12:
+            return None
+        hour = hour % 12 + (12 if groups["ampm"] == "pm" else 0)
+    try:
+        return day, time(hour, int(groups["minute"] or 0), int(groups["second"] or 0))
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _resolve(text: str, today: date) -> Tuple[date, Optional[time]]:
+    """(day, time of day or None for "now") for a normalized input on a given date."""
+    found = _match_fast(text, today)
+    if found:
+        return found
+    from dateutil import parser as date_parser
+    try:
+        parsed = date_parser.parse(text, fuzzy=True, default=datetime.combine(today, time()))
+    except (ValueError, OverflowError) as e:
+        raise ValueError(f"Could not parse date: {text}") from e
+    return parsed.date(), parsed.time()
+
+
+def parse_due(text: str, now: Optional[datetime] = None) -> datetime:
+    """
+    Parse a due date.
+
+    Raises:
+        ValueError: The text isn't a date
+    """
+    now = now or datetime.now()
+    day, at = _resolve(" ".join(text.lower().split()), now.date())
+    return datetime.combine(day, at if at is not None else now.time())
+
+
+def cache_info():
+    """Hit/miss statistics of the parse cache."""
+    return _resolve.cache_info()
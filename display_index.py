@@ -0,0 +1,335 @@
+"""
+Persistent index of dashboard display IDs ("3" for tasks, "#2" for events).
+
+The index holds the dashboard order as sorted entries
+
+    [bucket, category, -priority, due_key, title, seq, task_id]
+
+split into "tasks" and "events", plus the data version (storage.data_version())
+and the calendar day it was built for.
+
+storage.py reports every add/update/delete with record_changes(), which only
+appends the changed rows to a small change log (display_index.log) instead of
+rewriting the index, so writes stay cheap however many tasks there are. Each
+log line carries the data versions before and after its write; whoever next
+needs display IDs loads the index, replays the lines that chain on from its
+version and folds them in once the log grows. A full rebuild only happens when
+the day rolls over (buckets are relative to today) or the task files were
+changed behind its back.
+"""
+import json
+import os
+from bisect import bisect_left, insort
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from models import Task
+from task_table import due_parts
+import atomic_io
+
+INDEX_FILE = "display_index.json"
+LOG_FILE = "display_index.log"
+
+# Fold the change log into the index once it reaches this size
+COMPACT_THRESHOLD_BYTES = 64 * 1024
+
+# Past this size nobody is reading the log: drop it and rebuild on next use
+MAX_LOG_BYTES = 1024 * 1024
+
+EVENT_PREFIX = "📅"
+
+# Row fields the index entries are built from (logged for upserts)
+ENTRY_FIELDS = ("id", "title", "category", "priority", "due_date")
+
+# Sort key for tasks without a due date (after every real date)
+NO_DUE = 2 ** 62
+
+# Dashboard buckets, in display order
+UNDATED, TODAY, TOMORROW, THIS_WEEK, THIS_MONTH, FUTURE = range(6)
+
+# Current index (and the file it belongs to); its "version" is None while its
+# changes are waiting in a deferred_writes() block
+_index = None
+_index_path = None
+
+# Changes recorded in the current deferred_writes() block, logged on commit:
+# {"from": version before the block, "ops": [["u", row] | ["d", task_id], ...]}
+_pending = None
+
+
+def _bucket(ordinal: int, today: date) -> int:
+    if not ordinal:
+        return UNDATED
+    days = ordinal - today.toordinal()
+    if days == 0:
+        return TODAY
+    if days == 1:
+        return TOMORROW
+    if days <= 7:
+        return THIS_WEEK  # includes overdue tasks
+    if days <= 30:
+        return THIS_MONTH
+    return FUTURE
+
+
+def _entry(task: Task, seq: int, today: date) -> list:
+    """Sort entry matching the dashboard order (category, priority, due date, title)."""
+    category = task.category
+    if isinstance(category, list):
+        category = category[0] if category else ""
+    ordinal, seconds = due_parts(task)
+    due_key = ordinal * 86400 + seconds if ordinal else NO_DUE
+    return [_bucket(ordinal, today), (category or "").lower(), -(task.priority or 0), due_key,
+            (task.title or "").lower(), seq, task.id]
+
+
+def _section(task: Task) -> str:
+    return "events" if (task.title or "").startswith(EVENT_PREFIX) else "tasks"
+
+
+def build(tasks: Iterable[Task], today: Optional[date] = None) -> Dict:
+    """Build a fresh index from tasks in load order."""
+    today = today or datetime.now().date()
+    index = {"version": None, "day": today.isoformat(), "next_seq": 0, "tasks": [], "events": []}
+    for seq, task in enumerate(tasks):
+        index[_section(task)].append(_entry(task, seq, today))
+        index["next_seq"] = seq + 1
+    index["tasks"].sort()
+    index["events"].sort()
+    return index
+
+
+def _is_current(index: Optional[Dict], version: str) -> bool:
+    return (
+        isinstance(index, dict)
+        and index.get("day") == datetime.now().date().isoformat()
+        and index.get("version") == version
+        and isinstance(index.get("tasks"), list)
+        and isinstance(index.get("events"), list)
+    )
+
+
+def _read_log() -> List[Dict]:
+    """Logged change records, skipping a torn last line."""
+    text = atomic_io.read_text(LOG_FILE)
+    records = []
+    for line in (text or "").splitlines():
+        try:
+            records.append(json.loads(line))
+        except json.JSONDecodeError:
+            continue
+    return records
+
+
+def _load() -> Optional[Dict]:
+    """Read the index file and replay the change log records that chain onto it."""
+    index = atomic_io.read_json(INDEX_FILE, None)
+    if not isinstance(index, dict) or not isinstance(index.get("tasks"), list):
+        return None
+    ops = []
+    for record in _read_log():
+        if record.get("from") == index.get("version"):
+            ops.extend(record.get("ops", []))
+            index["version"] = record.get("to")
+    if ops:
+        _apply(index, ops)
+    if ops and atomic_io.getsize(LOG_FILE) >= COMPACT_THRESHOLD_BYTES and _is_current(index, _data_version()):
+        _write(index)
+    return index
+
+
+def _data_version() -> str:
+    from storage import data_version
+    return data_version()
+
+
+def current() -> Optional[Dict]:
+    """The index if it still matches the task data and today's date, else None."""
+    global _index, _index_path
+    path = os.path.abspath(INDEX_FILE)
+    if _index is not None and _index_path == path:
+        if _index.get("version") is None and atomic_io.deferring():
+            return _index
+        if _is_current(_index, _data_version()):
+            return _index
+
+    index = _load()
+    _index = index if _is_current(index, _data_version()) else None
+    _index_path = path
+    return _index
+
+
+def _write(index: Dict):
+    """Persist a complete index and drop the change log it supersedes."""
+    atomic_io.write_json(INDEX_FILE, index, indent=None)
+    atomic_io.remove(LOG_FILE)
+
+
+def _commit_build():
+    """Stamp a freshly built index with the data version on disk and persist it."""
+    if _index is None:
+        return
+    _index["version"] = _data_version()
+    _write(_index)
+
+
+def get_index(tasks: Optional[List[Task]] = None) -> Dict:
+    """
+    Return the current index, rebuilding it if needed.
+
+    Args:
+        tasks: All tasks in load order, if the caller already has them (saves a reload)
+    """
+    global _index, _index_path
+    index = current()
+    if index is None:
+        if tasks is None:
+            from storage import load_tasks
+            tasks = load_tasks()
+        index = build(tasks)
+        _index = index
+        _index_path = os.path.abspath(INDEX_FILE)
+        atomic_io.after_commit(_commit_build)
+    return index
+
+
+def _apply(index: Dict, ops: Iterable[list]):
+    """
+    Apply logged changes to an index.
+
+    Changed tasks keep their load position (seq); new ones are appended.
+    """
+    today = date.fromisoformat(index["day"])
+    entries = {entry[-1]: (section, entry) for section in ("tasks", "events") for entry in index[section]}
+
+    def remove(task_id):
+        section, entry = entries.pop(task_id, (None, None))
+        if entry is None:
+            return None
+        ordered = index[section]
+        del ordered[bisect_left(ordered, entry)]
+        return entry[5]
+
+    for kind, value in ops:
+        if kind == "d":
+            remove(value)
+            continue
+        task = Task.from_dict(value)
+        seq = remove(task.id)
+        if seq is None:
+            seq = index["next_seq"]
+            index["next_seq"] = seq + 1
+        entry = _entry(task, seq, today)
+        section = _section(task)
+        insort(index[section], entry)
+        entries[task.id] = (section, entry)
+
+
+def record_changes(version: str, upserts: Iterable[Dict] = (), deletes: Iterable[str] = ()):
+    """
+    Report a storage write so the index can follow it.
+
+    Args:
+        version: storage.data_version() from just before the write
+        upserts: Added or changed rows (Task.to_dict() format)
+        deletes: Ids of removed tasks
+
+    The change is appended to the log once the write is committed; the index
+    file itself is not read or rewritten. An index already loaded in this
+    process is updated in place.
+    """
+    global _pending, _index
+    ops = [["d", task_id] for task_id in deletes]
+    ops += [["u", {field: row.get(field) for field in ENTRY_FIELDS}] for row in upserts]
+    if not ops:
+        return
+
+    if _pending is None:
+        _pending = {"from": version, "ops": []}
+    _pending["ops"].extend(ops)
+
+    if _index is not None and _index_path == os.path.abspath(INDEX_FILE):
+        pending_in_block = _index.get("version") is None and atomic_io.deferring()
+        if pending_in_block or _index.get("version") == version:
+            _apply(_index, ops)
+            _index["version"] = None
+        else:
+            _index = None
+
+    atomic_io.on_rollback(_discard_pending)
+    atomic_io.after_commit(_log_pending)
+
+
+def _discard_pending():
+    global _pending, _index
+    _pending = None
+    if _index is not None and _index.get("version") is None:
+        _index = None
+
+
+def _log_pending():
+    """Append the committed changes to the log, chained to the versions around them."""
+    global _pending
+    record, _pending = _pending, None
+    if record is None:
+        return
+    record["to"] = _data_version()
+    if _index is not None and _index.get("version") is None:
+        _index["version"] = record["to"]
+
+    if not os.path.exists(INDEX_FILE):
+        return  # Nothing to keep up to date; built on next use
+    if atomic_io.getsize(LOG_FILE) >= MAX_LOG_BYTES:
+        invalidate()
+        return
+    atomic_io.append_text(LOG_FILE, json.dumps(record, separators=(",", ":")) + "\n")
+
+
+def invalidate():
+    """Drop the index (e.g. after the task files were rewritten wholesale)."""
+    global _index, _pending
+    _index = None
+    _pending = None
+    atomic_io.remove(INDEX_FILE)
+    atomic_io.remove(LOG_FILE)
+
+
+# --- Lookups ---
+
+def resolve(identifier: str, tasks: Optional[List[Task]] = None) -> Optional[str]:
+    """Task id for a display ID like "3" or "#2", or None if out of range."""
+    identifier = identifier.strip()
+    section = "events" if identifier.startswith("#") else "tasks"
+    number = identifier[1:] if section == "events" else identifier
+    if not number.isdigit():
+        return None
+    ordered = get_index(tasks)[section]
+    position = int(number)
+    if not 1 <= position <= len(ordered):
+        return None
+    return ordered[position - 1][-1]
+
+
+def count(section: str = "tasks", tasks: Optional[List[Task]] = None) -> int:
+    """Number of display IDs in a section ("tasks" or "events")."""
+    return len(get_index(tasks)[section])
+
+
+def bucket_ranges(entries: List[list]) -> List[Tuple[int, int]]:
+    """
+    [start, end) positions of each dashboard bucket (UNDATED .. FUTURE) in a
+    section's sorted entries, found by bisection.
+    """
+    bounds = [bisect_left(entries, [bucket]) for bucket in range(FUTURE + 2)]
+    return list(zip(bounds, bounds[1:]))
+
+
+def id_map(tasks: Optional[List[Task]] = None) -> Dict[str, object]:
+    """Mapping of task id -> display ID (int for tasks, "#N" for events)."""
+    index = get_index(tasks)
+    mapping = {}
+    for position, entry in enumerate(index["tasks"], 1):
+        mapping[entry[-1]] = position
+    for position, entry in enumerate(index["events"], 1):
+        mapping[entry[-1]] = f"#{position}"
+    return mapping
@@ -1,26 +1,228 @@
+"""
+Archived task history, partitioned into one segment file per month.
+
+Layout:
+    history/manifest.json   -> {"segments": {"2026-01": {"count": 12, "longest_duration": 3600}, ...},
+                                "legacy_migrated": true}
+    history/2026-01.jsonl   -> one Task.to_dict() record per line
+    history/rollup.json     -> per-day totals for statistics (see rollup_storage)
+
+Tasks are filed by the month of completed_at (falling back to due_date, or the
+"undated" segment). Appends only touch the segments of the archived tasks plus
+the small manifest, and date-ranged reads only open the months they cover.
+A legacy history.json is folded into segments on first access.
+"""
 import json
 import os
-from typing import List
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple
 from models import Task
+import atomic_io
+import rollup_storage
 
-HISTORY_FILE = "history.json"
+HISTORY_FILE = "history.json"  # Legacy single-file history (migrated on first access)
+HISTORY_DIR = "history"
+MANIFEST_NAME = "manifest.json"
+UNDATED_SEGMENT = "undated"
 
-def load_history() -> List[Task]:
-    if not os.path.exists(HISTORY_FILE):
-        return []
-    try:
-        with open(HISTORY_FILE, "r") as f:
-            data = json.load(f)
-            return [Task.from_dict(item) for item in data]
-    except (json.JSONDecodeError, IOError):
+
+def _manifest_path() -> str:
+    return os.path.join(HISTORY_DIR, MANIFEST_NAME)
+
+
+def _segment_path(key: str) -> str:
+    return os.path.join(HISTORY_DIR, f"{key}.jsonl")
+
+
+def segment_key(task: Task) -> str:
+    """Month segment ("YYYY-MM") a task is archived under."""
+    when = task.completed_at or task.due_date
+    if not when:
+        return UNDATED_SEGMENT
+    return f"{when.year:04d}-{when.month:02d}"
+
+
+def load_manifest() -> Dict:
+    _migrate_legacy_history()
+    return _read_manifest()
+
+
+def _read_manifest() -> Dict:
+    manifest = atomic_io.read_json(_manifest_path(), None)
+    if not isinstance(manifest, dict) or not isinstance(manifest.get("segments"), dict):
+        return {"segments": {}}
+    return manifest
+
+
+def list_segments() -> List[str]:
+    """Segment keys in chronological order (undated last)."""
+    segments = load_manifest()["segments"]
+    dated = sorted(k for k in segments if k != UNDATED_SEGMENT)
+    if UNDATED_SEGMENT in segments:
+        dated.append(UNDATED_SEGMENT)
+    return dated
+
+
+def load_segment(key: str) -> List[Task]:
+    """Load the tasks archived in one segment, skipping a torn last line."""
+    text = atomic_io.read_text(_segment_path(key))
+    if not text:
         return []
+    tasks = []
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            tasks.append(Task.from_dict(json.loads(line)))
+        except (json.JSONDecodeError, ValueError, TypeError):
+            continue
+    return tasks
+
+
+def tail_segment(key: str, offset: int = 0) -> Tuple[List[Tuple[int, Dict]], int]:
+    """
+    Records appended to a segment from byte `offset` on, as (byte offset,
+    Task.to_dict() record) pairs, and the offset they end at. A torn last
+    line is left for a later call.
+    """
+    path = _segment_path(key)
+    if not atomic_io.exists(path):
+        return [], offset
+    with open(path, "rb") as f:
+        f.seek(offset)
+        data = f.read()
+    records = []
+    position = 0
+    while True:
+        end = data.find(b"\n", position)
+        if end < 0:
+            break
+        line = data[position:end].strip()
+        if line:
+            try:
+                records.append((offset + position, json.loads(line)))
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                pass
+        position = end + 1
+    return records, offset + position
+
+
+def segments_in_range(start: Optional[date] = None, end: Optional[date] = None) -> List[str]:
+    """Keys of the month segments overlapping [start, end] (inclusive)."""
+    if start is None and end is None:
+        return list_segments()
+    low = f"{start.year:04d}-{start.month:02d}" if start else "0000-00"
+    high = f"{end.year:04d}-{end.month:02d}" if end else "9999-99"
+    return [k for k in list_segments() if k != UNDATED_SEGMENT and low <= k <= high]
+
+
+def load_history(start: Optional[date] = None, end: Optional[date] = None) -> List[Task]:
+    """
+    Load archived tasks.
+
+    Args:
+        start: Only read segments from this date's month onwards
+        end: Only read segments up to this date's month
+
+    With no bounds the whole history is loaded.
+    """
+    tasks = []
+    for key in segments_in_range(start, end):
+        tasks.extend(load_segment(key))
+    return tasks
+
+
+def _longest_duration(tasks: Iterable[Task]) -> int:
+    return max((t.time_duration for t in tasks if t.completed and t.time_duration), default=0)
+
+
+def _append(tasks: List[Task], manifest: Dict):
+    """Append tasks to their month segments and record them in the manifest and rollup."""
+    previous_count = _count(manifest)
+    by_segment: Dict[str, List[Task]] = {}
+    for task in tasks:
+        by_segment.setdefault(segment_key(task), []).append(task)
+
+    os.makedirs(HISTORY_DIR, exist_ok=True)
+    for key, segment_tasks in by_segment.items():
+        lines = "".join(json.dumps(t.to_dict()) + "\n" for t in segment_tasks)
+        atomic_io.append_text(_segment_path(key), lines)
+
+        info = manifest["segments"].setdefault(key, {"count": 0, "longest_duration": 0})
+        info["count"] = info.get("count", 0) + len(segment_tasks)
+        info["longest_duration"] = max(info.get("longest_duration", 0), _longest_duration(segment_tasks))
+
+    atomic_io.write_json(_manifest_path(), manifest, indent=4)
+    rollup_storage.record(tasks, previous_count)
+
+
+def _count(manifest: Dict) -> int:
+    return sum(info.get("count", 0) for info in manifest["segments"].values())
+
+
+def _migrate_legacy_history():
+    """
+    Fold a legacy history.json into month segments, then set it aside.
+
+    The segments and manifest are committed together, and the manifest records
+    that the migration happened, so the file is only renamed once its tasks are
+    in the store and an interrupted migration is never applied twice. Inside a
+    deferred_writes() block the rename waits for the block's commit.
+    """
+    if not os.path.exists(HISTORY_FILE):
+        return
+    with atomic_io.deferred_writes():
+        manifest = _read_manifest()
+        if not manifest.get("legacy_migrated"):
+            data = atomic_io.read_json(HISTORY_FILE, [])
+            manifest["legacy_migrated"] = True
+            if data:
+                _append([Task.from_dict(item) for item in data], manifest)
+            else:
+                os.makedirs(HISTORY_DIR, exist_ok=True)
+                atomic_io.write_json(_manifest_path(), manifest, indent=4)
+        atomic_io.after_commit(_set_aside_legacy_history)
+
+
+def _set_aside_legacy_history():
+    if os.path.exists(HISTORY_FILE):
+        os.replace(HISTORY_FILE, HISTORY_FILE + ".bak")
+
 
 def save_history(tasks: List[Task]):
-    with open(HISTORY_FILE, "w") as f:
-        json.dump([t.to_dict() for t in tasks], f, indent=4)
+    """Replace the whole history (e.g. when resetting all data)."""
+    _migrate_legacy_history()
+    old_manifest = _read_manifest()
+    for key in old_manifest["segments"]:
+        atomic_io.remove(_segment_path(key))
+    manifest = {"segments": {}}
+    if old_manifest.get("legacy_migrated"):
+        manifest["legacy_migrated"] = True
+    rollup_storage.reset()
+    if tasks:
+        _append(tasks, manifest)
+    else:
+        os.makedirs(HISTORY_DIR, exist_ok=True)
+        atomic_io.write_json(_manifest_path(), manifest, indent=4)
+
 
 def add_to_history(tasks: List[Task]):
     """Append tasks to history."""
-    history = load_history()
-    history.extend(tasks)
-    save_history(history)
+    if not tasks:
+        return
+    _append(tasks, load_manifest())
+
+
+def count_history() -> int:
+    """Number of archived tasks (from the manifest, without reading any segment)."""
+    return _count(load_manifest())
+
+
+def find_longest_segment() -> Optional[str]:
+    """Key of the segment holding the longest completed task (per the manifest)."""
+    segments = load_manifest()["segments"]
+    best = max(segments.items(), key=lambda item: item[1].get("longest_duration", 0), default=None)
+    if not best or not best[1].get("longest_duration"):
+        return None
+    return best[0]
@@ -0,0 +1,134 @@
+"""
+Append-only operation log for the JSON task backend.
+
+Mutations are appended to tasks.log as one small JSON record per line instead of
+rewriting tasks.json. Reads replay the log over the last tasks.json snapshot, and
+storage.py folds the log back into a new snapshot once it grows past
+COMPACT_THRESHOLD_BYTES.
+
+Record formats:
+    {"op": "add", "task": {...}}                 -> append (or replace) a task row
+    {"op": "update", "id": "...", "fields": {}}  -> change some fields of a task
+    {"op": "delete", "id": "..."}                -> remove a task
+"""
+import json
+import os
+from typing import Dict, Iterable, List
+
+import atomic_io
+
+JOURNAL_FILE = "tasks.log"
+
+# Fold the log into tasks.json once it reaches this size
+COMPACT_THRESHOLD_BYTES = 256 * 1024
+
+
+def add_op(row: Dict) -> Dict:
+    return {"op": "add", "task": row}
+
+
+def update_op(task_id: str, fields: Dict) -> Dict:
+    return {"op": "update", "id": task_id, "fields": fields}
+
+
+def delete_op(task_id: str) -> Dict:
+    return {"op": "delete", "id": task_id}
+
+
+def diff_rows(old: Dict[str, Dict], new_rows: List[Dict]) -> List[Dict]:
+    """Build the operations that turn the `old` rows (keyed by id) into `new_rows`."""
+    ops = []
+    new_ids = set()
+    for row in new_rows:
+        task_id = row["id"]
+        new_ids.add(task_id)
+        previous = old.get(task_id)
+        if previous is None:
+            ops.append(add_op(row))
+        elif previous != row:
+            fields = {k: v for k, v in row.items() if previous.get(k) != v}
+            ops.append(update_op(task_id, fields))
+    for task_id in old:
+        if task_id not in new_ids:
+            ops.append(delete_op(task_id))
+    return ops
+
+
+def append_ops(ops: Iterable[Dict]):
+    """Append operations to the log (one line each)."""
+    lines = "".join(json.dumps(op, separators=(",", ":")) + "\n" for op in ops)
+    if not lines:
+        return
+    # Terminate a torn record from an interrupted append so it can't swallow ours
+    if not _ends_with_newline():
+        lines = "\n" + lines
+    atomic_io.append_text(JOURNAL_FILE, lines)
+
+
+def _ends_with_newline() -> bool:
+    try:
+        with open(JOURNAL_FILE, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() == 0:
+                return True
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+    except OSError:
+        return True
+
+
+def read_ops() -> List[Dict]:
+    """Read all logged operations, skipping a torn last line left by a crash."""
+    text = atomic_io.read_text(JOURNAL_FILE)
+    if not text:
+        return []
+    ops = []
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            ops.append(json.loads(line))
+        except json.JSONDecodeError:
+            continue
+    return ops
+
+
+def replay(rows: List[Dict], ops: Iterable[Dict]) -> List[Dict]:
+    """
+    Apply logged operations over snapshot rows, preserving task order.
+
+    Replay is idempotent, so a log that was not truncated after a compaction
+    can safely be applied to the new snapshot again.
+    """
+    by_id = {}
+    for row in rows:
+        by_id[row.get("id")] = row
+
+    for op in ops:
+        kind = op.get("op")
+        if kind == "add":
+            row = op["task"]
+            by_id[row.get("id")] = row
+        elif kind == "update":
+            row = by_id.get(op.get("id"))
+            if row is not None:
+                by_id[op["id"]] = {**row, **op.get("fields", {})}
+        elif kind == "delete":
+            by_id.pop(op.get("id"), None)
+
+    return list(by_id.values())
+
+
+def journal_size() -> int:
+    """Size of the log in bytes (0 if missing)."""
+    return atomic_io.getsize(JOURNAL_FILE)
+
+
+def needs_compaction() -> bool:
+    return journal_size() >= COMPACT_THRESHOLD_BYTES
+
+
+def clear_journal():
+    """Drop the log after its operations were folded into a snapshot."""
+    atomic_io.remove(JOURNAL_FILE)
@@ -0,0 +1,41 @@
+"""
+Deferred imports for heavy modules.
+
+    questionary = lazy_module("questionary")
+
+binds a stand-in module that imports the real one on first attribute access,
+so commands that never prompt (or render a dashboard, or parse a fuzzy date)
+don't pay for importing it at startup.
+"""
+import importlib
+import types
+
+
+class LazyModule(types.ModuleType):
+    """Module placeholder that imports the named module when first used."""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__["_module"] = None
+
+    def _load(self) -> types.ModuleType:
+        module = self.__dict__["_module"]
+        if module is None:
+            module = importlib.import_module(self.__name__)
+            self.__dict__["_module"] = module
+        return module
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr: str, value):
+        setattr(self._load(), attr, value)
+
+    def __dir__(self):
+        return dir(self._load())
+
+
+def lazy_module(name: str) -> types.ModuleType:
+    """Return the module if it's already imported, else a LazyModule for it."""
+    import sys
+    return sys.modules.get(name) or LazyModule(name)
@@ -1,28 +1,48 @@
 import typer
 import os
 from rich import print
-from rich.table import Table
 from rich.console import Console
-from rich import box
-from typing import Optional, List
+from typing import Iterable, Iterator, Optional, List, Tuple
 from datetime import datetime, timedelta
-import questionary
-from dateutil import parser as date_parser
+from lazy_imports import lazy_module
+
+# Heavy modules, imported on first use by the commands that need them
+questionary = lazy_module("questionary")
+ui = lazy_module("ui")
 
 from models import Task, Goal, Template
-from storage import load_tasks, save_tasks
+from task_table import TaskTable, load_table
+from storage import load_tasks, save_tasks, add_task, delete_tasks, find_tasks, get_tasks
 from goals_storage import load_goals, save_goals
 from categories_storage import load_categories, save_categories
-from history_storage import load_history, add_to_history, save_history
+from history_storage import load_history, save_history
 from notes_storage import load_notes, save_notes, Note
 from templates_storage import load_templates, save_templates, get_template_by_alias
-import ui
-from rich.align import Align
+import atomic_io
+import display_index
+import recurrence
 from config_storage import load_config, save_config, get_theme
+from cli_args import normalize_argv
+from date_parsing import parse_due
 
 app = typer.Typer(help="Fast CLI TDL App with Rainbow Dashboard")
 console = Console()
 
+# Commands that manage the data wholesale: no housekeeping before them
+NO_HOUSEKEEPING = {"clear", "clear-all", "import", "daemon"}
+
+
+@app.callback()
+def housekeeping(ctx: typer.Context):
+    """Background upkeep before a command (auto-archive, at most once a day)."""
+    if ctx.resilient_parsing or ctx.invoked_subcommand in NO_HOUSEKEEPING:
+        return
+    import archive_storage
+    try:
+        archive_storage.auto_archive()
+    except (OSError, ValueError):
+        pass  # Never let upkeep stop the command; tried again next time
+
 def parse_duration(duration_str: str) -> Optional[int]:
     """Parse duration string in format XXhXXmXXs to total seconds."""
     import re
@@ -40,16 +60,19 @@ def parse_duration(duration_str: str) -> Optional[int]:
     
     return hours * 3600 + minutes * 60 + seconds
 
-def resolve_category_input(input_str: str) -> List[str]:
+def resolve_category_input(input_str: str, cats: Optional[List[str]] = None) -> List[str]:
     """
     Resolve category input which can be:
     - Category names: "Work, Health"
     - Category IDs: "1, 2" 
     - Mixed: "Work, 2"
     
+    Pass `cats` when resolving many inputs to load the categories only once.
+    
     Returns list of resolved category names.
     """
-    cats = load_categories()
+    if cats is None:
+        cats = load_categories()
     result = []
     
     parts = [p.strip() for p in input_str.split(',') if p.strip()]
@@ -73,86 +96,18 @@ def resolve_category_input(input_str: str) -> List[str]:
     
     return result
 
-def get_global_task_id_map() -> dict:
+def get_global_task_id_map(tasks: Optional[List[Task]] = None) -> dict:
     """
     Create a mapping of task.id -> display_id based on dashboard order.
     This ensures consistent IDs across all views (db, today, tomorrow, etc.)
+    Served from the persistent display index (pass `tasks` if already loaded).
     """
-    all_tasks = load_tasks()
-    
-    # Separate tasks and events
-    tasks_only = [t for t in all_tasks if not t.title.startswith("📅")]
-    events_only = [t for t in all_tasks if t.title.startswith("📅")]
-    
-    # Get ordered tasks using dashboard order
-    ordered_tasks = get_task_dashboard_order(tasks_only)
-    ordered_events = get_task_dashboard_order(events_only)
-    
-    # Create ID mapping
-    id_map = {}
-    for idx, task in enumerate(ordered_tasks, 1):
-        id_map[task.id] = idx
-    
-    # Events get # prefix IDs (but we'll store just the number)
-    for idx, event in enumerate(ordered_events, 1):
-        id_map[event.id] = f"#{idx}"
-    
-    return id_map
+    return display_index.id_map(tasks)
 
 def get_task_dashboard_order(tasks: List[Task]) -> List[Task]:
     """Sort tasks identically to ui.render_dashboard grouping and sorting."""
-    from datetime import datetime, timedelta
-    
-    now = datetime.now()
-    today = now.date()
-    tomorrow = today + timedelta(days=1)
-    week_end = today + timedelta(days=7)
-    month_end = today + timedelta(days=30)
-    
-    grouped = {
-        "non-assigned": [],
-        "Today": [],
-        "Tomorrow": [],
-        "This week": [],
-        "This month": [],
-        "Future": []
-    }
-    
-    for task in tasks:
-        if not task.due_date:
-            grouped["non-assigned"].append(task)
-        else:
-            task_date = task.due_date.date()
-            if task_date == today:
-                grouped["Today"].append(task)
-            elif task_date == tomorrow:
-                grouped["Tomorrow"].append(task)
-            elif task_date <= week_end:
-                grouped["This week"].append(task)
-            elif task_date <= month_end:
-                grouped["This month"].append(task)
-            else:
-                grouped["Future"].append(task)
-    
-    # Sort buckets (Category -> Priority -> DueDate -> Title)
-    for group in grouped.values():
-        group.sort(key=lambda t: (
-            (t.category[0].lower() if isinstance(t.category, list) and t.category else (t.category.lower() if isinstance(t.category, str) else "")) if t.category else "",
-            -t.priority,
-            t.due_date if t.due_date else datetime.max,
-            t.title.lower()
-        ))
-    
-    # Flatten
-    ordered = []
-    ordered.extend(grouped["non-assigned"])
-    ordered.extend(grouped["Today"])
-    ordered.extend(grouped["Tomorrow"])
-    ordered.extend(grouped["This week"])
-    ordered.extend(grouped["This month"])
-    ordered.extend(grouped["Future"])
-    
-    return ordered
+    table = TaskTable(tasks)
+    return table.materialize(table.dashboard_order())
 
 def resolve_task_target(identifier: str) -> Tuple[Task, List[Task]]:
     """
@@ -169,22 +124,16 @@ def resolve_task_target(identifier: str) -> Tuple[Task, List[Task]]:
         print(f"[red]Invalid ID format: {identifier}. Use 'N' for task or '#N' for event.[/]")
         raise typer.Exit(1)
          
-    target_idx = int(clean_id_str)
-    
     all_tasks = load_tasks()
+    target_id = display_index.resolve(identifier, all_tasks)
     
-    if is_event_target:
-        candidates = [t for t in all_tasks if t.title.startswith("📅")]
-    else:
-        candidates = [t for t in all_tasks if not t.title.startswith("📅")]
-        
-    ordered = get_task_dashboard_order(candidates)
-    
-    if target_idx < 1 or target_idx > len(ordered):
-        print(f"[red]ID {identifier} not found. (Available: 1-{len(ordered)})[/]")
+    if target_id is None:
+        available = display_index.count("events" if is_event_target else "tasks", all_tasks)
+        print(f"[red]ID {identifier} not found. (Available: 1-{available})[/]")
         raise typer.Exit(1)
         
-    return ordered[target_idx - 1], all_tasks
+    task = next(t for t in all_tasks if t.id == target_id)
+    return task, all_tasks
 
 def configure_recurrence():
     """Interactive recurrence configuration. Returns (type, days, interval) or (None, None, 1) if cancelled."""
@@ -241,24 +190,7 @@ def configure_recurrence():
 
 def get_recurrence_display(task) -> str:
     """Get human-readable recurrence description."""
-    if not task.recurrent or not task.recurrence_type:
-        return ""
-    
-    day_names = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-    
-    if task.recurrence_type == "daily":
-        return "Daily"
-    elif task.recurrence_type == "weekly":
-        interval = task.recurrence_interval or 1
-        return f"Every {interval} week{'s' if interval > 1 else ''}"
-    elif task.recurrence_type == "monthly":
-        interval = task.recurrence_interval or 1
-        return f"Every {interval} month{'s' if interval > 1 else ''}"
-    elif task.recurrence_type == "custom" and task.recurrence_days:
-        days_str = ", ".join([day_names[d] for d in task.recurrence_days])
-        return f"Every {days_str}"
-    
-    return task.recurrence_type
+    return recurrence.describe(task)
 
 @app.command()
 def add(
@@ -268,9 +200,15 @@ def add(
     time: Optional[str] = typer.Option(None, "-t", help="Time duration (e.g. '2h30m', '45m', '1h30m15s')"),
     flag: Optional[int] = typer.Option(None, "-f", "--flag", help="Set priority: -1=unimportant, 0=normal, 1=important"),
     rc: bool = typer.Option(False, "-r", "--rc", help="Make this a recurring task"),
-    description: Optional[str] = typer.Option(None, "-i", "--info", help="Additional description/info for the task")
+    description: Optional[str] = typer.Option(None, "-i", "--info", help="Additional description/info for the task"),
+    batch: bool = typer.Option(False, "--batch", help="Add many tasks from stdin, one per line: 'Title -c Cat -d date -t 1h -f 1'")
 ):
     """Add a new task rapidly."""
+    if batch:
+        import sys
+        import_tasks(sys.stdin)
+        return
+    
     interactive = False
     template_loaded = None
     
@@ -328,37 +266,21 @@ def add(
             
     due_date = None
     if due:
-        lower_due = due.lower()
-        now = datetime.now()
-        if lower_due == "today":
-            due_date = now
-        elif lower_due == "tomorrow":
-            from datetime import timedelta
-            due_date = now + timedelta(days=1)
-        else:
-            try:
-                due_date = date_parser.parse(due, fuzzy=True)
-            except:
-                print(f"[red]Could not parse date: {due}[/]")
-                return
+        try:
+            due_date = parse_due(due)
+        except ValueError:
+            print(f"[red]Could not parse date: {due}[/]")
+            return
     elif interactive:
         # Only prompt in full interactive mode
         add_date = questionary.confirm("Add due date?", default=False).ask()
         if add_date:
             date_str = questionary.text("Due Date:").ask()
             if date_str:
-                lower_due = date_str.lower()
-                now = datetime.now()
-                if lower_due == "today":
-                    due_date = now
-                elif lower_due == "tomorrow":
-                    from datetime import timedelta
-                    due_date = now + timedelta(days=1)
-                else:
-                    try:
-                        due_date = date_parser.parse(date_str, fuzzy=True)
-                    except:
-                        print(f"[red]Could not parse date.[/]")
+                try:
+                    due_date = parse_due(date_str)
+                except ValueError:
+                    print(f"[red]Could not parse date.[/]")
     
     # Parse time duration
     duration_seconds = None
@@ -395,7 +317,6 @@ def add(
         recurrence_days = template_loaded.recurrence_days
         recurrence_interval = template_loaded.recurrence_interval
     
-    tasks = load_tasks()
     new_task = Task(
         title=title, 
         category=parsed_categories, 
@@ -408,8 +329,7 @@ def add(
         recurrence_days=recurrence_days,
         recurrence_interval=recurrence_interval
     )
-    tasks.append(new_task)
-    save_tasks(tasks)
+    add_task(new_task)
     
     # Build display message
     msg = f"[bold green]Task added![/] :rocket: [dim]{new_task.id}[/]"
@@ -426,34 +346,181 @@ def add(
 
     print(msg)
 
+# Options accepted on each line of a batch (same as `TDL add`)
+BATCH_OPTIONS = {"-c": "category", "-d": "due", "-t": "time", "-f": "flag", "--flag": "flag",
+                 "-i": "description", "--info": "description"}
+
+def read_task_specs(lines: Iterable[str]) -> Iterator[Tuple[int, str]]:
+    """(line number, text) of each task line, skipping blank lines and # comments."""
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+        if line and not line.startswith("#"):
+            yield number, line
+
+def parse_task_spec(line: str, cats: List[str], templates: dict) -> Task:
+    """
+    Build a task from one batch line, e.g. 'Call mom -c Home -d "fri 6pm" -t 30m -f 1'
+    or '*standup -d tomorrow' for a template.
+    
+    Raises:
+        ValueError: The line is not a valid task (the message says why)
+    """
+    words, options = [], {}
+    if any(c in line for c in "\"'\\"):
+        import shlex
+        tokens = iter(shlex.split(line))
+    else:
+        tokens = iter(line.split())  # No quoting: skip the (slow) shlex tokenizer
+    for token in tokens:
+        if token in BATCH_OPTIONS:
+            value = next(tokens, None)
+            if value is None:
+                raise ValueError(f"{token} needs a value")
+            options[BATCH_OPTIONS[token]] = value
+        elif token in ("-r", "--rc"):
+            raise ValueError("recurring tasks need the interactive setup (TDL add -r)")
+        elif token.startswith("-") and len(token) > 1 and not token[1:].isdigit():
+            raise ValueError(f"unknown option {token}")
+        else:
+            words.append(token)
+    
+    title = " ".join(words)
+    template = None
+    if title.startswith("*"):
+        template = templates.get(title[1:].lower())
+        if template is None:
+            raise ValueError(f"template '{title[1:]}' not found")
+        title = template.title
+    if not title:
+        raise ValueError("missing title")
+    
+    category = options.get("category")
+    if category is None and template and template.category:
+        category = ",".join(template.category) if isinstance(template.category, list) else template.category
+    due = options.get("due") or (template.due_date_offset if template else None)
+    
+    duration = template.time_duration if template else None
+    if "time" in options:
+        duration = parse_duration(options["time"])
+        if duration is None:
+            raise ValueError(f"invalid duration '{options['time']}' (use e.g. 2h30m)")
+    
+    priority = template.priority if template else 0
+    if "flag" in options:
+        if options["flag"] not in ("-1", "0", "1"):
+            raise ValueError(f"invalid flag '{options['flag']}' (use -1, 0 or 1)")
+        priority = int(options["flag"])
+    
+    return Task(
+        title=title,
+        category=resolve_category_input(category, cats) or None if category else None,
+        due_date=parse_due(due) if due else None,
+        time_duration=duration,
+        priority=priority,
+        description=options.get("description"),
+        recurrent=bool(template and template.recurrent),
+        recurrence_type=template.recurrence_type if template and template.recurrent else None,
+        recurrence_days=template.recurrence_days if template and template.recurrent else None,
+        recurrence_interval=template.recurrence_interval if template and template.recurrent else 1,
+    )
+
+def parse_task_specs(specs: Iterable[Tuple[int, str]], cats: List[str], templates: dict) -> Iterator[Tuple[int, Optional[Task], Optional[str]]]:
+    """(line number, task, None) for each good line, (line number, None, error) for each bad one."""
+    for number, line in specs:
+        try:
+            yield number, parse_task_spec(line, cats, templates), None
+        except ValueError as e:
+            yield number, None, str(e)
+
+def import_tasks(lines: Iterable[str]) -> int:
+    """
+    Add every task described in `lines` with a single write, reporting bad
+    lines without stopping. Returns the number of tasks added.
+    """
+    import time as timer
+    from rich.markup import escape
+    from storage import add_tasks
+    
+    started = timer.perf_counter()
+    cats = load_categories()
+    templates = {t.alias.lower(): t for t in load_templates()}
+    
+    tasks, skipped = [], 0
+    for number, task, error in parse_task_specs(read_task_specs(lines), cats, templates):
+        if error:
+            skipped += 1
+            print(f"[yellow]Line {number}: {escape(error)}[/]")
+        else:
+            tasks.append(task)
+    
+    add_tasks(tasks)
+    elapsed = timer.perf_counter() - started
+    
+    rate = f" ({len(tasks) / elapsed:,.0f} tasks/sec)" if tasks and elapsed > 0 else ""
+    summary = f"[bold green]Added {len(tasks)} task(s)[/] in {elapsed:.2f}s{rate}"
+    if skipped:
+        summary += f", [yellow]{skipped} line(s) skipped[/]"
+    print(summary)
+    return len(tasks)
+
+@app.command(name="import")
+def import_cmd(
+    path: Optional[str] = typer.Argument(None, help="File with one task per line (default: read stdin)")
+):
+    """Add many tasks at once, one per line, using the same flags as add (-c -d -t -f -i)."""
+    import sys
+    if path is None:
+        if sys.stdin.isatty():
+            print("[dim]Enter one task per line, e.g. 'Buy milk -c Home -d tomorrow'. Finish with Ctrl-D (Ctrl-Z on Windows).[/dim]")
+        import_tasks(sys.stdin)
+        return
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            import_tasks(f)
+    except OSError as e:
+        print(f"[red]Could not read {path}: {e.strerror}[/]")
+
 @app.command()
 @app.command(name="db")  # Alias for fast typing
-def dashboard():
+def dashboard(
+    page: Optional[int] = typer.Option(None, "-p", "--page", help="Show only this page of tasks"),
+    page_size: Optional[int] = typer.Option(None, "-n", "--page-size", help="Tasks per page (default: fits the terminal)"),
+    interactive: bool = typer.Option(False, "-i", "--interactive", help="Page through tasks with the keyboard"),
+):
     """Display all tasks in a dashboard view (Categories & Time)."""
-    tasks = load_tasks()
-    # Filter out calendar events (tasks starting with 📅)
-    dashboard_tasks = [t for t in tasks if not t.title.startswith("📅")]
-    ui.render_dashboard(dashboard_tasks)
-
-@app.command()
-def today():
-    """Show only tasks due today."""
-    from datetime import datetime
-    tasks = load_tasks()
-    now = datetime.now()
-    today_date = now.date()
+    if page is None and page_size is None and not interactive:
+        tasks = load_tasks()
+        # Filter out calendar events (tasks starting with 📅)
+        dashboard_tasks = [t for t in tasks if not t.title.startswith("📅")]
+        ui.render_dashboard(dashboard_tasks)
+        return
     
-    # Get global ID mapping for consistent IDs
-    global_id_map = get_global_task_id_map()
+    # Paged: the display index already holds the sorted order, so only the
+    # tasks on screen are loaded and rendered
+    entries = display_index.get_index()["tasks"]
+    size = max(1, page_size or console.size.height - 8)
+    if not entries:
+        print("[dim]No tasks to display.[/dim]")
+        return
+    start = (max(1, page or 1) - 1) * size
+    start = min(start, (len(entries) - 1) // size * size)
     
-    # Filter tasks due today
-    today_tasks = [t for t in tasks if t.due_date and t.due_date.date() == today_date]
+    if interactive:
+        ui.run_dashboard_pager(entries, get_tasks, size, start)
+    else:
+        tasks_by_id = get_tasks(entry[-1] for entry in entries[start:start + size])
+        ui.render_dashboard_page(entries, tasks_by_id, start, size)
+
+def show_due_range(heading: str, rows: List[int], table: TaskTable, empty_message: str):
+    """Print the tasks and events among the given TaskTable rows with global display IDs."""
+    # Get global ID mapping for consistent IDs
+    global_id_map = get_global_task_id_map(table.tasks)
     
     # Sort into Tasks and Events
-    events = [t for t in today_tasks if t.title.startswith("📅")]
-    tasks_only = [t for t in today_tasks if not t.title.startswith("📅")]
-
-    console.print("\n[bold red]📅 TODAY[/bold red]")
+    events = table.materialize(table.select(rows, events=True))
+    tasks_only = table.materialize(table.select(rows, events=False))
+    
+    console.print(heading)
     
     if events:
         console.print("[bold yellow]Events:[/]")
@@ -464,117 +531,66 @@ def today():
     if tasks_only:
         ui.render_task_list(tasks_only, global_id_map)
     elif not events:
-        print("[yellow]No tasks due today![/]")
+        print(empty_message)
+
+@app.command()
+def today():
+    """Show only tasks due today."""
+    table = load_table()
+    today_date = datetime.now().date()
+    
+    # Filter tasks due today
+    rows = table.due_between(today_date, today_date)
+    show_due_range("\n[bold red]📅 TODAY[/bold red]", rows, table, "[yellow]No tasks due today![/]")
 
 @app.command()
 def tomorrow():
     """Show only tasks due tomorrow."""
-    from datetime import datetime, timedelta
-    tasks = load_tasks()
-    now = datetime.now()
-    tomorrow_date = (now + timedelta(days=1)).date()
-    
-    # Get global ID mapping for consistent IDs
-    global_id_map = get_global_task_id_map()
+    table = load_table()
+    tomorrow_date = (datetime.now() + timedelta(days=1)).date()
     
     # Filter tasks due tomorrow
-    tomorrow_tasks = [t for t in tasks if t.due_date and t.due_date.date() == tomorrow_date]
-    
-    # Sort into Tasks and Events
-    events = [t for t in tomorrow_tasks if t.title.startswith("📅")]
-    tasks_only = [t for t in tomorrow_tasks if not t.title.startswith("📅")]
-    
-    console.print("\n[bold yellow]📅 TOMORROW[/bold yellow]")
-    
-    if events:
-        console.print("[bold yellow]Events:[/]")
-        ui.render_task_list(events, global_id_map)
-        if tasks_only:
-             console.print("[bold white]Tasks:[/]")
-             
-    if tasks_only:
-        ui.render_task_list(tasks_only, global_id_map)
-    elif not events:
-        print("[yellow]No tasks due tomorrow![/]")
+    rows = table.due_between(tomorrow_date, tomorrow_date)
+    show_due_range("\n[bold yellow]📅 TOMORROW[/bold yellow]", rows, table, "[yellow]No tasks due tomorrow![/]")
 
 @app.command(name="this-week")
 def this_week():
     """Show only tasks due this week (excluding today and tomorrow)."""
-    from datetime import datetime, timedelta
-    tasks = load_tasks()
-    now = datetime.now()
-    today = now.date()
-    tomorrow = today + timedelta(days=1)
+    table = load_table()
+    today = datetime.now().date()
     week_end = today + timedelta(days=7)
     
-    # Get global ID mapping for consistent IDs
-    global_id_map = get_global_task_id_map()
-    
     # Filter tasks due this week (excluding today and tomorrow)
-    week_tasks = [t for t in tasks if t.due_date and tomorrow < t.due_date.date() <= week_end]
-    
-    # Sort into Tasks and Events
-    events = [t for t in week_tasks if t.title.startswith("📅")]
-    tasks_only = [t for t in week_tasks if not t.title.startswith("📅")]
-    
-    console.print("\n[bold green]📅 THIS WEEK[/bold green]")
-    
-    if events:
-        console.print("[bold yellow]Events:[/]")
-        ui.render_task_list(events, global_id_map)
-        if tasks_only:
-             console.print("[bold white]Tasks:[/]")
-
-    if tasks_only:
-        ui.render_task_list(tasks_only, global_id_map)
-    elif not events:
-        print("[yellow]No more tasks due this week![/]")
+    rows = table.due_between(today + timedelta(days=2), week_end)
+    show_due_range("\n[bold green]📅 THIS WEEK[/bold green]", rows, table, "[yellow]No more tasks due this week![/]")
 
 @app.command(name="this-month")
 def this_month():
     """Show only tasks due this month (excluding this week)."""
-    from datetime import datetime, timedelta
-    tasks = load_tasks()
-    now = datetime.now()
-    today = now.date()
+    table = load_table()
+    today = datetime.now().date()
     week_end = today + timedelta(days=7)
     month_end = today + timedelta(days=30)
     
-    # Get global ID mapping for consistent IDs
-    global_id_map = get_global_task_id_map()
-    
     # Filter tasks due this month (excluding this week)
-    month_tasks = [t for t in tasks if t.due_date and week_end < t.due_date.date() <= month_end]
-    
-    # Sort into Tasks and Events
-    events = [t for t in month_tasks if t.title.startswith("📅")]
-    tasks_only = [t for t in month_tasks if not t.title.startswith("📅")]
-    
-    console.print("\n[bold blue]📅 THIS MONTH[/bold blue]")
-    
-    if events:
-        console.print("[bold yellow]Events:[/]")
-        ui.render_task_list(events, global_id_map)
-        if tasks_only:
-             console.print("[bold white]Tasks:[/]")
-
-    if tasks_only:
-        ui.render_task_list(tasks_only, global_id_map)
-    elif not events:
-        print("[yellow]No more tasks due this month![/]")
+    rows = table.due_between(week_end + timedelta(days=1), month_end)
+    show_due_range("\n[bold blue]📅 THIS MONTH[/bold blue]", rows, table, "[yellow]No more tasks due this month![/]")
 
 @app.command()
 def calendar():
     """View the interactive calendar with arrow key navigation."""
-    tasks = load_tasks()
+    table = load_table()
     
     # Filter to show only events (strictly starting with 📅)
-    events = [t for t in tasks if t.title.startswith("📅")]
+    events = table.materialize(table.select(events=True))
+
+    # Open recurring tasks (and events) are previewed on their upcoming occurrences
+    recurring = table.materialize(table.select(completed=False, recurrent=True))
     
     # Get global ID mapping for consistent IDs
-    global_id_map = get_global_task_id_map()
+    global_id_map = get_global_task_id_map(table.tasks)
     
-    ui.render_calendar_interactive(events, global_id_map)
+    ui.render_calendar_interactive(events, global_id_map, recurring)
     
     # Refresh screen and show welcome on exit
     os.system('cls' if os.name == 'nt' else 'clear')
@@ -631,17 +647,8 @@ def event(
     
     # Parse the date
     try:
-        lower_due = due.lower()
-        now = datetime.now()
-        
-        if lower_due == "today":
-            parsed_date = now
-        elif lower_due == "tomorrow":
-            from datetime import timedelta
-            parsed_date = now + timedelta(days=1)
-        else:
-            parsed_date = date_parser.parse(due, fuzzy=True)
-    except Exception:
+        parsed_date = parse_due(due)
+    except ValueError:
         print(f"[red]Could not parse date: {due}[/]")
         return
     
@@ -668,9 +675,7 @@ def event(
         description=description
     )
     
-    tasks = load_tasks()
-    tasks.append(new_event)
-    save_tasks(tasks)
+    add_task(new_event)
     
     date_str = parsed_date.strftime('%Y-%m-%d %H:%M') if parsed_date.hour or parsed_date.minute else parsed_date.strftime('%Y-%m-%d')
     print(f"[bold green]📅 Event added![/] {event_title}")
@@ -682,62 +687,22 @@ def event(
             cat_display = f"#{categories}"
         print(f"[dim]Categories: {cat_display}[/]")
 
-def calculate_next_recurrence(task: Task) -> Optional[datetime]:
-    """Calculate the next due date for a recurring task."""
-    from dateutil.relativedelta import relativedelta
-    
-    if not task.due_date:
-        start_date = datetime.now()
-    else:
-        start_date = task.due_date
-        
-    interval = task.recurrence_interval or 1
-    
-    if task.recurrence_type == "daily":
-        return start_date + timedelta(days=interval)
-        
-    elif task.recurrence_type == "weekdays":
-        # Find next weekday
-        next_date = start_date + timedelta(days=1)
-        while next_date.weekday() >= 5: # 5=Sat, 6=Sun
-            next_date += timedelta(days=1)
-        return next_date
-        
-    elif task.recurrence_type == "weekly":
-        return start_date + timedelta(weeks=interval)
-        
-    elif task.recurrence_type == "biweekly":
-        return start_date + timedelta(weeks=2*interval)
-        
-    elif task.recurrence_type == "monthly":
-        return start_date + relativedelta(months=interval)
-        
-    elif task.recurrence_type == "custom":
-        # Simple interval for now, ideally strictly follow task.recurrence_days if set
-        return start_date + timedelta(days=interval)
-        
-    return None
+def process_recurrence(task: Task, now: Optional[datetime] = None) -> List[Task]:
+    """
+    Create the instances following a completed recurring task: the occurrences
+    missed since it was due, then the next upcoming one.
+    """
+    return recurrence.materialize(task, now)
 
-def process_recurrence(task: Task) -> Optional[Task]:
-    """Create the next instance of a recurring task."""
-    next_due = calculate_next_recurrence(task)
-    if not next_due:
-        return None
-        
-    # Create new task copy
-    new_task = Task(
-        title=task.title,
-        category=task.category.copy() if task.category else None,
-        priority=task.priority,
-        description=task.description,
-        time_duration=task.time_duration,
-        due_date=next_due,
-        recurrent=True,
-        recurrence_type=task.recurrence_type,
-        recurrence_days=task.recurrence_days.copy() if task.recurrence_days else None,
-        recurrence_interval=task.recurrence_interval
-    )
-    return new_task
+
+def report_recurrence(instances: List[Task]):
+    """Print what completing a recurring task created."""
+    upcoming = [t for t in instances if t.recurrent]
+    missed = len(instances) - len(upcoming)
+    if missed:
+        print(f"[magenta]  -> {missed} missed occurrence(s) added as overdue tasks[/]")
+    if upcoming:
+        print(f"[magenta]  -> Next due: {upcoming[0].due_date.strftime('%Y-%m-%d')}[/]")
 
 @app.command()
 def check(
@@ -745,38 +710,21 @@ def check(
 ):
     """Mark tasks as complete. Use IDs for fast completion or leave empty for interactive mode."""
     tasks = load_tasks()
+    table = TaskTable(tasks)
     
     # Fast mode: Direct ID completion
     if task_ids:
         ids = [x.strip() for x in task_ids.split(',') if x.strip()]
         
-        # Get ordered lists once to resolve IDs consistent with dashboard
-        tasks_only = [t for t in tasks if not t.title.startswith("📅")]
-        events_only = [t for t in tasks if t.title.startswith("📅")]
-        
-        ordered_tasks = get_task_dashboard_order(tasks_only)
-        ordered_events = get_task_dashboard_order(events_only)
+        # Resolve display IDs through the dashboard index
+        tasks_by_id = {t.id: t for t in tasks}
         
         resolved_count = 0
         new_recurring_tasks = []
         completion_time = datetime.now()
         
         for task_id in ids:
-            target_task = None
-            
-            # Event ID (starts with #)
-            if task_id.startswith("#"):
-                clean_id = task_id[1:]
-                if clean_id.isdigit():
-                    idx = int(clean_id)
-                    if 1 <= idx <= len(ordered_events):
-                        target_task = ordered_events[idx - 1]
-            
-            # Task ID (number)
-            elif task_id.isdigit():
-                idx = int(task_id)
-                if 1 <= idx <= len(ordered_tasks):
-                    target_task = ordered_tasks[idx - 1]
+            target_task = tasks_by_id.get(display_index.resolve(task_id, tasks))
             
             if target_task:
                 # Mark as complete
@@ -787,10 +735,9 @@ def check(
                 # Handle Recurrence
                 if target_task.recurrent:
                     print(f"[magenta]Processing recurrence for '{target_task.title}'...[/]")
-                    next_task = process_recurrence(target_task)
-                    if next_task:
-                        new_recurring_tasks.append(next_task)
-                        print(f"[magenta]  -> Next due: {next_task.due_date.strftime('%Y-%m-%d')}[/]")
+                    instances = process_recurrence(target_task, completion_time)
+                    new_recurring_tasks.extend(instances)
+                    report_recurrence(instances)
                     
                     # Disable recurrence on the completed instance so it doesn't show in rc/spawn again
                     target_task.recurrent = False
@@ -803,14 +750,15 @@ def check(
         # Add new recurring instances to main list
         if new_recurring_tasks:
             tasks.extend(new_recurring_tasks)
-            
-        save_tasks(tasks)
         
         # Update streak
         from streak_storage import update_streak, get_streak_display
         from config_storage import get_show_streak
         
-        streak, active = update_streak()
+        # Tasks and streak are committed together
+        with atomic_io.deferred_writes():
+            save_tasks(tasks)
+            streak, active = update_streak()
         
         if get_show_streak():
             print(f"[bold green]Completed {resolved_count} task(s)![/] {get_streak_display()}")
@@ -819,7 +767,7 @@ def check(
         return
     
     # Interactive mode: Checkbox selection
-    open_tasks = [t for t in tasks if not t.completed]
+    open_tasks = table.materialize(table.select(completed=False))
     
     if not open_tasks:
         print("[green]No pending tasks! Good job![/]")
@@ -857,21 +805,22 @@ def check(
                 # Handle Recurrence (Interactive)
                 if t.recurrent:
                     print(f"[magenta]Processing recurrence for '{t.title}'...[/]")
-                    next_task = process_recurrence(t)
-                    if next_task:
-                        new_recurring_tasks.append(next_task)
+                    instances = process_recurrence(t, completion_time)
+                    new_recurring_tasks.extend(instances)
+                    report_recurrence(instances)
                     t.recurrent = False
 
         if new_recurring_tasks:
             tasks.extend(new_recurring_tasks)
-            
-        save_tasks(tasks)
         
         # Update streak
         from streak_storage import update_streak, get_streak_display
         from config_storage import get_show_streak
         
-        streak, active = update_streak()
+        # Tasks and streak are committed together
+        with atomic_io.deferred_writes():
+            save_tasks(tasks)
+            streak, active = update_streak()
         
         if get_show_streak():
             print(f"[bold green]Completed {count} tasks![/] {get_streak_display()}")
@@ -925,20 +874,12 @@ def update(
     
     # Update due date
     if due is not None:
-        lower_due = due.lower()
-        now = datetime.now()
-        
-        if lower_due == "today":
-            task.due_date = now
-        elif lower_due == "tomorrow":
-            from datetime import timedelta
-            task.due_date = now + timedelta(days=1)
-        elif lower_due == "none" or lower_due == "":
+        if due.lower() in ("none", ""):
             task.due_date = None
         else:
             try:
-                task.due_date = date_parser.parse(due, fuzzy=True)
-            except:
+                task.due_date = parse_due(due)
+            except ValueError:
                 print(f"[red]Could not parse date: {due}[/]")
                 return
         
@@ -1010,33 +951,15 @@ def delete(
     """Delete a task (or multiple tasks) by ID (e.g. '1', '1,2', '#1')."""
     import typer
     
-    # Get ordered lists once to resolve IDs consistent with dashboard
+    # Resolve display IDs through the dashboard index
     tasks = load_tasks()
-    tasks_only = [t for t in tasks if not t.title.startswith("📅")]
-    events_only = [t for t in tasks if t.title.startswith("📅")]
-    
-    ordered_tasks = get_task_dashboard_order(tasks_only)
-    ordered_events = get_task_dashboard_order(events_only)
+    tasks_by_id = {t.id: t for t in tasks}
     
     resolved_tasks = []
     ids = [x.strip() for x in task_id.split(',') if x.strip()]
     
     for i in ids:
-        target_task = None
-        
-        # Event ID (starts with #)
-        if i.startswith("#"):
-            clean_id = i[1:]
-            if clean_id.isdigit():
-                idx = int(clean_id)
-                if 1 <= idx <= len(ordered_events):
-                    target_task = ordered_events[idx - 1]
-        
-        # Task ID (number)
-        elif i.isdigit():
-            idx = int(i)
-            if 1 <= idx <= len(ordered_tasks):
-                target_task = ordered_tasks[idx - 1]
+        target_task = tasks_by_id.get(display_index.resolve(i, tasks))
         
         if target_task:
             resolved_tasks.append(target_task)
@@ -1059,12 +982,9 @@ def delete(
     ).ask()
     
     if confirm:
-        deleted_count = 0
-        for t in resolved_tasks:
-            if t in tasks:
-                tasks.remove(t)
-                deleted_count += 1
-        save_tasks(tasks)
+        deleted_ids = {t.id for t in resolved_tasks}
+        deleted_count = len(deleted_ids)
+        delete_tasks(deleted_ids)
         print(f"[bold red]Deleted {deleted_count} task(s)![/] 🗑️")
     else:
         print("[yellow]Deletion cancelled.[/]")
@@ -1098,8 +1018,10 @@ def config(
 @app.command(name="rc")
 def rc():
     """List all recurring tasks."""
-    tasks = load_tasks()
-    recurring = [t for t in tasks if t.recurrent]
+    from rich.table import Table
+    from rich import box
+    table = load_table()
+    recurring = table.select(recurrent=True)
     
     if not recurring:
         print("[yellow]No recurring tasks found.[/]")
@@ -1107,25 +1029,21 @@ def rc():
     
     console.print("\n[bold magenta]🔁 RECURRING TASKS[/bold magenta]\n")
     
-    table = Table(box=box.ROUNDED, show_header=True, header_style="bold magenta")
-    table.add_column("ID", width=4, style="bold cyan", justify="center")
-    table.add_column("Task", style="white")
-    table.add_column("Recurrence", style="magenta")
-    
-    # Get display IDs
-    unassigned = [t for t in tasks if not t.due_date]
-    assigned = [t for t in tasks if t.due_date]
-    all_visible = unassigned + assigned
+    output = Table(box=box.ROUNDED, show_header=True, header_style="bold magenta")
+    output.add_column("ID", width=4, style="bold cyan", justify="center")
+    output.add_column("Task", style="white")
+    output.add_column("Recurrence", style="magenta")
     
-    for task in recurring:
-        display_id = all_visible.index(task) + 1 if task in all_visible else "?"
-        table.add_row(
-            str(display_id),
+    # Get display IDs (unassigned tasks listed before assigned ones)
+    for row in recurring:
+        task = table.tasks[row]
+        output.add_row(
+            str(table.visible_position(row)),
             task.title,
             get_recurrence_display(task)
         )
     
-    console.print(table)
+    console.print(output)
     console.print()
 
 @app.command(name="rcdel")
@@ -1155,6 +1073,8 @@ def rc_del(
 @app.command(name="categories")
 def categories():
     """Display all available categories."""
+    from rich.table import Table
+    from rich import box
     cats = load_categories()
     if not cats:
         print("[yellow]No categories defined yet. Use 'TDL add cat <name>' to create one.[/]")
@@ -1165,8 +1085,9 @@ def categories():
     table.add_column("Category Name", style="bold yellow")
     table.add_column("Color", style="white")
     
+    palette = ui.resolve_category_colors(cats)
     for i, cat in enumerate(cats, start=1):
-        color = ui.get_category_color(cat)
+        color = palette.get(cat, "white")
         table.add_row(
             str(i),
             f"[bold {color}]{cat}[/bold {color}]",
@@ -1193,6 +1114,8 @@ def color(
     • List: TDL color
     • Set:  TDL color Work red
     """
+    from rich.table import Table
+    from rich import box
     from config_storage import get_category_colors, update_category_color
     
     if category and color_val:
@@ -1246,8 +1169,9 @@ def color(
     table.add_column("Color", style="dim")
     table.add_column("Preview", style="white")
     
+    palette = ui.resolve_category_colors(final_cats)
     for cat in sorted(final_cats):
-        col = ui.get_category_color(cat)
+        col = palette.get(cat, "white")
         table.add_row(cat, col, f"[{col}]██████[/]")
         
     console.print(table)
@@ -1352,8 +1276,12 @@ def del_alias(
 @app.command(name="clear")
 def clear():
     """Archive all completed tasks to history."""
-    tasks = load_tasks()
-    completed = [t for t in tasks if t.completed]
+    import archive_storage
+
+    resumed = archive_storage.resume()
+    if resumed:
+        print(f"[dim]Finished an interrupted archive ({resumed} task(s)).[/dim]")
+    completed = find_tasks(completed=True)
     
     if not completed:
         print("[yellow]No completed tasks to clean.[/]")
@@ -1369,12 +1297,8 @@ def clear():
     ).ask()
     
     if confirm:
-        # Add to history
-        add_to_history(completed)
-        # Remove from active tasks
-        tasks = [t for t in tasks if not t.completed]
-        save_tasks(tasks)
-        print(f"[bold green]{len(completed)} task(s) archived to history![/]")
+        archived = archive_storage.archive(completed)
+        print(f"[bold green]{archived} task(s) archived to history![/]")
     else:
         print("[yellow]Cleaning cancelled.[/]")
 
@@ -1383,7 +1307,6 @@ def clear():
 def clear_all():
     """Delete ALL tasks, history, and categories. Use with caution!"""
     import os
-    import json
     from rich.console import Console
     console = Console()
     
@@ -1432,16 +1355,16 @@ def clear_all():
             
         # Clear recurrent tasks
         if os.path.exists("recurrent_tasks.json"):
-            with open("recurrent_tasks.json", "w") as f:
-                json.dump([], f)
+            atomic_io.write_json("recurrent_tasks.json", [], indent=None)
         
         # Clear notes
         if os.path.exists("notes.json"):
             save_notes([])
         
         # Clear streak data
-        if os.path.exists("streak.json"):
-            os.remove("streak.json")
+        for streak_file in ("streak.json", "streak_days.idx"):
+            if os.path.exists(streak_file):
+                os.remove(streak_file)
 
         print("[bold green]✓ All data deleted successfully![/]")
         print("[dim]Your TDL is now completely clean.[/dim]")
@@ -1451,6 +1374,8 @@ def clear_all():
 @app.command()
 def hist():
     """Display history of archived completed tasks."""
+    from rich.table import Table
+    from rich import box
 
 
     history = load_history()
@@ -1479,6 +1404,74 @@ def hist():
     console.print(table)
     print(f"\n[dim]Total: {len(history)} archived tasks[/]")
 
+SEARCH_KIND_LABELS = {"task": "Task", "history": "Archived", "note": "Note", "goal": "Goal"}
+
+@app.command()
+def search(
+    query: List[str] = typer.Argument(..., help='Words to find; word* matches a prefix, "two words" a phrase'),
+    limit: int = typer.Option(20, "--limit", "-n", help="Maximum results shown"),
+    kinds: Optional[List[str]] = typer.Option(None, "--in", help="Only search task, history, note or goal (repeatable)"),
+    rebuild: bool = typer.Option(False, "--rebuild", help="Rebuild the search index from scratch first")
+):
+    """Search tasks, archived history, notes and goals."""
+    import time as timer
+    from rich.markup import escape
+    from rich.table import Table
+    from rich import box
+    import search_index
+
+    kinds = [kind.lower() for kind in kinds or []]
+    unknown = [kind for kind in kinds if kind not in search_index.KINDS]
+    if unknown:
+        print(f"[red]Unknown kind: {', '.join(unknown)}. Use {', '.join(search_index.KINDS)}.[/]")
+        return
+
+    text = " ".join(query)
+    started = timer.perf_counter()
+    try:
+        if rebuild:
+            search_index.rebuild()
+        hits, total = search_index.search(text, kinds, limit)
+    except ValueError as e:
+        print(f"[red]{e}.[/]")
+        return
+    except RuntimeError as e:
+        print(f"[red]{e}[/]")
+        return
+    elapsed = timer.perf_counter() - started
+
+    if not hits:
+        print(f"[yellow]No matches for '{escape(text)}'.[/] [dim]({elapsed * 1000:.0f}ms)[/]")
+        return
+
+    # Active tasks are shown with their dashboard IDs, for use with info/update/del
+    display_ids = get_global_task_id_map() if any(hit.kind == "task" for hit in hits) else {}
+
+    table = Table(box=box.ROUNDED, show_header=True, header_style="bold bright_green on black",
+                  title=f"[bold green]🔎 SEARCH: {escape(text)}[/]")
+    table.add_column("ID", width=5, style="bold cyan", justify="center")
+    table.add_column("Kind", style="bold magenta")
+    table.add_column("Category", style="bold green")
+    table.add_column("Match", style="bold white")
+    table.add_column("Date", style="dim")
+
+    for hit in hits:
+        marked = escape(hit.marked).replace(search_index.MATCH_START, "[reverse]").replace(search_index.MATCH_END, "[/reverse]")
+        if hit.done:
+            marked = f"[dim]{marked}[/dim]"
+        shown_id = display_ids.get(hit.ref, "") if hit.kind == "task" else ""
+        table.add_row(
+            str(shown_id),
+            SEARCH_KIND_LABELS[hit.kind],
+            escape(hit.category),
+            marked,
+            hit.stamp.replace("T", " ")
+        )
+
+    console.print(table)
+    more = f", showing the best {len(hits)}" if total > len(hits) else ""
+    print(f"\n[dim]{total} match(es){more} in {elapsed * 1000:.0f}ms[/]")
+
 @app.command(name="info")
 def task_info(
     task_id: str = typer.Argument(..., help="Task ID to view details (1-10) or #ID")
@@ -1795,6 +1788,8 @@ def template_cmd(
     rc: bool = typer.Option(False, "-r", "--rc", help="Make this a recurring template")
 ):
     """Create a new task template or list all templates."""
+    from rich.table import Table
+    from rich import box
     templates = load_templates()
     
     # If no title provided, list all templates
@@ -2057,11 +2052,96 @@ def intro():
     ))
     console.print()
 
+@app.command(name="streak")
+def streak_cmd(
+    rebuild: bool = typer.Option(False, "--rebuild", help="Recompute the completion calendar from history and tasks"),
+):
+    """Show the current and longest daily streak."""
+    from streak_storage import rebuild as rebuild_calendar, get_longest_streak, get_streak_display
+    if rebuild:
+        rebuild_calendar()
+        print("[dim]Rebuilt the completion calendar.[/dim]")
+    print(f"Current streak: {get_streak_display()}  [dim]|[/dim]  Longest: [bold]{get_longest_streak()}[/] day(s)")
+
 @app.command(name="stat")
-def statistics():
+def statistics(
+    days: int = typer.Option(30, "-w", "--days", help="Window length in days (e.g. 7, 30, 90, 365)"),
+    start: Optional[str] = typer.Option(None, "--from", help="First day of a custom window (e.g. '2026-01-01')"),
+    end: Optional[str] = typer.Option(None, "--to", help="Last day of the window (default: today)"),
+    by_category: bool = typer.Option(False, "--by-category", help="Break the window down by category"),
+    by_weekday: bool = typer.Option(False, "--by-weekday", help="Break the window down by weekday"),
+    rebuild: bool = typer.Option(False, "--rebuild", help="Rebuild the daily statistics rollup from the whole history"),
+):
     """Display task completion statistics."""
     from stat_command import stat
-    stat()
+    if days < 1:
+        print("[red]The window must be at least 1 day.[/]")
+        return
+    window = []
+    for value in (start, end):
+        try:
+            window.append(parse_due(value).date() if value else None)
+        except ValueError:
+            print(f"[red]Could not parse date: {value}[/]")
+            return
+    stat(days=days, start=window[0], end=window[1], by_category=by_category, by_weekday=by_weekday,
+         rebuild_rollup=rebuild)
+
+@app.command(name="storage")
+def storage_cmd(
+    backend: Optional[str] = typer.Argument(None, help="Backend to switch to: 'json' or 'sqlite' (leave empty to show current)")
+):
+    """Show or switch the task storage backend (migrates existing tasks)."""
+    from storage import get_backend, migrate_tasks, BACKENDS
+
+    current = get_backend()
+
+    if not backend:
+        print(f"[cyan]Storage backend:[/] [bold]{current}[/]")
+        print(f"[dim]Available: {', '.join(BACKENDS)}. Switch with 'TDL storage <backend>'[/dim]")
+        return
+
+    backend = backend.lower()
+    if backend not in BACKENDS:
+        print(f"[red]Unknown backend: {backend}. Use one of: {', '.join(BACKENDS)}[/]")
+        return
+
+    if backend == current:
+        print(f"[yellow]Already using the {backend} backend.[/]")
+        return
+
+    count = migrate_tasks(backend)
+    print(f"[bold green]Migrated {count} task(s) to {backend} storage![/] ✓")
+
+@app.command(name="daemon")
+def daemon_cmd(
+    action: Optional[str] = typer.Argument("status", help="start, stop or status")
+):
+    """Start/stop the background daemon that serves commands from a warm process."""
+    import zenith_daemon
+
+    if not zenith_daemon.supported():
+        print("[yellow]The daemon needs Unix domain sockets, which this platform doesn't support.[/]")
+        return
+
+    action = (action or "status").lower()
+    if action == "start":
+        if zenith_daemon.start():
+            print("[bold green]zenith daemon running.[/] TDL commands are now served from memory.")
+        else:
+            print("[red]The daemon did not start. Run 'python zenith_daemon.py serve' to see why.[/]")
+    elif action == "stop":
+        if zenith_daemon.stop():
+            print("[green]zenith daemon stopped.[/]")
+        else:
+            print("[yellow]The daemon is not running.[/]")
+    elif action == "status":
+        if zenith_daemon.is_running():
+            print(f"[green]zenith daemon running[/] [dim]({zenith_daemon.socket_path()})[/dim]")
+        else:
+            print("[yellow]zenith daemon not running.[/] [dim]Start it with 'TDL daemon start'.[/dim]")
+    else:
+        print(f"[red]Unknown action: {action}. Use start, stop or status.[/]")
 
 @app.command(name="settings")
 @app.command(name="st", hidden=True)
@@ -2091,6 +2171,7 @@ def settings():
             "📊 Toggle Activity Heatmap",
             "� Toggle Streak Display",
             "✨ Toggle Simplicity Mode",
+            "📦 Auto-Archive Policy",
             "�📖 View Manual",
             "🗑️  Reset All Data",
             "ℹ️  About Developer",
@@ -2179,6 +2260,27 @@ def settings():
                 import time
                 time.sleep(1)
         
+        elif "Auto-Archive" in action:
+            config = load_config()
+            days = questionary.text(
+                "Archive tasks completed more than how many days ago? (0 = never)",
+                default=str(config.get("auto_archive_days", 0))
+            ).ask()
+            keep = questionary.text(
+                "Keep at most how many completed tasks in the task list? (0 = no limit)",
+                default=str(config.get("auto_archive_keep", 0))
+            ).ask()
+            
+            if days is not None and keep is not None and days.strip().isdigit() and keep.strip().isdigit():
+                config["auto_archive_days"] = int(days)
+                config["auto_archive_keep"] = int(keep)
+                save_config(config)
+                print("[bold green]Auto-archive policy updated! (Applied with the first command of each day)[/]")
+            else:
+                print("[yellow]Policy unchanged: enter whole numbers.[/]")
+            import time
+            time.sleep(1)
+        
         elif "View Manual" in action:
             welcome()
             print("\n[dim]Press Enter to return to settings...[/dim]")
@@ -2222,47 +2324,5 @@ if __name__ == "__main__":
         run_repl()
         sys.exit(0)
     
-    # Handle shortcut: if first arg is a digit or #ID, insert 'update' command
-    elif sys.argv[1].isdigit() or sys.argv[1].startswith("#"):
-        sys.argv.insert(1, "update")
-        
-    # Handle 'add cat' shortcut
-    elif len(sys.argv) >= 3 and sys.argv[1] == "add" and sys.argv[2] == "cat":
-        sys.argv[1] = "addcat"
-        sys.argv.pop(2)
-    
-    # Handle 'cat add' shortcut (alternative syntax)
-    elif len(sys.argv) >= 3 and sys.argv[1] == "cat" and sys.argv[2] == "add":
-        sys.argv[1] = "addcat"
-        sys.argv.pop(2)
-        
-    # Handle 'goal' shortcuts
-    elif len(sys.argv) >= 2 and sys.argv[1] == "goal":
-        # TDL goal add ...
-        if len(sys.argv) >= 3:
-            sub = sys.argv[2]
-            if sub == "add":
-                sys.argv[1] = "goaladd"
-                sys.argv.pop(2)
-            elif sub == "check":
-                sys.argv[1] = "goalcheck"
-                sys.argv.pop(2)
-            elif sub == "del":
-                sys.argv[1] = "goaldel"
-                sys.argv.pop(2)
-    
-    # Handle 'rc del' shortcut
-    elif len(sys.argv) >= 3 and sys.argv[1] == "rc" and sys.argv[2] == "del":
-        sys.argv[1] = "rcdel"
-        sys.argv.pop(2)
-    
-    # Handle 'template del' shortcut
-    elif len(sys.argv) >= 3 and sys.argv[1] == "template" and sys.argv[2] == "del":
-        sys.argv[1] = "templatedel"
-        sys.argv.pop(2)
-        
-    # Handle '?' shortcut for intro
-    elif len(sys.argv) > 1 and sys.argv[1] == "?":
-        sys.argv[1] = "intro"
-    
+    sys.argv[1:] = normalize_argv(sys.argv[1:])
     app()
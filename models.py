@@ -3,31 +3,118 @@ from datetime import datetime
 from typing import Optional, List
 import uuid
 
-@dataclass
+_UNSET = object()
+
+def _new_id() -> str:
+    return str(uuid.uuid4())[:8]
+
+def _parse_datetime(value):
+    """Parse a raw ISO string stored by Task on first access."""
+    if isinstance(value, str):
+        return datetime.fromisoformat(value) if value else None
+    return value
+
+def _format_datetime(value):
+    if isinstance(value, str):
+        return value or None  # Never parsed: write back the raw ISO string
+    return value.isoformat() if value else None
+
 class Task:
-    id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
-    title: str = ""
-    category: Optional[List[str]] = None  # Now supports multiple categories
-    due_date: Optional[datetime] = None
-    completed: bool = False
-    completed_at: Optional[datetime] = None  # NEW: timestamp when task was completed
-    priority: int = 0  # -1=unimportant, 0=normal, 1=important
-    time_duration: Optional[int] = None  # Duration in seconds
-    description: Optional[str] = None  # Additional details
-    # Recurrence fields
-    recurrent: bool = False
-    recurrence_type: Optional[str] = None  # "daily", "weekdays", "weekly", "biweekly", "monthly", "custom"
-    recurrence_days: Optional[List[int]] = None  # 0=Mon, 1=Tue, ..., 6=Sun (for custom days)
-    recurrence_interval: int = 1  # Every N days/weeks/months
+    """
+    A task (or calendar event, title prefixed with 📅).
+
+    Uses __slots__ instead of a dataclass to keep large task lists compact.
+    due_date and completed_at may hold the raw ISO strings from disk; they are
+    parsed into datetimes on first access and written back untouched by
+    to_dict() if never read.
+    """
+    __slots__ = (
+        "id", "title", "category", "_due_date", "completed", "_completed_at", "priority",
+        "time_duration", "description", "recurrent", "recurrence_type", "recurrence_days",
+        "recurrence_interval"
+    )
+
+    FIELDS = (
+        "id", "title", "category", "due_date", "completed", "completed_at", "priority",
+        "time_duration", "description", "recurrent", "recurrence_type", "recurrence_days",
+        "recurrence_interval"
+    )
+
+    def __init__(
+        self,
+        id: Optional[str] = _UNSET,
+        title: str = "",
+        category: Optional[List[str]] = None,  # Now supports multiple categories
+        due_date: Optional[datetime] = None,
+        completed: bool = False,
+        completed_at: Optional[datetime] = None,  # NEW: timestamp when task was completed
+        priority: int = 0,  # -1=unimportant, 0=normal, 1=important
+        time_duration: Optional[int] = None,  # Duration in seconds
+        description: Optional[str] = None,  # Additional details
+        # Recurrence fields
+        recurrent: bool = False,
+        recurrence_type: Optional[str] = None,  # "daily", "weekdays", "weekly", "biweekly", "monthly", "custom"
+        recurrence_days: Optional[List[int]] = None,  # 0=Mon, 1=Tue, ..., 6=Sun (for custom days)
+        recurrence_interval: int = 1  # Every N days/weeks/months
+    ):
+        self.id = _new_id() if id is _UNSET else id
+        self.title = title
+        self.category = category
+        self._due_date = due_date
+        self.completed = completed
+        self._completed_at = completed_at
+        self.priority = priority
+        self.time_duration = time_duration
+        self.description = description
+        self.recurrent = recurrent
+        self.recurrence_type = recurrence_type
+        self.recurrence_days = recurrence_days
+        self.recurrence_interval = recurrence_interval
+
+    @property
+    def due_date(self) -> Optional[datetime]:
+        value = self._due_date
+        if isinstance(value, str):
+            value = self._due_date = _parse_datetime(value)
+        return value
+
+    @due_date.setter
+    def due_date(self, value: Optional[datetime]):
+        self._due_date = value
+
+    @property
+    def completed_at(self) -> Optional[datetime]:
+        value = self._completed_at
+        if isinstance(value, str):
+            value = self._completed_at = _parse_datetime(value)
+        return value
+
+    @completed_at.setter
+    def completed_at(self, value: Optional[datetime]):
+        self._completed_at = value
+
+    def _values(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.FIELDS)
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._values() == other._values()
+
+    __hash__ = None  # Mutable, compared by value (like the former dataclass)
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.FIELDS)
+        return f"Task({fields})"
 
     def to_dict(self):
         return {
             "id": self.id,
             "title": self.title,
             "category": self.category,
-            "due_date": self.due_date.isoformat() if self.due_date else None,
+            "due_date": _format_datetime(self._due_date),
             "completed": self.completed,
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "completed_at": _format_datetime(self._completed_at),
             "priority": self.priority,
             "time_duration": self.time_duration,
             "description": self.description,
@@ -44,13 +131,14 @@ class Task:
         if "important" in data and "priority" not in data:
             priority = 1 if data.get("important") else 0
         
+        # Dates stay as raw ISO strings until first accessed
         return cls(
             id=data.get("id"),
             title=data.get("title"),
             category=data.get("category"),
-            due_date=datetime.fromisoformat(data["due_date"]) if data.get("due_date") else None,
+            due_date=data.get("due_date") or None,
             completed=data.get("completed", False),
-            completed_at=datetime.fromisoformat(data["completed_at"]) if data.get("completed_at") else None,
+            completed_at=data.get("completed_at") or None,
             priority=priority,
             time_duration=data.get("time_duration"),
             description=data.get("description"),
@@ -1,7 +1,6 @@
-import json
-import os
 from datetime import datetime
 from typing import List, Optional
+import atomic_io
 
 NOTES_FILE = "notes.json"
 
@@ -27,14 +26,8 @@ class Note:
         )
 
 def load_notes() -> List[Note]:
-    if not os.path.exists(NOTES_FILE):
-        return []
-    try:
-        with open(NOTES_FILE, "r") as f:
-            data = json.load(f)
-            return [Note.from_dict(item) for item in data]
-    except (json.JSONDecodeError, IOError):
-        return []
+    data = atomic_io.read_json(NOTES_FILE, [])
+    return [Note.from_dict(item) for item in data]
 
 def save_notes(notes: List[Note]):
     # Re-index ids to ensure consistency
@@ -42,7 +35,6 @@ def save_notes(notes: List[Note]):
         note.id = i
         
     try:
-        with open(NOTES_FILE, "w") as f:
-            json.dump([n.to_dict() for n in notes], f, indent=4)
+        atomic_io.write_json(NOTES_FILE, [n.to_dict() for n in notes], indent=4)
     except IOError:
         pass
@@ -0,0 +1,222 @@
+"""
+Recurrence rules for repeating tasks.
+
+A task's rule (recurrence_type, recurrence_days, recurrence_interval) is
+compiled once into a Rule anchored on the task's due date:
+
+    daily      every `interval` days
+    weekdays   Monday to Friday (every `interval` weeks)
+    weekly     on the anchor's weekday, every `interval` weeks
+    biweekly   on the anchor's weekday, every 2 * `interval` weeks
+    monthly    on the anchor's day of month, every `interval` months
+               (clamped to shorter months)
+    custom     on the weekdays in recurrence_days, every `interval` weeks
+               (every `interval` days if no weekday was picked)
+
+Occurrences are generated lazily and keep the anchor's time of day. Every
+rule except monthly is a fixed pattern of day offsets repeating with a period
+of N days, so the first occurrence of a window is found with one division:
+expanding a month years after the anchor costs O(occurrences in the window),
+not O(periods elapsed since the anchor).
+"""
+import calendar
+from collections import deque
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from models import Task
+
+RECURRENCE_TYPES = ("daily", "weekdays", "weekly", "biweekly", "monthly", "custom")
+
+# Missed occurrences materialized when a long-overdue instance is completed
+# (older ones are dropped)
+CATCH_UP_LIMIT = 60
+
+_MAX_ORDINAL = date.max.toordinal()
+
+DAY_NAMES = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+
+
+@dataclass(frozen=True)
+class Rule:
+    """A compiled recurrence rule, anchored on the first occurrence."""
+    kind: str
+    interval: int
+    anchor: datetime
+    period: int = 0                 # Pattern length in days (0 for monthly)
+    base: int = 0                   # Ordinal the pattern is laid out from
+    offsets: Tuple[int, ...] = ()   # Days of the pattern that occur, from `base`
+
+    def _days_from(self, first: date) -> Iterator[date]:
+        """Occurrence days on or after `first` (and not before the anchor), in order."""
+        first_ordinal = max(first.toordinal(), self.anchor.toordinal())
+        if self.kind == "monthly":
+            yield from self._months_from(date.fromordinal(first_ordinal))
+            return
+
+        cycle = (first_ordinal - self.base) // self.period
+        while True:
+            start = self.base + cycle * self.period
+            for offset in self.offsets:
+                ordinal = start + offset
+                if ordinal > _MAX_ORDINAL:
+                    return
+                if ordinal >= first_ordinal:
+                    yield date.fromordinal(ordinal)
+            cycle += 1
+
+    def _months_from(self, first: date) -> Iterator[date]:
+        anchor_month = self.anchor.year * 12 + self.anchor.month - 1
+        step = max(0, (first.year * 12 + first.month - 1 - anchor_month) // self.interval)
+        while True:
+            year, month = divmod(anchor_month + step * self.interval, 12)
+            if year > date.max.year:
+                return
+            day = date(year, month + 1, min(self.anchor.day, calendar.monthrange(year, month + 1)[1]))
+            if day >= first:
+                yield day
+            step += 1
+
+    def after(self, moment: datetime) -> Iterator[datetime]:
+        """Occurrences strictly after `moment`, lazily and without end."""
+        at = self.anchor.time()
+        for day in self._days_from(moment.date()):
+            occurrence = datetime.combine(day, at)
+            if occurrence > moment:
+                yield occurrence
+
+    def between(self, start: date, end: date) -> Iterator[datetime]:
+        """Occurrences falling on the days from `start` to `end` inclusive."""
+        at = self.anchor.time()
+        for day in self._days_from(start):
+            if day > end:
+                return
+            yield datetime.combine(day, at)
+
+    def next_after(self, moment: datetime) -> Optional[datetime]:
+        return next(self.after(moment), None)
+
+
+def compile_rule(
+    kind: Optional[str],
+    anchor: datetime,
+    interval: Optional[int] = 1,
+    days: Optional[Iterable[int]] = None,
+) -> Optional[Rule]:
+    """Compile a recurrence rule, or None for an unknown type."""
+    interval = max(1, int(interval or 1))
+    weekdays = tuple(sorted({int(d) for d in days or () if 0 <= int(d) <= 6}))
+    week_start = anchor.toordinal() - anchor.weekday()
+
+    if kind == "daily" or (kind == "custom" and not weekdays):
+        return Rule(kind, interval, anchor, interval, anchor.toordinal(), (0,))
+    if kind == "weekdays":
+        return Rule(kind, interval, anchor, 7 * interval, week_start, (0, 1, 2, 3, 4))
+    if kind in ("weekly", "biweekly"):
+        weeks = interval * (2 if kind == "biweekly" else 1)
+        return Rule(kind, interval, anchor, 7 * weeks, week_start, (anchor.weekday(),))
+    if kind == "custom":
+        return Rule(kind, interval, anchor, 7 * interval, week_start, weekdays)
+    if kind == "monthly":
+        return Rule(kind, interval, anchor)
+    return None
+
+
+def task_rule(task: Task, now: Optional[datetime] = None) -> Optional[Rule]:
+    """The compiled rule of a recurring task (anchored on its due date, or `now` if undated)."""
+    if not task.recurrent or not task.recurrence_type:
+        return None
+    return compile_rule(
+        task.recurrence_type,
+        task.due_date or now or datetime.now(),
+        task.recurrence_interval,
+        task.recurrence_days,
+    )
+
+
+def describe(task: Task) -> str:
+    """Human-readable recurrence description ("" for a one-off task)."""
+    if not task.recurrent or not task.recurrence_type:
+        return ""
+
+    interval = task.recurrence_interval or 1
+    plural = "s" if interval > 1 else ""
+    kind = task.recurrence_type
+    if kind == "daily":
+        return "Daily" if interval == 1 else f"Every {interval} days"
+    if kind == "weekdays":
+        return "Weekdays" if interval == 1 else f"Weekdays, every {interval} weeks"
+    if kind == "weekly":
+        return f"Every {interval} week{plural}"
+    if kind == "biweekly":
+        return f"Every {2 * interval} weeks"
+    if kind == "monthly":
+        return f"Every {interval} month{plural}"
+    if kind == "custom" and task.recurrence_days:
+        days_str = ", ".join(DAY_NAMES[d] for d in sorted(task.recurrence_days))
+        return f"Every {days_str}" if interval == 1 else f"{days_str}, every {interval} weeks"
+    if kind == "custom":
+        return f"Every {interval} day{plural}"
+    return kind
+
+
+def catch_up(rule: Rule, since: datetime, now: datetime, limit: int = CATCH_UP_LIMIT) -> Tuple[List[datetime], Optional[datetime]]:
+    """
+    Occurrences after `since` that already fell due by `now` (the most recent
+    `limit` of them), and the first one after `now`.
+    """
+    missed = deque(maxlen=limit)
+    for occurrence in rule.after(since):
+        if occurrence > now:
+            return list(missed), occurrence
+        missed.append(occurrence)
+    return list(missed), None
+
+
+def instance(task: Task, due: datetime, recurrent: bool) -> Task:
+    """A new instance of a recurring task due at `due`."""
+    return Task(
+        title=task.title,
+        category=task.category.copy() if isinstance(task.category, list) else task.category,
+        priority=task.priority,
+        description=task.description,
+        time_duration=task.time_duration,
+        due_date=due,
+        recurrent=recurrent,
+        recurrence_type=task.recurrence_type,
+        recurrence_days=task.recurrence_days.copy() if task.recurrence_days else None,
+        recurrence_interval=task.recurrence_interval,
+    )
+
+
+def materialize(task: Task, now: Optional[datetime] = None) -> List[Task]:
+    """
+    The instances following a completed recurring task: one per occurrence
+    missed since its due date (plain tasks, already overdue) and the next
+    upcoming one, which carries the recurrence on.
+    """
+    now = now or datetime.now()
+    rule = task_rule(task, now)
+    if rule is None:
+        return []
+    missed, upcoming = catch_up(rule, rule.anchor, now)
+    instances = [instance(task, due, recurrent=False) for due in missed]
+    if upcoming is not None:
+        instances.append(instance(task, upcoming, recurrent=True))
+    return instances
+
+
+def previews(tasks: Iterable[Task], start: date, end: date) -> Iterator[Tuple[datetime, Task]]:
+    """
+    Occurrences of open recurring tasks between `start` and `end` (starting
+    with each task's own due date), as (when, task) pairs.
+    """
+    for task in tasks:
+        if task.completed or not task.recurrent or not task.due_date:
+            continue
+        rule = task_rule(task)
+        if rule is None:
+            continue
+        for occurrence in rule.between(start, end):
+            yield occurrence, task
@@ -3,11 +3,13 @@ TDL Interactive REPL (Read-Eval-Print Loop)
 ============================================
 Provides an interactive shell experience for TDL.
 Type 'TDL' to enter, then use commands directly without the 'TDL' prefix.
+
+Commands run inside the REPL process: the Typer app, its imports and the loaded
+task data stay warm between commands. storage.py re-reads the task files only
+when their size/mtime changed, so edits made outside the REPL still show up.
 """
 
-import sys
 import os
-import subprocess
 import shlex
 from rich.console import Console
 from rich.prompt import Prompt
@@ -85,6 +87,7 @@ def show_quick_help():
   [green]cat[/green]             - List categories
   [green]cat add "Work"[/green]  - Add category
   [green]calendar[/green]        - View calendar
+  [green]search milk[/green]     - Search tasks, history, notes
   [green]stat[/green]            - View statistics
   [green]settings[/green]        - App settings
   [green]welcome[/green]         - Show full help
@@ -120,16 +123,7 @@ def execute_command(cmd_line: str) -> bool:
         show_quick_help()
         return True
     
-    if lower_cmd == 'welcome':
-        # Run welcome command
-        try:
-            subprocess.run([sys.executable, 'main.py', 'welcome'], 
-                          cwd=os.path.dirname(os.path.abspath(__file__)) or '.')
-        except Exception as e:
-            console.print(f"[red]Error: {e}[/red]")
-        return True
-    
-    # Parse command and execute via main.py
+    # Parse command and execute it in-process
     try:
         # Split command line respecting quotes
         parts = shlex.split(cmd_line)
@@ -137,12 +131,7 @@ def execute_command(cmd_line: str) -> bool:
         if not parts:
             return True
         
-        # Build full command
-        script_dir = os.path.dirname(os.path.abspath(__file__)) or '.'
-        full_cmd = [sys.executable, os.path.join(script_dir, 'main.py')] + parts
-        
-        # Execute
-        result = subprocess.run(full_cmd, cwd=script_dir)
+        dispatch(parts)
         
         # Add spacing after command output
         console.print()
@@ -155,8 +144,30 @@ def execute_command(cmd_line: str) -> bool:
     return True
 
 
+def dispatch(parts: list) -> int:
+    """
+    Run one TDL command (argv without the 'TDL' prefix) through the Typer app
+    in this process. Returns the command's exit code.
+    """
+    from main import app, normalize_argv
+    try:
+        app(args=normalize_argv(parts), prog_name="TDL")
+    except SystemExit as e:
+        # Typer exits after every command (and on usage errors / typer.Exit)
+        return e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    return 0
+
+
 def run_repl():
     """Main REPL loop."""
+    global console
+    # Commands work on the data next to main.py, as when each one ran in its own process
+    os.chdir(os.path.dirname(os.path.abspath(__file__)) or '.')
+    
+    # Load the app once and share its console
+    import main
+    console = main.console
+    
     # Show initial welcome with ASCII header
     show_repl_welcome()
     
@@ -167,7 +178,7 @@ def run_repl():
             prompt_text = get_prompt_style()
             
             # Read input
-            cmd = Prompt.ask(prompt_text)
+            cmd = Prompt.ask(prompt_text, console=console)
             
             # Execute
             if not execute_command(cmd):
@@ -0,0 +1,115 @@
+"""
+Daily rollup of the archived history, for statistics and heatmaps.
+
+Layout (history/rollup.json):
+    {"tasks": 1234,                         -> archived tasks covered (matches the manifest)
+     "days": {"2026-01-05": {"count": 3, "seconds": 5400,
+                             "categories": {"Work": [2, 3600], ...}}, ...},
+     "longest": {...Task.to_dict()...}}     -> longest completed task, or null
+
+history_storage updates it with every append, in the same commit as the
+segments, so reading it costs O(days) instead of a scan of every segment.
+If its task count doesn't match the manifest (e.g. it was deleted or an
+older version wrote the history) it is rebuilt from the segments.
+"""
+import os
+from datetime import date
+from typing import Dict, Iterable, List, Optional
+
+from models import Task
+from task_table import completed_ordinal
+import atomic_io
+
+ROLLUP_FILE = os.path.join("history", "rollup.json")
+
+
+def category_names(task: Task) -> List[str]:
+    """Categories a task is counted under ("General" if it has none)."""
+    category = task.category
+    if isinstance(category, list):
+        return category or ["General"]
+    return [category or "General"]
+
+
+def _empty() -> Dict:
+    return {"tasks": 0, "days": {}, "longest": None}
+
+
+def _read() -> Optional[Dict]:
+    rollup = atomic_io.read_json(ROLLUP_FILE, None)
+    if not isinstance(rollup, dict) or not isinstance(rollup.get("days"), dict):
+        return None
+    return rollup
+
+
+def _add(rollup: Dict, tasks: Iterable[Task]):
+    days = rollup["days"]
+    longest = rollup.get("longest")
+    longest_duration = (longest or {}).get("time_duration") or 0
+    for task in tasks:
+        rollup["tasks"] += 1
+        if not task.completed:
+            continue
+        duration = task.time_duration or 0
+        if duration > longest_duration:
+            longest, longest_duration = task.to_dict(), duration
+        ordinal = completed_ordinal(task)
+        if not ordinal:
+            continue
+        day = date.fromordinal(ordinal).isoformat()
+        entry = days.get(day)
+        if entry is None:
+            entry = days[day] = {"count": 0, "seconds": 0, "categories": {}}
+        entry["count"] += 1
+        entry["seconds"] += duration
+        for name in category_names(task):
+            totals = entry["categories"].setdefault(name, [0, 0])
+            totals[0] += 1
+            totals[1] += duration
+    rollup["longest"] = longest
+
+
+def record(tasks: List[Task], previous_count: int):
+    """
+    Add newly archived tasks (history held `previous_count` tasks before them).
+
+    A rollup that wasn't in step with the history is dropped instead, so the
+    next load_rollup() rebuilds it.
+    """
+    rollup = _read()
+    if rollup is None:
+        if previous_count:
+            return  # Missing: rebuilt on next use
+        rollup = _empty()
+    elif rollup.get("tasks") != previous_count:
+        atomic_io.remove(ROLLUP_FILE)
+        return
+    _add(rollup, tasks)
+    atomic_io.write_json(ROLLUP_FILE, rollup, indent=None)
+
+
+def reset():
+    """Empty the rollup (the history was replaced)."""
+    os.makedirs(os.path.dirname(ROLLUP_FILE), exist_ok=True)
+    atomic_io.write_json(ROLLUP_FILE, _empty(), indent=None)
+
+
+def rebuild() -> Dict:
+    """Recompute the rollup from every history segment and save it."""
+    from history_storage import list_segments, load_segment
+    rollup = _empty()
+    for key in list_segments():
+        _add(rollup, load_segment(key))
+    os.makedirs(os.path.dirname(ROLLUP_FILE), exist_ok=True)
+    atomic_io.write_json(ROLLUP_FILE, rollup, indent=None)
+    return rollup
+
+
+def load_rollup() -> Dict:
+    """The rollup for the current history, rebuilt first if it is missing or out of step."""
+    from history_storage import count_history
+    expected = count_history()
+    rollup = _read()
+    if rollup is None or rollup.get("tasks") != expected:
+        rollup = rebuild()
+    return rollup
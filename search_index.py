@@ -0,0 +1,444 @@
+"""
+Full-text search over tasks, archived history, notes and goals.
+
+search_index.db holds one row per searchable item in `refs` and an SQLite
+FTS5 index over them (`docs`, an external-content table reading its text from
+`refs`, so the text is stored once):
+
+    refs(rowid, kind, ref, title, category, body, stamp, done)
+        kind: "task" (ref = task id) | "history" (ref = "<segment>:<byte offset>")
+              | "note" (ref = position) | "goal" (ref = goal id)
+        title: task / goal title or note text; body: task description
+
+Each source is kept up to date in its own way, so a search only reads what
+changed since the last one:
+
+    tasks    storage.py reports every write with record_changes(); the changed
+             rows are appended to search_index.log after the commit, chained
+             on the data versions around the write (as for display_index).
+             A search applies the records appended since the byte offset it
+             last read up to that chain on from the indexed version; the log
+             is never truncated under a writer. If the chain is broken (the
+             files were rewritten or edited behind its back, or the log was
+             dropped for size) the active tasks are re-indexed.
+    history  segments are append-only: the byte offset indexed in each one is
+             kept, and only lines appended after it are read. A segment that
+             shrank or starts differently (history reset) is re-indexed.
+    notes, goals  small files rewritten on save: re-indexed when their size
+             or mtime change.
+
+Queries: a word matches that token, `word*` any token starting with it and
+"quoted words" that phrase; every term must match. Results are ranked with
+bm25, weighting titles over categories over descriptions.
+"""
+import json
+import os
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from lazy_imports import lazy_module
+import atomic_io
+
+sqlite3 = lazy_module("sqlite3")
+
+DB_FILE = "search_index.db"
+LOG_FILE = "search_index.log"
+
+# Past this size nobody is searching: drop the log, re-index tasks on next search
+MAX_LOG_BYTES = 1024 * 1024
+
+KINDS = ("task", "history", "note", "goal")
+
+# Row fields a task document is built from (logged for upserts)
+DOC_FIELDS = ("id", "title", "category", "description", "due_date", "completed", "completed_at")
+
+# bm25 column weights: title, category, body
+RANK_WEIGHTS = (10.0, 4.0, 1.0)
+
+# Marks around matched words in SearchHit.marked
+MATCH_START, MATCH_END = "\x01", "\x02"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS refs (
+    rowid INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    ref TEXT NOT NULL,
+    title TEXT,
+    category TEXT,
+    body TEXT,
+    stamp TEXT,
+    done INTEGER NOT NULL DEFAULT 0
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_refs_kind_ref ON refs(kind, ref);
+CREATE VIRTUAL TABLE IF NOT EXISTS docs USING fts5(
+    title, category, body,
+    content = 'refs', content_rowid = 'rowid',
+    tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3'
+);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+_conn = None
+_conn_path = None
+
+# Changes recorded in the current deferred_writes() block, logged on commit:
+# {"from": version before the block, "ops": [["u", row] | ["d", task_id], ...]}
+_pending = None
+
+
+@dataclass
+class SearchHit:
+    kind: str
+    ref: str
+    title: str
+    marked: str  # Title with matches wrapped in MATCH_START / MATCH_END
+    category: str
+    stamp: str
+    done: bool
+
+
+# --- Connection ---
+
+def get_connection():
+    """
+    Open (once per process) the search database, creating the schema if needed.
+
+    Raises:
+        RuntimeError: This Python's SQLite was built without FTS5
+    """
+    global _conn, _conn_path
+    # Keyed on the absolute path: the daemon serves several data directories
+    path = os.path.abspath(DB_FILE)
+    if _conn is None or _conn_path != path:
+        close()
+        conn = sqlite3.connect(path)
+        try:
+            conn.executescript(SCHEMA)
+        except sqlite3.OperationalError as e:
+            conn.close()
+            raise RuntimeError(f"Search needs SQLite with FTS5 ({e})") from e
+        _conn, _conn_path = conn, path
+    return _conn
+
+
+def close():
+    """Close the cached connection (used by tests and rebuilds)."""
+    global _conn, _conn_path
+    if _conn is not None:
+        _conn.close()
+    _conn = None
+    _conn_path = None
+
+
+def _get_meta(conn, key: str, default=None):
+    row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+    return json.loads(row[0]) if row else default
+
+
+def _set_meta(conn, key: str, value):
+    conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, json.dumps(value)))
+
+
+# --- Documents ---
+
+def _category_text(category) -> str:
+    if isinstance(category, list):
+        return " ".join(c for c in category if c)
+    return category or ""
+
+
+def _task_doc(kind: str, ref: str, row: Dict) -> tuple:
+    stamp = row.get("completed_at") if row.get("completed") else row.get("due_date")
+    return (kind, ref, row.get("title") or "", _category_text(row.get("category")),
+            row.get("description") or "", (stamp or "")[:16], int(bool(row.get("completed"))))
+
+
+def _add(conn, docs: Iterable[tuple]):
+    """Insert (kind, ref, title, category, body, stamp, done) documents and index them."""
+    start = conn.execute("SELECT COALESCE(MAX(rowid), 0) FROM refs").fetchone()[0]
+    conn.executemany(
+        "INSERT INTO refs (kind, ref, title, category, body, stamp, done) VALUES (?, ?, ?, ?, ?, ?, ?)", docs
+    )
+    conn.execute(
+        "INSERT INTO docs (rowid, title, category, body) "
+        "SELECT rowid, title, category, body FROM refs WHERE rowid > ?", (start,)
+    )
+
+
+def _remove(conn, kind: str, refs: Optional[Iterable[str]] = None, prefix: Optional[str] = None):
+    """Drop documents of a kind: the given refs, the refs starting with `prefix`, or all."""
+    if refs is not None:
+        where, params = "kind = ? AND ref = ?", [(kind, ref) for ref in refs]
+    elif prefix is not None:
+        # Refs of one segment: a range on the (kind, ref) index
+        where, params = "kind = ? AND ref >= ? AND ref < ?", [(kind, prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1))]
+    else:
+        where, params = "kind = ?", [(kind,)]
+    conn.executemany(
+        "INSERT INTO docs (docs, rowid, title, category, body) "
+        f"SELECT 'delete', rowid, title, category, body FROM refs WHERE {where}", params
+    )
+    conn.executemany(f"DELETE FROM refs WHERE {where}", params)
+
+
+# --- Change log (active tasks) ---
+
+def _data_version() -> str:
+    from storage import data_version
+    return data_version()
+
+
+def record_changes(version: str, upserts: Iterable[Dict] = (), deletes: Iterable[str] = ()):
+    """
+    Report a task storage write so the index can follow it.
+
+    Args:
+        version: storage.data_version() from just before the write
+        upserts: Added or changed rows (Task.to_dict() format)
+        deletes: Ids of removed tasks
+
+    Nothing is recorded until a first search created the index.
+    """
+    global _pending
+    if not os.path.exists(DB_FILE):
+        return
+    ops = [["d", task_id] for task_id in deletes]
+    ops += [["u", {field: row.get(field) for field in DOC_FIELDS}] for row in upserts]
+    if not ops:
+        return
+    if _pending is None:
+        _pending = {"from": version, "ops": []}
+    _pending["ops"].extend(ops)
+    atomic_io.on_rollback(_discard_pending)
+    atomic_io.after_commit(_log_pending)
+
+
+def _discard_pending():
+    global _pending
+    _pending = None
+
+
+def _log_pending():
+    """Append the committed changes to the log, chained to the versions around them."""
+    global _pending
+    record, _pending = _pending, None
+    if record is None:
+        return
+    record["to"] = _data_version()
+    if atomic_io.getsize(LOG_FILE) >= MAX_LOG_BYTES:
+        atomic_io.remove(LOG_FILE)
+        return
+    atomic_io.append_text(LOG_FILE, json.dumps(record, separators=(",", ":")) + "\n")
+
+
+def _read_log(offset: int) -> Tuple[List[Dict], int]:
+    """Records appended from byte `offset` on, and the offset they end at (a torn line is left)."""
+    if not atomic_io.exists(LOG_FILE):
+        return [], 0
+    with open(LOG_FILE, "rb") as f:
+        f.seek(offset)
+        data = f.read()
+    end = data.rfind(b"\n") + 1
+    records = []
+    for line in data[:end].splitlines():
+        try:
+            records.append(json.loads(line))
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            continue
+    return records, offset + end
+
+
+# --- Catching up ---
+
+def _refresh_tasks(conn):
+    """
+    Bring active tasks up to date from the log lines appended since the last
+    search. The log is only ever appended to here; whoever writes it drops it
+    past MAX_LOG_BYTES, which breaks the chain and re-indexes the tasks.
+    """
+    version = _get_meta(conn, "tasks_version")
+    offset, head = _get_meta(conn, "log", (0, ""))
+    if offset and (atomic_io.getsize(LOG_FILE) < offset or _first_line(LOG_FILE) != head):
+        offset = 0  # Dropped and started again since
+    records, end = _read_log(offset)
+    ops = []
+    for record in records:
+        if record.get("from") == version:
+            ops.extend(record.get("ops", []))
+            version = record.get("to")
+    current = _data_version()
+
+    if version != current:
+        from storage import find_tasks
+        _remove(conn, "task")
+        _add(conn, (_task_doc("task", task.id, task.to_dict()) for task in find_tasks()))
+    else:
+        # Last change per task wins
+        changes = {}
+        for kind, value in ops:
+            task_id = value if kind == "d" else value.get("id")
+            changes[task_id] = None if kind == "d" else value
+        if changes:
+            _remove(conn, "task", changes)
+            _add(conn, (_task_doc("task", task_id, row) for task_id, row in changes.items() if row is not None))
+    _set_meta(conn, "tasks_version", current)
+    _set_meta(conn, "log", [end, head if offset else _first_line(LOG_FILE)])
+
+
+def _first_line(path: str) -> str:
+    """A log or segment's first line: tells a file started again from the one indexed."""
+    try:
+        with open(path, "rb") as f:
+            return f.readline(4096).decode("utf-8", "replace")
+    except OSError:
+        return ""
+
+
+def _refresh_history(conn):
+    """Index the lines appended to history segments since the last search."""
+    import history_storage
+    indexed = _get_meta(conn, "history_segments", {})  # key -> [byte offset, first line]
+    segments = history_storage.load_manifest()["segments"]
+
+    for key in list(indexed):
+        if key not in segments:
+            _remove(conn, "history", prefix=f"{key}:")
+            del indexed[key]
+
+    for key in segments:
+        path = os.path.join(history_storage.HISTORY_DIR, f"{key}.jsonl")
+        size = atomic_io.getsize(path)
+        offset, head = indexed.get(key, (0, ""))
+        if offset and (size < offset or _first_line(path) != head):
+            _remove(conn, "history", prefix=f"{key}:")  # Rewritten since: start over
+            offset = 0
+        if size == offset:
+            continue
+        records, end = history_storage.tail_segment(key, offset)
+        _add(conn, (_task_doc("history", f"{key}:{position}", row) for position, row in records))
+        indexed[key] = [end, head if offset else _first_line(path)]
+
+    _set_meta(conn, "history_segments", indexed)
+
+
+def _file_stamp(path: str) -> Optional[List[int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def _refresh_small(conn, kind: str, path: str):
+    """Re-index notes or goals when their file changed."""
+    stamp = _file_stamp(path)
+    if _get_meta(conn, f"{kind}_stamp") == stamp:
+        return
+    _remove(conn, kind)
+    items = atomic_io.read_json(path, []) if stamp else []
+    docs = []
+    for position, item in enumerate(items if isinstance(items, list) else [], 1):
+        if not isinstance(item, dict):
+            continue
+        if kind == "note":
+            docs.append((kind, str(position), item.get("content") or "", "", "", (item.get("created_at") or "")[:16], 0))
+        else:
+            stamp_text = item.get("completed_date") if item.get("completed") else item.get("created_date")
+            docs.append((kind, str(item.get("id")), item.get("title") or "", "", "", (stamp_text or "")[:16],
+                         int(bool(item.get("completed")))))
+    _add(conn, docs)
+    _set_meta(conn, f"{kind}_stamp", stamp)
+
+
+def refresh():
+    """Bring the index up to date with every source (building it on first use)."""
+    from goals_storage import GOALS_FILE
+    from notes_storage import NOTES_FILE
+
+    conn = get_connection()
+    with conn:
+        _refresh_tasks(conn)
+        _refresh_history(conn)
+        _refresh_small(conn, "note", NOTES_FILE)
+        _refresh_small(conn, "goal", GOALS_FILE)
+
+
+def rebuild():
+    """Drop the index and build it again from scratch."""
+    close()
+    for path in (DB_FILE, LOG_FILE):
+        if os.path.exists(path):
+            os.remove(path)
+    refresh()
+
+
+def count() -> int:
+    """Number of indexed items."""
+    return get_connection().execute("SELECT COUNT(*) FROM refs").fetchone()[0]
+
+
+# --- Queries ---
+
+_TERM = re.compile(r'"([^"]*)"?|(\S+)')
+_TOKEN = re.compile(r"[^\W_]+")
+
+
+def to_match(query: str) -> str:
+    """
+    Translate a search query into an FTS5 MATCH expression.
+
+    Raises:
+        ValueError: The query has no words
+    """
+    terms = []
+    for phrase, word in _TERM.findall(query):
+        if phrase:
+            tokens = _TOKEN.findall(phrase)
+            if tokens:
+                terms.append('"' + " ".join(tokens) + '"')
+            continue
+        tokens = _TOKEN.findall(word)
+        if not tokens:
+            continue
+        terms.extend(f'"{token}"' for token in tokens[:-1])
+        terms.append(f'"{tokens[-1]}"' + ("*" if word.endswith("*") else ""))
+    if not terms:
+        raise ValueError("Nothing to search for")
+    return " ".join(terms)
+
+
+def search(query: str, kinds: Optional[Sequence[str]] = None, limit: int = 20) -> Tuple[List[SearchHit], int]:
+    """
+    Find items matching a query, best first.
+
+    Args:
+        kinds: Restrict to these kinds (see KINDS)
+        limit: Maximum number of hits returned
+
+    Returns:
+        (hits, total number of matches)
+
+    Raises:
+        ValueError: The query has no words
+    """
+    match = to_match(query)
+    refresh()
+    conn = get_connection()
+    where = "docs MATCH ?"
+    params: list = [match]
+    if kinds:
+        where += f" AND refs.kind IN ({', '.join('?' for _ in kinds)})"
+        params.extend(kinds)
+    total = conn.execute(f"SELECT COUNT(*) FROM docs JOIN refs ON refs.rowid = docs.rowid WHERE {where}",
+                         params).fetchone()[0]
+    rows = conn.execute(
+        "SELECT refs.kind, refs.ref, refs.title, "
+        f"highlight(docs, 0, '{MATCH_START}', '{MATCH_END}'), refs.category, refs.stamp, refs.done "
+        f"FROM docs JOIN refs ON refs.rowid = docs.rowid WHERE {where} "
+        f"ORDER BY bm25(docs, {', '.join(str(w) for w in RANK_WEIGHTS)}) LIMIT ?",
+        params + [limit],
+    ).fetchall()
+    hits = [SearchHit(kind, ref, title, marked, category or "", stamp or "", bool(done))
+            for kind, ref, title, marked, category, stamp, done in rows]
+    return hits, total
@@ -0,0 +1,182 @@
+"""
+SQLite backend for task storage.
+
+Tasks are stored one row per task so commands only write the rows they change.
+Rows are exchanged with storage.py as plain dicts in Task.to_dict() format.
+"""
+import json
+import os
+import sqlite3
+from typing import Dict, Iterable, List, Optional
+
+DB_FILE = "tasks.db"
+
+COLUMNS = [
+    "id", "title", "category", "due_date", "completed", "completed_at", "priority",
+    "time_duration", "description", "recurrent", "recurrence_type", "recurrence_days",
+    "recurrence_interval"
+]
+
+# Columns holding lists, stored as JSON text
+JSON_COLUMNS = ("category", "recurrence_days")
+BOOL_COLUMNS = ("completed", "recurrent")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL UNIQUE,
+    title TEXT,
+    category TEXT,
+    due_date TEXT,
+    completed INTEGER NOT NULL DEFAULT 0,
+    completed_at TEXT,
+    priority INTEGER NOT NULL DEFAULT 0,
+    time_duration INTEGER,
+    description TEXT,
+    recurrent INTEGER NOT NULL DEFAULT 0,
+    recurrence_type TEXT,
+    recurrence_days TEXT,
+    recurrence_interval INTEGER NOT NULL DEFAULT 1
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_due_date ON tasks(due_date);
+CREATE INDEX IF NOT EXISTS idx_tasks_completed ON tasks(completed);
+CREATE INDEX IF NOT EXISTS idx_tasks_recurrent ON tasks(recurrent);
+"""
+
+_conn = None
+_conn_path = None
+
+
+def exists() -> bool:
+    """Check whether the database file has been created yet."""
+    return os.path.exists(DB_FILE)
+
+
+def get_connection() -> sqlite3.Connection:
+    """Open (once per process) the task database, creating the schema if needed."""
+    global _conn, _conn_path
+    # Keyed on the absolute path: the daemon serves several data directories
+    path = os.path.abspath(DB_FILE)
+    if _conn is None or _conn_path != path:
+        if _conn is not None:
+            _conn.close()
+        _conn = sqlite3.connect(path)
+        _conn.executescript(SCHEMA)
+        _conn_path = path
+    return _conn
+
+
+def close():
+    """Close the cached connection (used by tests and migrations)."""
+    global _conn, _conn_path
+    if _conn is not None:
+        _conn.close()
+    _conn = None
+    _conn_path = None
+
+
+def _to_row(data: Dict) -> tuple:
+    values = []
+    for col in COLUMNS:
+        value = data.get(col)
+        if col in JSON_COLUMNS:
+            value = json.dumps(value) if value is not None else None
+        elif col in BOOL_COLUMNS:
+            value = 1 if value else 0
+        elif col == "priority" and value is None:
+            value = 0
+        elif col == "recurrence_interval" and value is None:
+            value = 1
+        values.append(value)
+    return tuple(values)
+
+
+def _from_row(row: tuple) -> Dict:
+    data = {}
+    for col, value in zip(COLUMNS, row):
+        if col in JSON_COLUMNS:
+            value = json.loads(value) if value is not None else None
+        elif col in BOOL_COLUMNS:
+            value = bool(value)
+        data[col] = value
+    return data
+
+
+def load_rows(
+    completed: Optional[bool] = None,
+    recurrent: Optional[bool] = None,
+    due_from: Optional[str] = None,
+    due_to: Optional[str] = None
+) -> List[Dict]:
+    """
+    Load task rows in insertion order, optionally filtered on indexed columns.
+
+    Args:
+        completed: Only completed (True) or pending (False) tasks
+        recurrent: Only recurring (True) or one-off (False) tasks
+        due_from: Inclusive ISO lower bound on due_date
+        due_to: Exclusive ISO upper bound on due_date
+    """
+    clauses = []
+    params = []
+    if completed is not None:
+        clauses.append("completed = ?")
+        params.append(1 if completed else 0)
+    if recurrent is not None:
+        clauses.append("recurrent = ?")
+        params.append(1 if recurrent else 0)
+    if due_from is not None:
+        clauses.append("due_date >= ?")
+        params.append(due_from)
+    if due_to is not None:
+        clauses.append("due_date < ?")
+        params.append(due_to)
+
+    sql = f"SELECT {', '.join(COLUMNS)} FROM tasks"
+    if clauses:
+        sql += " WHERE " + " AND ".join(clauses)
+    sql += " ORDER BY seq"
+
+    return [_from_row(row) for row in get_connection().execute(sql, params)]
+
+
+def upsert_rows(rows: Iterable[Dict]):
+    """Insert new rows or update existing ones in place (keeps their position)."""
+    apply_changes(list(rows), [])
+
+
+def delete_rows(ids: Iterable[str]):
+    """Delete rows by task id."""
+    apply_changes([], list(ids))
+
+
+def apply_changes(upserts: List[Dict], deletes: List[str]):
+    """Apply a diff (changed rows + removed ids) in a single transaction."""
+    conn = get_connection()
+    placeholders = ", ".join("?" for _ in COLUMNS)
+    updates = ", ".join(f"{col} = excluded.{col}" for col in COLUMNS if col != "id")
+    with conn:
+        if deletes:
+            conn.executemany("DELETE FROM tasks WHERE id = ?", [(i,) for i in deletes])
+        if upserts:
+            conn.executemany(
+                f"INSERT INTO tasks ({', '.join(COLUMNS)}) VALUES ({placeholders}) "
+                f"ON CONFLICT(id) DO UPDATE SET {updates}",
+                [_to_row(r) for r in upserts]
+            )
+
+
+def replace_all(rows: List[Dict]):
+    """Replace the whole table (used for migrations and full resets)."""
+    conn = get_connection()
+    placeholders = ", ".join("?" for _ in COLUMNS)
+    with conn:
+        conn.execute("DELETE FROM tasks")
+        conn.executemany(
+            f"INSERT OR REPLACE INTO tasks ({', '.join(COLUMNS)}) VALUES ({placeholders})",
+            [_to_row(r) for r in rows]
+        )
+
+
+def count_rows() -> int:
+    return get_connection().execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
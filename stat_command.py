@@ -1,45 +1,52 @@
 """
 Statistics command for TDL - Display task completion statistics
 """
-from history_storage import load_history
-from stats_calculator import (
-    calculate_daily_time,
-    calculate_daily_task_count,
-    find_longest_day,
-    find_most_productive_day,
-    find_longest_task,
-    get_date_range
-)
+from datetime import date, datetime, timedelta
+from typing import Optional
+from history_storage import count_history
+from rollup_storage import load_rollup, rebuild
+from stats_calculator import aggregate_rollup
 from ui_stats import render_statistics
 
 
-def stat():
-    """Display task completion statistics with 30-day chart and metrics."""
-    # Load history
-    history = load_history()
-    
-    if not history:
+def stat(
+    days: int = 30,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    by_category: bool = False,
+    by_weekday: bool = False,
+    rebuild_rollup: bool = False,
+):
+    """
+    Display task completion statistics with a time chart and metrics.
+
+    Args:
+        days: Window length ending at `end` (ignored when `start` is given)
+        start: First day of the window
+        end: Last day of the window (default today)
+        by_category: Break the window down by category
+        by_weekday: Break the window down by weekday
+        rebuild_rollup: Recompute the daily rollup from the whole history first
+    """
+    if not count_history():
         print("[yellow]No task history found yet![/]")
         print("[dim]Complete some tasks to see statistics.[/dim]")
         return
-    
-    # Calculate statistics
-    daily_time = calculate_daily_time(history, days=30)
-    daily_count = calculate_daily_task_count(history, days=30)
-    longest_day = find_longest_day(daily_time)
-    most_productive_day = find_most_productive_day(daily_count)
-    longest_task = find_longest_task(history)
-    date_range = get_date_range(days=30)
-    
-    # Render visualization
-    render_statistics(
-        daily_time,
-        daily_count,
-        longest_day,
-        most_productive_day,
-        longest_task,
-        date_range
-    )
+
+    end = end or datetime.now().date()
+    start = start or end - timedelta(days=days - 1)
+    if start > end:
+        print("[red]The start date must not be after the end date.[/]")
+        return
+
+    # Per-day totals come from the rollup: no history segment is read
+    if rebuild_rollup:
+        rollup = rebuild()
+        print(f"[dim]Rebuilt the daily rollup from {rollup['tasks']} archived tasks.[/dim]")
+    else:
+        rollup = load_rollup()
+    summary = aggregate_rollup(rollup, start=start, end=end, by_category=by_category, by_weekday=by_weekday)
+    render_statistics(summary)
 
 
 # Export for main.py integration
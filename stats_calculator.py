@@ -2,10 +2,16 @@
 Statistics Calculator for TDL
 Calculates task completion statistics from history data
 """
-from datetime import datetime, timedelta
-from typing import List, Dict, Tuple, Optional
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Iterable, List, Dict, Tuple, Optional
 from collections import defaultdict
 from models import Task
+from task_table import completed_ordinal
+from rollup_storage import category_names
+from activity_kernels import chunk_sums, day_series, weekday_totals
+
+WEEKDAY_NAMES = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
 
 
 def calculate_daily_time(history: List[Task], days: int = 30) -> Dict[str, int]:
@@ -160,3 +166,163 @@ def get_date_range(days: int = 30) -> List[str]:
         date_range.append(date.isoformat())
     
     return date_range
+
+
+@dataclass
+class StatsSummary:
+    """Everything `TDL stat` shows for one window [start, end], from aggregate()."""
+    start: date
+    end: date
+    daily_time: Dict[str, int] = field(default_factory=dict)    # date -> seconds (days with time only)
+    daily_count: Dict[str, int] = field(default_factory=dict)   # date -> tasks (days with tasks only)
+    longest_task: Optional[Tuple[Task, int]] = None             # Over all given history, not just the window
+    by_category: Optional[Dict[str, List[int]]] = None          # category -> [tasks, seconds]
+    by_weekday: Optional[List[List[int]]] = None                # Mon..Sun -> [tasks, seconds]
+
+    @property
+    def days(self) -> int:
+        return (self.end - self.start).days + 1
+
+    @property
+    def date_range(self) -> List[str]:
+        """Date strings of the window, oldest to newest."""
+        first = self.start.toordinal()
+        return [date.fromordinal(first + i).isoformat() for i in range(self.days)]
+
+    @property
+    def total_tasks(self) -> int:
+        return sum(self.daily_count.values())
+
+    @property
+    def total_time(self) -> int:
+        return sum(self.daily_time.values())
+
+    @property
+    def longest_day(self) -> Optional[Tuple[str, int]]:
+        return find_longest_day(self.daily_time)
+
+    @property
+    def most_productive_day(self) -> Optional[Tuple[str, int]]:
+        return find_most_productive_day(self.daily_count)
+
+    def chart_bars(self, max_bars: int = 31) -> List[Tuple[str, int]]:
+        """
+        (first date, seconds) per chart bar: one bar per day, or per run of
+        days when the window is longer than max_bars days.
+        """
+        span = -(-self.days // max_bars)
+        dates = self.date_range
+        sums = chunk_sums([self.daily_time.get(day, 0) for day in dates], span)
+        return list(zip(dates[::span], sums))
+
+
+def aggregate(
+    history: Iterable[Task],
+    days: int = 30,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    by_category: bool = False,
+    by_weekday: bool = False,
+) -> StatsSummary:
+    """
+    Compute all statistics for a window in a single pass over the history.
+
+    Args:
+        history: Archived tasks
+        days: Window length ending at `end` (ignored when `start` is given)
+        start: First day of the window (inclusive)
+        end: Last day of the window (inclusive, default today)
+        by_category: Also total tasks and time per category
+        by_weekday: Also total tasks and time per weekday
+
+    Returns:
+        StatsSummary (the longest task is searched over the whole history)
+    """
+    end = end or datetime.now().date()
+    start = start or end - timedelta(days=days - 1)
+    low, high = start.toordinal(), end.toordinal()
+    counts = [0] * max(0, high - low + 1)
+    seconds = [0] * len(counts)
+    categories: Dict[str, List[int]] = {}
+    weekdays = [[0, 0] for _ in range(7)]
+    longest, longest_duration = None, 0
+    
+    for task in history:
+        if not task.completed:
+            continue
+        duration = task.time_duration or 0
+        if duration > longest_duration:
+            longest, longest_duration = task, duration
+        
+        ordinal = completed_ordinal(task)
+        if not low <= ordinal <= high:
+            continue
+        counts[ordinal - low] += 1
+        seconds[ordinal - low] += duration
+        
+        if by_category:
+            for name in category_names(task):
+                totals = categories.get(name)
+                if totals is None:
+                    totals = categories[name] = [0, 0]
+                totals[0] += 1
+                totals[1] += duration
+        if by_weekday:
+            totals = weekdays[(ordinal + 6) % 7]  # Ordinal 1 (0001-01-01) is a Monday
+            totals[0] += 1
+            totals[1] += duration
+    
+    summary = StatsSummary(start, end, longest_task=(longest, longest_duration) if longest else None)
+    for offset, count in enumerate(counts):
+        if count:
+            day = date.fromordinal(low + offset).isoformat()
+            summary.daily_count[day] = count
+            if seconds[offset]:
+                summary.daily_time[day] = seconds[offset]
+    if by_category:
+        summary.by_category = categories
+    if by_weekday:
+        summary.by_weekday = weekdays
+    return summary
+
+
+def aggregate_rollup(
+    rollup: Dict,
+    days: int = 30,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    by_category: bool = False,
+    by_weekday: bool = False,
+) -> StatsSummary:
+    """
+    Same result as aggregate(), read from the daily rollup (rollup_storage)
+    in O(days in the window) instead of a pass over the history.
+    """
+    end = end or datetime.now().date()
+    start = start or end - timedelta(days=days - 1)
+    longest = rollup.get("longest")
+    summary = StatsSummary(
+        start, end,
+        longest_task=(Task.from_dict(longest), longest["time_duration"]) if longest else None,
+        by_category={} if by_category else None,
+        by_weekday=[[0, 0] for _ in range(7)] if by_weekday else None,
+    )
+    
+    daily = rollup["days"]
+    counts, seconds = day_series(daily, start, end)
+    first = start.toordinal()
+    for offset, count in enumerate(counts):
+        if not count:
+            continue
+        day = date.fromordinal(first + offset).isoformat()
+        summary.daily_count[day] = count
+        if seconds[offset]:
+            summary.daily_time[day] = seconds[offset]
+        if by_category:
+            for name, (task_count, task_seconds) in daily[day]["categories"].items():
+                totals = summary.by_category.setdefault(name, [0, 0])
+                totals[0] += task_count
+                totals[1] += task_seconds
+    if by_weekday:
+        summary.by_weekday = [list(pair) for pair in zip(weekday_totals(counts, start), weekday_totals(seconds, start))]
+    return summary
@@ -1,20 +1,286 @@
-import json
 import os
-from typing import List
+from typing import Dict, Iterable, List, Optional
 from models import Task
+import atomic_io
+import display_index
+import journal_storage
+import search_index
 
 DATA_FILE = "tasks.json"
 
+# Available task storage backends (selected with "storage_backend" in config.json)
+BACKENDS = ["json", "sqlite"]
+DEFAULT_BACKEND = "json"
+
+# Rows (Task.to_dict() output) as last loaded from / written to the backend, keyed by id
+# in load order. save_tasks() diffs against this so only changed rows are written (SQLite
+# rows or journal records). None means nothing has been loaded in this process yet.
+_snapshot = None
+
+# data_version() the snapshot matches. While it still matches, long-running processes
+# (the REPL) serve loads from the snapshot instead of re-reading the files. None while
+# the snapshot holds writes that are not committed yet.
+_snapshot_version = None
+
+
+def data_version() -> str:
+    """Token that changes whenever the active backend's files change (size and mtime)."""
+    backend = get_backend()
+    if backend == "sqlite":
+        import sqlite_storage
+        paths = [sqlite_storage.DB_FILE]
+    else:
+        paths = [DATA_FILE, journal_storage.JOURNAL_FILE]
+    parts = [backend, os.getcwd()]
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            parts.append(f"{stat.st_size}-{stat.st_mtime_ns}")
+        except OSError:
+            parts.append("-")
+    return ":".join(parts)
+
+
+def get_backend() -> str:
+    """Return the name of the configured storage backend."""
+    from config_storage import get_storage_backend
+    backend = get_storage_backend()
+    return backend if backend in BACKENDS else DEFAULT_BACKEND
+
+
+# --- JSON backend (tasks.json snapshot + tasks.log journal) ---
+
+def _json_load_snapshot() -> List[dict]:
+    data = atomic_io.read_json(DATA_FILE, [])
+    return data if isinstance(data, list) else []
+
+
+def _json_load_rows() -> List[dict]:
+    return journal_storage.replay(_json_load_snapshot(), journal_storage.read_ops())
+
+
+def _json_save_rows(rows: List[dict]):
+    """Write a full snapshot and drop the journal it supersedes."""
+    atomic_io.write_json(DATA_FILE, rows, indent=4)
+    journal_storage.clear_journal()
+
+
+def _json_append(ops: List[dict]):
+    """Journal operations, compacting into a new snapshot once the log is large."""
+    journal_storage.append_ops(ops)
+    if journal_storage.needs_compaction():
+        compact()
+
+
+def compact():
+    """Fold the operation log into tasks.json."""
+    _json_save_rows(_json_load_rows())
+
+
+# --- SQLite backend ---
+
+def _sqlite():
+    """Return the SQLite backend module, importing tasks.json on first use."""
+    import sqlite_storage
+    if not sqlite_storage.exists():
+        rows = _json_load_rows()
+        sqlite_storage.replace_all(rows)
+    return sqlite_storage
+
+
+# --- Public API ---
+
+def _stamp_snapshot():
+    global _snapshot_version
+    _snapshot_version = data_version()
+
+
+def _remember(snapshot: Optional[dict], version: Optional[str] = None):
+    """
+    Keep rows just loaded or written. They become reusable once on disk:
+    `version` is the data_version() taken before a load, otherwise the
+    version is stamped after the writes are committed.
+    """
+    global _snapshot, _snapshot_version
+    _snapshot = snapshot
+    _snapshot_version = None
+    if snapshot is None:
+        return
+    if version is not None and not atomic_io.deferring():
+        _snapshot_version = version
+    else:
+        atomic_io.after_commit(_stamp_snapshot)
+        atomic_io.on_rollback(_forget_snapshot)
+
+
+def _forget_snapshot():
+    """Drop a snapshot holding writes that were rolled back."""
+    global _snapshot, _snapshot_version
+    _snapshot = None
+    _snapshot_version = None
+
+
+def _snapshot_is_stale(version: str) -> bool:
+    """True if the task files changed since the snapshot was read or written."""
+    return _snapshot is not None and _snapshot_version is not None and _snapshot_version != version
+
+
+def _cached_rows() -> Optional[List[dict]]:
+    """Snapshot rows if the task files haven't changed since they were read or written."""
+    if _snapshot is not None and _snapshot_version is not None and _snapshot_version == data_version():
+        return list(_snapshot.values())
+    return None
+
+
+def _load_rows() -> List[dict]:
+    if get_backend() == "sqlite":
+        return _sqlite().load_rows()
+    return _json_load_rows()
+
+
 def load_tasks() -> List[Task]:
-    if not os.path.exists(DATA_FILE):
-        return []
-    try:
-        with open(DATA_FILE, "r") as f:
-            data = json.load(f)
-            return [Task.from_dict(item) for item in data]
-    except (json.JSONDecodeError, IOError):
-        return []
+    rows = _cached_rows()
+    if rows is None:
+        version = data_version()
+        rows = _load_rows()
+        _remember({row.get("id"): row for row in rows}, version)
+    return [Task.from_dict(item) for item in rows]
+
+
+def get_tasks(task_ids: Iterable[str]) -> Dict[str, Task]:
+    """Tasks by id, building Task objects only for the requested ids."""
+    if _snapshot is None or _snapshot_version is None or _snapshot_version != data_version():
+        version = data_version()
+        _remember({row.get("id"): row for row in _load_rows()}, version)
+    return {task_id: Task.from_dict(_snapshot[task_id]) for task_id in task_ids if task_id in _snapshot}
+
 
 def save_tasks(tasks: List[Task]):
-    with open(DATA_FILE, "w") as f:
-        json.dump([t.to_dict() for t in tasks], f, indent=4)
+    rows = [t.to_dict() for t in tasks]
+
+    # The files changed since the snapshot was taken (e.g. another process added a
+    # task): diff against what is on disk now, not against the stale snapshot
+    version = data_version()
+    if _snapshot_is_stale(version):
+        _remember({row.get("id"): row for row in _load_rows()}, version)
+
+    if _snapshot is None:
+        if get_backend() == "sqlite":
+            _sqlite().replace_all(rows)
+        else:
+            _json_save_rows(rows)
+        display_index.invalidate()
+        _remember({row["id"]: row for row in rows})
+        return
+
+    current_ids = {row["id"] for row in rows}
+    upserts = [row for row in rows if _snapshot.get(row["id"]) != row]
+    deletes = [task_id for task_id in _snapshot if task_id not in current_ids]
+    if not upserts and not deletes:
+        return
+
+    if get_backend() == "sqlite":
+        _sqlite().apply_changes(upserts, deletes)
+    else:
+        _json_append(journal_storage.diff_rows(_snapshot, rows))
+    display_index.record_changes(version, upserts, deletes)
+    search_index.record_changes(version, upserts, deletes)
+
+    # Same order a reload would give: changed rows keep their place, new ones go last
+    for task_id in deletes:
+        del _snapshot[task_id]
+    for row in upserts:
+        _snapshot[row["id"]] = row
+    _remember(_snapshot)
+
+
+def add_tasks(new_tasks: Iterable[Task]):
+    """Append tasks to the store without reading or rewriting existing ones."""
+    rows = [t.to_dict() for t in new_tasks]
+    if not rows:
+        return
+
+    version = data_version()
+    if _snapshot_is_stale(version):
+        _forget_snapshot()
+    if get_backend() == "sqlite":
+        _sqlite().upsert_rows(rows)
+    else:
+        _json_append([journal_storage.add_op(row) for row in rows])
+    display_index.record_changes(version, rows)
+    search_index.record_changes(version, rows)
+
+    if _snapshot is not None:
+        for row in rows:
+            _snapshot[row["id"]] = row
+        _remember(_snapshot)
+
+
+def add_task(task: Task):
+    """Append a single task."""
+    add_tasks([task])
+
+
+def delete_tasks(task_ids: Iterable[str]):
+    """Remove tasks by their internal id."""
+    ids = set(task_ids)
+    if not ids:
+        return
+
+    version = data_version()
+    if _snapshot_is_stale(version):
+        _forget_snapshot()
+    if get_backend() == "sqlite":
+        _sqlite().delete_rows(ids)
+    else:
+        _json_append([journal_storage.delete_op(task_id) for task_id in ids])
+    display_index.record_changes(version, deletes=ids)
+    search_index.record_changes(version, deletes=ids)
+
+    if _snapshot is not None:
+        for task_id in ids:
+            _snapshot.pop(task_id, None)
+        _remember(_snapshot)
+
+
+def find_tasks(completed: Optional[bool] = None, recurrent: Optional[bool] = None) -> List[Task]:
+    """Load only tasks matching the given flags (uses indexes on the SQLite backend)."""
+    rows = _cached_rows()
+    if rows is None and get_backend() == "sqlite":
+        rows = _sqlite().load_rows(completed=completed, recurrent=recurrent)
+    else:
+        if rows is None:
+            rows = _json_load_rows()
+        if completed is not None:
+            rows = [r for r in rows if bool(r.get("completed", False)) == completed]
+        if recurrent is not None:
+            rows = [r for r in rows if bool(r.get("recurrent", False)) == recurrent]
+    return [Task.from_dict(item) for item in rows]
+
+
+def migrate_tasks(target: str) -> int:
+    """
+    Copy all tasks into the target backend and make it the active one.
+
+    Returns the number of migrated tasks.
+    """
+    from config_storage import load_config, save_config
+
+    if target not in BACKENDS:
+        raise ValueError(f"Unknown storage backend: {target}")
+
+    tasks = load_tasks()
+    rows = [t.to_dict() for t in tasks]
+
+    if target == "sqlite":
+        import sqlite_storage
+        sqlite_storage.replace_all(rows)
+    else:
+        _json_save_rows(rows)
+
+    config = dict(load_config())
+    config["storage_backend"] = target
+    save_config(config)
+
+    _remember({row["id"]: row for row in rows})
+    return len(rows)
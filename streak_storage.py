@@ -1,74 +1,184 @@
+"""
+Daily streak, derived from a calendar of completion days.
 
-import json
+streak_days.idx holds one bit per calendar day, set on days at least one task
+was completed:
+
+    <first day ordinal> <longest streak> <history stamp>
+    <bitmap as hex, bit 0 = first day>
+
+It is built from the archived history (the daily rollup), the completed
+tasks still in the task list and a legacy streak.json, and completing tasks
+marks today. Streak queries walk back over set bits, so they cost O(streak
+length). The history stamp (size and mtime of the history manifest) ties the
+calendar to the archive it was built from: once the history changes (clear,
+reset) it is rebuilt. The parsed calendar is kept in memory and only re-read
+when the file changes.
+"""
 import os
-from datetime import datetime, timedelta
+from datetime import date, datetime
+from typing import Iterable, Optional, Tuple
+
+import atomic_io
+
+STREAK_INDEX_FILE = "streak_days.idx"
+STREAK_FILE = "streak.json"  # Legacy counter, folded into the calendar on rebuild
+
+# Parsed calendar (first ordinal, bits, longest, history stamp) and the file
+# stamp it was read at
+_calendar: Optional[Tuple[int, int, int, str]] = None
+_calendar_stamp: Optional[Tuple] = None
 
-STREAK_FILE = "streak.json"
 
-def load_streak():
-    """Returns (current_streak: int, last_active_date: str)"""
-    if not os.path.exists(STREAK_FILE):
-        return 0, None
+def _history_stamp() -> str:
+    from history_storage import HISTORY_DIR, MANIFEST_NAME
     try:
-        with open(STREAK_FILE, "r") as f:
-            data = json.load(f)
-            return data.get("streak", 0), data.get("last_date")
-    except Exception:
-        return 0, None
+        stat = os.stat(os.path.join(HISTORY_DIR, MANIFEST_NAME))
+    except OSError:
+        return "-"
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def _file_stamp() -> Tuple:
+    path = os.path.abspath(STREAK_INDEX_FILE)
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return path, None, None
+    return path, stat.st_size, stat.st_mtime_ns
+
+
+def _parse(text: Optional[str]) -> Optional[Tuple[int, int, int, str]]:
+    try:
+        header, bitmap = text.split("\n", 1)
+        first, longest, history = header.split()
+        return int(first), int(bitmap.strip() or "0", 16), int(longest), history
+    except (AttributeError, ValueError):
+        return None
+
+
+def _read() -> Optional[Tuple[int, int, int, str]]:
+    global _calendar, _calendar_stamp
+    if atomic_io.pending(STREAK_INDEX_FILE):
+        return _parse(atomic_io.read_text(STREAK_INDEX_FILE))
+    stamp = _file_stamp()
+    if _calendar is None or stamp != _calendar_stamp:
+        _calendar = _parse(atomic_io.read_text(STREAK_INDEX_FILE))
+        _calendar_stamp = stamp
+    return _calendar
+
+
+def _write(first: int, bits: int, longest: int, history: str):
+    global _calendar, _calendar_stamp
+    atomic_io.write_text(STREAK_INDEX_FILE, f"{first} {longest} {history}\n{bits:x}\n")
+    _calendar = None
+    _calendar_stamp = None
+
+
+def _run(bits: int, first: int, ordinal: int, step: int) -> int:
+    """Number of consecutive set days from `ordinal` on, walking by `step` (-1 back, 1 forward)."""
+    offset = ordinal - first
+    run = 0
+    while 0 <= offset and (bits >> offset) & 1:
+        run += 1
+        offset += step
+    return run
+
+
+def _completion_days() -> Iterable[int]:
+    """Ordinals of every day with a completion: history, active tasks, legacy streak."""
+    from rollup_storage import load_rollup
+    from storage import find_tasks
+    from task_table import completed_ordinal
+
+    for day in load_rollup()["days"]:
+        yield date.fromisoformat(day).toordinal()
+    for task in find_tasks(completed=True):
+        ordinal = completed_ordinal(task)
+        if ordinal:
+            yield ordinal
+
+    legacy = atomic_io.read_json(STREAK_FILE, None)
+    if isinstance(legacy, dict) and legacy.get("last_date") and legacy.get("streak"):
+        try:
+            last = date.fromisoformat(legacy["last_date"]).toordinal()
+        except (TypeError, ValueError):
+            return
+        yield from range(last - int(legacy["streak"]) + 1, last + 1)
+
+
+def rebuild() -> Tuple[int, int, int, str]:
+    """Recompute the completion calendar from scratch and save it."""
+    days = sorted(set(_completion_days()))
+    history = _history_stamp()
+    first = days[0] if days else date.today().toordinal()
+    bits = 0
+    longest = run = 0
+    previous = None
+    for ordinal in days:
+        bits |= 1 << (ordinal - first)
+        run = run + 1 if previous == ordinal - 1 else 1
+        longest = max(longest, run)
+        previous = ordinal
+    _write(first, bits, longest, history)
+    return first, bits, longest, history
+
+
+def _current() -> Tuple[int, int, int, str]:
+    calendar = _read()
+    if calendar is None or calendar[3] != _history_stamp():
+        calendar = rebuild()
+    return calendar
+
+
+def mark_day(day: Optional[date] = None):
+    """Record a completion on `day` (default today)."""
+    ordinal = (day or datetime.now().date()).toordinal()
+    first, bits, longest, history = _current()
+    if ordinal < first:
+        bits <<= first - ordinal
+        first = ordinal
+    if (bits >> (ordinal - first)) & 1:
+        return
+    bits |= 1 << (ordinal - first)
+    run = _run(bits, first, ordinal, -1) + _run(bits, first, ordinal + 1, 1)
+    _write(first, bits, max(longest, run), history)
+
+
+def streak_at(day: date) -> int:
+    """Length of the run of completion days ending on `day` (0 if nothing was completed that day)."""
+    first, bits, _, _ = _current()
+    return _run(bits, first, day.toordinal(), -1)
+
+
+def get_longest_streak() -> int:
+    return _current()[2]
 
-def save_streak(streak, date_str):
-    with open(STREAK_FILE, "w") as f:
-        json.dump({"streak": streak, "last_date": date_str}, f)
 
 def update_streak():
-    """Updates steak based on today's activity. Called when a task is completed."""
-    today = datetime.now().date()
-    today_str = today.isoformat()
-    
-    streak, last_date_str = load_streak()
-    
-    if last_date_str == today_str:
-        # Already active today, do nothing
-        return streak, True # (streak, is_active_today)
-    
-    if last_date_str:
-        last_date = datetime.fromisoformat(last_date_str).date()
-        if last_date == today - timedelta(days=1):
-            # Consecutive day
-            streak += 1
-        else:
-            # Streak broken (or first time)
-            streak = 1
-    else:
-        # First time ever
-        streak = 1
-        
-    save_streak(streak, today_str)
-    return streak, True
+    """Updates streak based on today's activity. Called when a task is completed."""
+    mark_day()
+    return get_streak_status()
+
 
 def get_streak_status():
     """Returns (streak, is_active_today) without updating."""
-    today_str = datetime.now().date().isoformat()
-    streak, last_date_str = load_streak()
-    
-    is_active = (last_date_str == today_str)
-    
-    # Check if streak is broken (yesterday was missed)
-    if last_date_str and not is_active:
-        last_date = datetime.fromisoformat(last_date_str).date()
-        if last_date < datetime.now().date() - timedelta(days=1):
-            # Streak is broken, effectively 0 for display purpose?
-            # Or show stored streak but gray? Usually show 0 if broken.
-            # But maybe user wants to see "Streak lost"?
-            # Standard logic: if broken, effective streak is 0 until restored (start over).
-            return 0, False
-            
-    return streak, is_active
+    first, bits, _, _ = _current()
+    today = datetime.now().date().toordinal()
+
+    streak = _run(bits, first, today, -1)
+    if streak:
+        return streak, True
+
+    # Not active yet today: a run ending yesterday is still alive (shown gray),
+    # anything older is broken and counts as 0
+    return _run(bits, first, today - 1, -1), False
+
 
 def get_streak_display():
     """Returns a rich formatted string for streak display."""
     streak, is_active = get_streak_status()
-    
+
     if is_active:
         # Lit fire
         if streak >= 10:
@@ -0,0 +1,333 @@
+"""
+Columnar, read-only view over a list of tasks for bulk filtering and sorting.
+
+A TaskTable stores the fields the views filter and sort on as parallel arrays
+(one slot per row, in load order):
+
+    due        -> due date ordinal (0 = no due date)
+    due_key    -> sortable due timestamp in seconds (NO_DUE for undated rows)
+    priority, completed, recurrent, event -> small ints
+    category   -> interned id of the primary category (-1 = none)
+    title_start -> offsets into one shared title buffer
+
+Rows are also indexed by due ordinal (and by category), so date-range queries
+bisect straight to the matching rows and only touch the result. Selections are
+lists of row numbers; `materialize` turns them back into the original Task
+objects (no copies), so edits made through them can be saved as usual.
+
+Due dates are read from the raw ISO strings Task keeps from disk, so building
+a table doesn't parse them into datetimes. load_table() keeps the last table
+built from storage and reuses it while the task files are unchanged.
+"""
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from models import Task
+
+EVENT_PREFIX = "📅"
+
+# Sort key used for rows without a due date (after every real date)
+NO_DUE = 2 ** 62
+
+SORT_KEYS = ("category", "priority", "due", "title")
+
+
+def _primary_category(task: Task) -> str:
+    category = task.category
+    if isinstance(category, list):
+        return category[0] if category else ""
+    return category or ""
+
+
+# "YYYY-MM-DD" -> date ordinal (few distinct days, many tasks)
+_ordinals: Dict[str, int] = {}
+
+
+def due_parts(task: Task) -> Tuple[int, int]:
+    """
+    (date ordinal, seconds into the day) of a task's due date, or (0, 0).
+
+    Uses the raw ISO string when the date hasn't been parsed yet and is
+    "YYYY-MM-DD", "YYYY-MM-DDTHH:MM" or "YYYY-MM-DDTHH:MM:SS[...]"; any other
+    form is left to Task to parse.
+    """
+    value = task._due_date
+    if not value:
+        return 0, 0
+    if isinstance(value, str):
+        try:
+            return _iso_parts(value)
+        except ValueError:
+            value = task.due_date  # Not a plain ISO timestamp: let Task parse it
+    return value.toordinal(), value.hour * 3600 + value.minute * 60 + value.second
+
+
+def _iso_parts(value: str) -> Tuple[int, int]:
+    """due_parts() of a raw ISO string; ValueError for forms it doesn't read."""
+    size = len(value)
+    if size != 10:
+        with_seconds = size >= 19 and value[16] == ":"
+        if not (size == 16 or with_seconds) or value[10] not in "T " or value[13] != ":":
+            raise ValueError(value)
+    day = value[:10]
+    ordinal = _ordinals.get(day)
+    if ordinal is None:
+        ordinal = _ordinals[day] = date(int(day[:4]), int(day[5:7]), int(day[8:10])).toordinal()
+    if size == 10:
+        return ordinal, 0
+    seconds = int(value[11:13]) * 3600 + int(value[14:16]) * 60
+    return ordinal, seconds + int(value[17:19]) if size >= 19 else seconds
+
+
+def completed_ordinal(task: Task) -> int:
+    """Date ordinal of a task's completed_at, or 0 (raw ISO string used when unparsed)."""
+    value = task._completed_at
+    if not value:
+        return 0
+    if isinstance(value, str):
+        day = value[:10]
+        ordinal = _ordinals.get(day)
+        if ordinal is not None:
+            return ordinal
+        try:
+            ordinal = _ordinals[day] = date(int(day[:4]), int(day[5:7]), int(day[8:10])).toordinal()
+            return ordinal
+        except ValueError:
+            value = task.completed_at  # Not a plain ISO timestamp: let Task parse it
+    return value.toordinal()
+
+
+def _categories(task: Task) -> List[str]:
+    category = task.category
+    if isinstance(category, list):
+        return category
+    return [category] if category else []
+
+
+class TaskTable:
+    """Parallel-array representation of a task list."""
+
+    def __init__(self, tasks: Iterable[Task]):
+        self.tasks: List[Task] = list(tasks)
+        n = len(self.tasks)
+
+        self.due = array("l", bytes(array("l").itemsize * n))
+        self.due_key = array("q", bytes(array("q").itemsize * n))
+        self.priority = array("b", bytes(n))
+        self.completed = array("b", bytes(n))
+        self.recurrent = array("b", bytes(n))
+        self.event = array("b", bytes(n))
+        self.category = array("l", bytes(array("l").itemsize * n))
+        self.title_start = array("l", bytes(array("l").itemsize * (n + 1)))
+
+        self.category_names: List[str] = []
+        self._category_ids: Dict[str, int] = {}
+        self._category_rows: Dict[int, List[int]] = {}
+
+        titles = []
+        offset = 0
+        for row, task in enumerate(self.tasks):
+            ordinal, seconds = due_parts(task)
+            if ordinal:
+                self.due[row] = ordinal
+                self.due_key[row] = ordinal * 86400 + seconds
+            else:
+                self.due_key[row] = NO_DUE
+            self.priority[row] = max(-128, min(127, task.priority or 0))
+            self.completed[row] = 1 if task.completed else 0
+            self.recurrent[row] = 1 if task.recurrent else 0
+            title = task.title or ""
+            self.event[row] = 1 if title.startswith(EVENT_PREFIX) else 0
+
+            primary = _primary_category(task)
+            self.category[row] = self._intern(primary) if primary else -1
+            for name in _categories(task):
+                rows = self._category_rows.setdefault(self._intern(name), [])
+                if not rows or rows[-1] != row:
+                    rows.append(row)
+
+            self.title_start[row] = offset
+            titles.append(title)
+            offset += len(title)
+        self.title_start[n] = offset
+        self._titles = "".join(titles)
+
+        # Row numbers ordered by due ordinal (ties keep load order); undated rows first
+        self._by_due = array("l", sorted(range(n), key=self.due.__getitem__))
+        self._due_sorted = array("l", (self.due[row] for row in self._by_due))
+        self._undated = self._by_due[:bisect_right(self._due_sorted, 0)]
+
+    def _intern(self, name: str) -> int:
+        category_id = self._category_ids.get(name)
+        if category_id is None:
+            category_id = len(self.category_names)
+            self._category_ids[name] = category_id
+            self.category_names.append(name)
+        return category_id
+
+    def __len__(self) -> int:
+        return len(self.tasks)
+
+    def title(self, row: int) -> str:
+        return self._titles[self.title_start[row]:self.title_start[row + 1]]
+
+    # --- Filtering ---
+
+    def due_between(self, start: Optional[date] = None, end: Optional[date] = None) -> List[int]:
+        """Rows due within [start, end] (inclusive), in load order. Undated rows never match."""
+        low = bisect_left(self._due_sorted, start.toordinal() if start else 1)
+        high = bisect_right(self._due_sorted, end.toordinal()) if end else len(self._due_sorted)
+        return sorted(self._by_due[low:high])
+
+    def undated(self) -> List[int]:
+        """Rows without a due date, in load order."""
+        return list(self._undated)
+
+    def select(
+        self,
+        rows: Optional[Sequence[int]] = None,
+        due_from: Optional[date] = None,
+        due_to: Optional[date] = None,
+        category: Optional[str] = None,
+        priority: Optional[int] = None,
+        completed: Optional[bool] = None,
+        recurrent: Optional[bool] = None,
+        events: Optional[bool] = None,
+    ) -> List[int]:
+        """
+        Return the rows matching every given filter, in load order.
+
+        Args:
+            rows: Restrict the search to these rows (e.g. an earlier selection)
+            due_from / due_to: Inclusive due date range (undated rows are excluded)
+            category: Rows having this category (any position in the list)
+            priority / completed / recurrent: Exact column matches
+            events: True for calendar events only, False for plain tasks only
+        """
+        # Start from the narrowest index, then test the remaining columns per row
+        if rows is not None:
+            candidates = sorted(rows)
+            if due_from is not None or due_to is not None:
+                low = due_from.toordinal() if due_from else 1
+                high = due_to.toordinal() if due_to else NO_DUE
+                due = self.due
+                candidates = [row for row in candidates if low <= due[row] <= high]
+        elif due_from is not None or due_to is not None:
+            candidates = self.due_between(due_from, due_to)
+        elif category is not None:
+            candidates = list(self._category_rows.get(self._category_ids.get(category, -1), []))
+            category = None
+        else:
+            candidates = range(len(self.tasks))
+
+        if category is not None:
+            in_category = set(self._category_rows.get(self._category_ids.get(category, -1), []))
+            candidates = [row for row in candidates if row in in_category]
+        if priority is not None:
+            column = self.priority
+            candidates = [row for row in candidates if column[row] == priority]
+        if completed is not None:
+            column, flag = self.completed, int(completed)
+            candidates = [row for row in candidates if column[row] == flag]
+        if recurrent is not None:
+            column, flag = self.recurrent, int(recurrent)
+            candidates = [row for row in candidates if column[row] == flag]
+        if events is not None:
+            column, flag = self.event, int(events)
+            candidates = [row for row in candidates if column[row] == flag]
+        return list(candidates)
+
+    # --- Ordering ---
+
+    def argsort(self, rows: Sequence[int], keys: Sequence[str] = SORT_KEYS) -> List[int]:
+        """
+        Order rows by the given columns (ties keep load order).
+
+        Keys: "category" (primary category, case-insensitive), "priority"
+        (highest first), "due" (earliest first, undated last), "title"
+        (case-insensitive).
+        """
+        lowered = [name.lower() for name in self.category_names]
+        columns = []
+        for key in keys:
+            if key == "category":
+                category = self.category
+                columns.append(lambda row: lowered[category[row]] if category[row] >= 0 else "")
+            elif key == "priority":
+                priority = self.priority
+                columns.append(lambda row: -priority[row])
+            elif key == "due":
+                columns.append(self.due_key.__getitem__)
+            elif key == "title":
+                columns.append(lambda row: self.title(row).lower())
+            else:
+                raise ValueError(f"Unknown sort key: {key}")
+        return sorted(rows, key=lambda row: tuple(column(row) for column in columns) + (row,))
+
+    def dashboard_buckets(self, events: Optional[bool] = None, today: Optional[date] = None) -> List[List[int]]:
+        """
+        Rows of each dashboard bucket, in display order: no date, today,
+        tomorrow, this week (incl. overdue), this month, future. Each bucket
+        is sorted by category, priority, due date and title. `events`
+        restricts the rows to calendar events (True) or tasks (False).
+        """
+        today = today or datetime.now().date()
+        tomorrow = today + timedelta(days=1)
+        week_end = today + timedelta(days=7)
+        month_end = today + timedelta(days=30)
+
+        buckets = [
+            self.undated(),
+            self.due_between(today, today),
+            self.due_between(tomorrow, tomorrow),
+            self.due_between(None, today - timedelta(days=1)) + self.due_between(tomorrow + timedelta(days=1), week_end),
+            self.due_between(week_end + timedelta(days=1), month_end),
+            self.due_between(month_end + timedelta(days=1), None),
+        ]
+        ordered = []
+        for bucket in buckets:
+            if events is not None:
+                bucket = self.select(bucket, events=events)
+            ordered.append(self.argsort(bucket))
+        return ordered
+
+    def dashboard_order(self, events: Optional[bool] = None, today: Optional[date] = None) -> List[int]:
+        """Rows in dashboard display order (the order display IDs are numbered in)."""
+        return [row for bucket in self.dashboard_buckets(events, today) for row in bucket]
+
+    def visible_position(self, row: int) -> int:
+        """1-based position of a row when undated rows are listed before dated ones."""
+        undated_before = bisect_left(self._undated, row)
+        if self.due[row] == 0:
+            return undated_before + 1
+        return len(self._undated) + (row - undated_before) + 1
+
+    # --- Materialization ---
+
+    def materialize(self, rows: Iterable[int]) -> List[Task]:
+        """The Task objects for the given rows (shared, not copied)."""
+        tasks = self.tasks
+        return [tasks[row] for row in rows]
+
+
+# Table built by load_table() and the storage.data_version() it was built at
+_table = None
+_table_version = None
+
+
+def load_table() -> TaskTable:
+    """
+    TaskTable over all stored tasks, reused while the task files are unchanged.
+
+    For read-only views: the tasks are shared between calls, so commands that
+    edit tasks should build their own table from load_tasks().
+    """
+    global _table, _table_version
+    from storage import data_version, load_tasks
+    version = data_version()
+    if _table is None or _table_version != version:
+        _table = TaskTable(load_tasks())
+        _table_version = version
+    return _table
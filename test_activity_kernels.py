@@ -0,0 +1,61 @@
+"""
+Tests for the activity kernels: the NumPy and pure-Python paths must agree
+"""
+from datetime import date, timedelta
+
+import pytest
+
+import activity_kernels
+from activity_kernels import chunk_sums, day_series, heatmap_grid, weekday_totals
+
+PATHS = [False, pytest.param(True, marks=pytest.mark.skipif(
+    not activity_kernels.NUMPY_AVAILABLE, reason="NumPy not installed"))]
+
+
+@pytest.fixture(params=PATHS, ids=["python", "numpy"])
+def numpy_path(request, monkeypatch):
+    monkeypatch.setattr(activity_kernels, "use_numpy", lambda size: request.param)
+    return request.param
+
+
+def _daily():
+    return {
+        "2026-01-01": {"count": 2, "seconds": 600},
+        "2026-01-05": {"count": 1, "seconds": 0},
+        "2026-02-28": {"count": 4, "seconds": 3600},
+        "2025-12-31": {"count": 9, "seconds": 9},  # Outside the range
+    }
+
+
+def test_day_series(numpy_path):
+    counts, seconds = day_series(_daily(), date(2026, 1, 1), date(2026, 2, 28))
+
+    assert len(counts) == len(seconds) == 59
+    assert counts[0] == 2 and counts[4] == 1 and counts[-1] == 4
+    assert sum(counts) == 7 and sum(seconds) == 4200
+    assert day_series({}, date(2026, 1, 1), date(2026, 1, 3)) == ([0, 0, 0], [0, 0, 0])
+
+
+def test_weekday_totals_and_chunks(numpy_path):
+    start = date(2026, 1, 1)  # A Thursday
+    values = list(range(1, 15))
+
+    totals = weekday_totals(values, start)
+    assert totals[3] == 1 + 8 and totals[2] == 7 + 14
+    assert sum(totals) == sum(values)
+    assert chunk_sums(values, 5) == [15, 40, 50]
+    assert chunk_sums([], 5) == []
+
+
+def test_heatmap_grid_matches_calendar(numpy_path):
+    jan1 = date(2026, 1, 1)
+    values = [(jan1 + timedelta(days=i)).day for i in range(365)]
+    grid = heatmap_grid(values, jan1.weekday())
+
+    assert len(grid) == 7 and all(len(row) == 54 for row in grid)
+    for column in range(54):
+        for row in range(7):
+            offset = column * 7 + row - jan1.weekday()
+            day = jan1 + timedelta(days=offset)
+            expected = day.day if 0 <= offset < 365 else -1
+            assert grid[row][column] == expected
@@ -0,0 +1,173 @@
+"""
+Tests for archiving completed tasks (two-phase move from the task store to history)
+"""
+import os
+from datetime import date, datetime, timedelta
+
+import pytest
+
+import archive_storage
+import history_storage
+import storage
+from models import Task
+
+
+def _seed():
+    when = datetime(2026, 3, 14, 10, 0)
+    storage.add_tasks([
+        Task(title="Done 1", completed=True, completed_at=when),
+        Task(title="Open"),
+        Task(title="Done 2", completed=True, completed_at=when),
+    ])
+    return storage.find_tasks(completed=True)
+
+
+def test_archive_moves_completed_tasks(store):
+    assert archive_storage.archive(_seed()) == 2
+
+    assert [t.title for t in storage.load_tasks()] == ["Open"]
+    assert sorted(t.title for t in history_storage.load_history()) == ["Done 1", "Done 2"]
+    assert not os.path.exists(archive_storage.ARCHIVE_MARKER)
+
+
+def test_open_tasks_are_never_archived(store):
+    storage.add_task(Task(title="Open"))
+    assert archive_storage.archive(storage.load_tasks()) == 0
+    assert history_storage.count_history() == 0
+
+
+def test_interrupted_archive_is_resumed(store, monkeypatch):
+    completed = _seed()
+
+    def crash(ids):
+        raise KeyboardInterrupt
+    delete_tasks = storage.delete_tasks
+    monkeypatch.setattr(storage, "delete_tasks", crash)
+    with pytest.raises(KeyboardInterrupt):
+        archive_storage.archive(completed)
+    monkeypatch.setattr(storage, "delete_tasks", delete_tasks)
+
+    # Phase 1 is on disk: archived, marked, still in the store
+    assert history_storage.count_history() == 2
+    assert os.path.exists(archive_storage.ARCHIVE_MARKER)
+    assert len(storage.load_tasks()) == 3
+
+    storage._snapshot = None
+    assert archive_storage.resume() == 2
+    assert [t.title for t in storage.load_tasks()] == ["Open"]
+    assert history_storage.count_history() == 2
+    assert not os.path.exists(archive_storage.ARCHIVE_MARKER)
+
+    # A later archive finds nothing left to redo
+    assert archive_storage.archive(storage.find_tasks(completed=True)) == 0
+    assert history_storage.count_history() == 2
+
+
+def test_failed_history_commit_leaves_everything_in_place(store, monkeypatch):
+    completed = _seed()
+    monkeypatch.setattr(history_storage, "add_to_history", lambda tasks: (_ for _ in ()).throw(OSError("disk full")))
+    with pytest.raises(OSError):
+        archive_storage.archive(completed)
+
+    assert len(storage.load_tasks()) == 3
+    assert not os.path.exists(archive_storage.ARCHIVE_MARKER)
+
+
+def test_task_reopened_between_phases_is_moved_once(store, monkeypatch):
+    completed = _seed()
+
+    def crash(ids):
+        raise KeyboardInterrupt
+    delete_tasks = storage.delete_tasks
+    monkeypatch.setattr(storage, "delete_tasks", crash)
+    with pytest.raises(KeyboardInterrupt):
+        archive_storage.archive(completed)
+    monkeypatch.setattr(storage, "delete_tasks", delete_tasks)
+
+    # Reopened while the archive was only half done
+    storage._snapshot = None
+    tasks = storage.load_tasks()
+    for task in tasks:
+        if task.id == completed[0].id:
+            task.completed = False
+            task.completed_at = None
+    storage.save_tasks(tasks)
+
+    assert archive_storage.resume() == 2
+    assert [t.title for t in storage.load_tasks()] == ["Open"]
+    # Completing it again can't archive it a second time: it is gone from the store
+    assert archive_storage.archive(storage.find_tasks(completed=True)) == 0
+    assert sorted(t.title for t in history_storage.load_history()) == ["Done 1", "Done 2"]
+    assert history_storage.count_history() == 2
+
+
+def test_archive_does_not_read_the_history(store, monkeypatch):
+    history_storage.add_to_history([Task(title=f"Old {i}", completed=True, completed_at=datetime(2025, 1, 1))
+                                    for i in range(50)])
+    monkeypatch.setattr(history_storage, "load_segment", lambda key: pytest.fail(f"read segment {key}"))
+    assert archive_storage.archive(_seed()) == 2
+
+
+def _completed_days_ago(title, days, today):
+    return Task(title=title, completed=True, completed_at=datetime.combine(today, datetime.min.time()) - timedelta(days=days))
+
+
+def test_expired_by_age_and_count():
+    today = date(2026, 10, 16)
+    tasks = [_completed_days_ago(f"{d}d", d, today) for d in (0, 5, 40, 2, 31, 30)]
+    tasks.append(Task(title="no date", completed=True))
+    tasks.append(Task(title="open"))
+
+    assert sorted(t.title for t in archive_storage.expired(tasks, 30, 0, today)) == ["31d", "40d"]
+    assert sorted(t.title for t in archive_storage.expired(tasks, 0, 3, today)) == ["30d", "31d", "40d", "no date"]
+    assert sorted(t.title for t in archive_storage.expired(tasks, 3, 5, today)) == ["30d", "31d", "40d", "5d", "no date"]
+    assert archive_storage.expired(tasks, 0, 0, today) == []
+
+
+def test_tasks_completed_before_timestamps_only_follow_the_keep_cap():
+    today = date(2026, 10, 16)
+    legacy = Task(title="legacy", completed=True)
+    assert legacy.completed_at is None
+    tasks = [legacy, _completed_days_ago("recent", 1, today)]
+
+    assert archive_storage.expired(tasks, 1, 0, today) == []
+    assert archive_storage.expired(tasks, 1, 2, today) == []
+    assert [t.title for t in archive_storage.expired(tasks, 1, 1, today)] == ["legacy"]
+
+
+def test_auto_archive_runs_once_a_day(store, monkeypatch):
+    import config_storage
+    config_storage.save_config({"auto_archive_days": 7, "auto_archive_keep": 0})
+    today = date(2026, 10, 16)
+    storage.add_tasks([_completed_days_ago("old", 10, today), _completed_days_ago("recent", 1, today), Task(title="open")])
+
+    assert archive_storage.auto_archive(today) == 1
+    assert sorted(t.title for t in storage.load_tasks()) == ["open", "recent"]
+
+    # Already ran today: the next commands don't look at the tasks
+    find_tasks = storage.find_tasks
+    monkeypatch.setattr(storage, "find_tasks", lambda **kw: pytest.fail("policy ran twice"))
+    assert archive_storage.auto_archive(today) == 0
+    monkeypatch.setattr(storage, "find_tasks", find_tasks)
+
+    assert archive_storage.auto_archive(today + timedelta(days=7)) == 1
+    assert [t.title for t in storage.load_tasks()] == ["open"]
+
+
+def test_auto_archive_can_be_disabled(store):
+    import config_storage
+    config_storage.save_config({"auto_archive_days": 0, "auto_archive_keep": 0})
+    storage.add_tasks([_completed_days_ago("old", 400, date.today())])
+
+    assert archive_storage.auto_archive() == 0
+    assert len(storage.load_tasks()) == 1
+    assert not os.path.exists(archive_storage.AUTO_ARCHIVE_STAMP)
+
+
+def test_auto_archive_is_off_by_default(store):
+    import config_storage
+    storage.add_tasks([_completed_days_ago("old", 400, date.today())])
+
+    assert config_storage.get_auto_archive_policy() == (0, 0)
+    assert archive_storage.auto_archive() == 0
+    assert len(storage.load_tasks()) == 1
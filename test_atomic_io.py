@@ -0,0 +1,94 @@
+"""
+Tests for the shared crash-safe write path (atomic_io)
+"""
+import json
+import os
+
+import pytest
+
+import atomic_io
+import storage
+from models import Task
+
+
+def test_write_json_replaces_file_without_temp_leftovers(data_dir):
+    atomic_io.write_json("data.json", [1, 2, 3])
+    atomic_io.write_json("data.json", [4])
+
+    assert json.loads((data_dir / "data.json").read_text()) == [4]
+    assert os.listdir(data_dir) == ["data.json"]
+
+
+def test_corrupt_file_is_quarantined_not_overwritten(data_dir):
+    (data_dir / "tasks.json").write_text('[{"id": "abc", "title": "Trunc')
+
+    assert storage.load_tasks() == []
+    storage.save_tasks([Task(title="New")])
+
+    backups = [name for name in os.listdir(data_dir) if name.startswith("tasks.json.corrupt-")]
+    assert len(backups) == 1
+    assert (data_dir / backups[0]).read_text().startswith('[{"id": "abc"')
+
+
+def test_deferred_writes_commit_together(data_dir):
+    with atomic_io.deferred_writes():
+        atomic_io.write_json("a.json", {"a": 1})
+        atomic_io.append_text("log.txt", "one\n")
+        atomic_io.append_text("log.txt", "two\n")
+        # Nothing hits the disk yet, but reads see the pending state
+        assert not (data_dir / "a.json").exists()
+        assert atomic_io.read_json("a.json") == {"a": 1}
+        assert atomic_io.read_text("log.txt") == "one\ntwo\n"
+
+    assert json.loads((data_dir / "a.json").read_text()) == {"a": 1}
+    assert (data_dir / "log.txt").read_text() == "one\ntwo\n"
+
+
+def test_deferred_writes_discarded_on_error(data_dir):
+    atomic_io.write_json("a.json", {"a": 1})
+
+    with pytest.raises(RuntimeError):
+        with atomic_io.deferred_writes():
+            atomic_io.write_json("a.json", {"a": 2})
+            atomic_io.remove("a.json")
+            raise RuntimeError("interrupted")
+
+    assert json.loads((data_dir / "a.json").read_text()) == {"a": 1}
+
+
+def test_interrupted_commit_is_finished_by_next_process(data_dir, monkeypatch):
+    atomic_io.write_json("tasks.json", ["old"])
+    atomic_io.append_text("tasks.log", "first\n")
+
+    def crash(steps):
+        raise KeyboardInterrupt
+
+    apply = atomic_io._apply
+    monkeypatch.setattr(atomic_io, "_apply", crash)
+    with pytest.raises(KeyboardInterrupt):
+        with atomic_io.deferred_writes():
+            atomic_io.write_json("tasks.json", ["new"])
+            atomic_io.append_text("tasks.log", "second\n")
+            atomic_io.write_json("streak.json", {"streak": 1})
+    monkeypatch.setattr(atomic_io, "_apply", apply)
+
+    # Nothing applied yet, but the marker records the whole batch
+    assert json.loads((data_dir / "tasks.json").read_text()) == ["old"]
+    assert (data_dir / atomic_io.COMMIT_FILE).exists()
+
+    monkeypatch.setattr(atomic_io, "_recovered", set())
+    assert atomic_io.read_json("tasks.json") == ["new"]
+    assert (data_dir / "tasks.log").read_text() == "first\nsecond\n"
+    assert json.loads((data_dir / "streak.json").read_text()) == {"streak": 1}
+    assert sorted(os.listdir(data_dir)) == ["streak.json", "tasks.json", "tasks.log"]
+
+
+def test_recover_does_not_repeat_finished_appends(data_dir):
+    (data_dir / "tasks.log").write_text("first\nsecond\n")
+    steps = {"renames": [], "appends": [[str(data_dir / "tasks.log"), len("first\n"), "second\n"]], "removes": []}
+    (data_dir / atomic_io.COMMIT_FILE).write_text(json.dumps(steps))
+
+    atomic_io.recover()
+
+    assert (data_dir / "tasks.log").read_text() == "first\nsecond\n"
+    assert not (data_dir / atomic_io.COMMIT_FILE).exists()
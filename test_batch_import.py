@@ -0,0 +1,49 @@
+"""
+Tests for bulk task import (TDL import / TDL add --batch)
+"""
+import io
+
+import pytest
+
+pytest.importorskip("typer")
+
+import main
+import storage
+
+
+pytestmark = pytest.mark.usefixtures("data_dir")
+
+
+def test_lines_use_add_flags():
+    task = main.parse_task_spec('Call "mom" -c home -d "2026-03-14 18:00" -t 30m -f 1 -i "ask about sunday"', [], {})
+
+    assert task.title == "Call mom"
+    assert task.category == ["Home"]
+    assert task.due_date.isoformat() == "2026-03-14T18:00:00"
+    assert (task.time_duration, task.priority, task.description) == (1800, 1, "ask about sunday")
+
+
+@pytest.mark.parametrize("line, error", [
+    ("Broken -d notadate", "Could not parse date"),
+    ("Bad -t 5x", "invalid duration"),
+    ("Bad -f 2", "invalid flag"),
+    ("Bad -c", "-c needs a value"),
+    ("Bad -x 1", "unknown option -x"),
+    ("*missing", "template 'missing' not found"),
+    ('Unclosed "quote', "No closing quotation"),
+])
+def test_bad_lines_raise_value_error(line, error):
+    with pytest.raises(ValueError, match=error):
+        main.parse_task_spec(line, [], {})
+
+
+def test_import_commits_good_lines_in_one_write(monkeypatch):
+    writes = []
+    original = storage.add_tasks
+    monkeypatch.setattr(storage, "add_tasks", lambda tasks: (writes.append(len(tasks)), original(tasks)))
+    batch = io.StringIO("# groceries\nMilk -c Home\n\nEggs -d nope\nBread -f -1\n")
+
+    assert main.import_tasks(batch) == 2
+
+    assert writes == [2]
+    assert [(t.title, t.priority) for t in storage.load_tasks()] == [("Milk", 0), ("Bread", -1)]
@@ -0,0 +1,81 @@
+"""
+Tests for the calendar's day buckets (and the calendar rendered from them)
+"""
+import io
+from datetime import date, datetime
+
+import pytest
+
+from calendar_index import CalendarIndex
+from models import Task
+
+
+def _event(title, due, **fields):
+    return Task(title=f"📅 {title}", due_date=due, **fields)
+
+
+def test_tasks_are_bucketed_by_day_in_time_order():
+    late = _event("Late", "2026-03-14T18:00:00")
+    early = _event("Early", datetime(2026, 3, 14, 8, 0))
+    other = _event("Other", "2026-03-02T09:00:00")
+    index = CalendarIndex([late, early, other])
+
+    assert [task.title for task, _ in index.day(date(2026, 3, 14))] == ["📅 Early", "📅 Late"]
+    assert sorted(index.month(2026, 3)) == [date(2026, 3, 2).toordinal(), date(2026, 3, 14).toordinal()]
+    assert index.day(date(2026, 4, 14)) == []
+
+
+def test_completed_and_undated_tasks_are_left_out():
+    done = _event("Done", datetime(2026, 3, 14), completed=True)
+    undated = Task(title="📅 Someday")
+    index = CalendarIndex([done, undated])
+    assert index.month(2026, 3) == {}
+
+
+def test_the_callers_list_is_not_reordered():
+    tasks = [_event("B", datetime(2026, 5, 1)), Task(title="📅 Undated"), _event("A", datetime(2026, 4, 1))]
+    before = list(tasks)
+    index = CalendarIndex(tasks)
+    assert tasks == before
+    # Local IDs follow due date order, undated last
+    assert [index.local_id(t.id) for t in tasks] == [2, 3, 1]
+
+
+def test_months_are_built_once():
+    index = CalendarIndex([_event("A", datetime(2026, 3, 1))])
+    assert index.month(2026, 3) is index.month(2026, 3)
+
+
+def test_recurring_occurrences_are_previewed():
+    weekly = Task(title="Review", due_date=datetime(2026, 3, 2, 10, 0), recurrent=True, recurrence_type="weekly")
+    standup = _event("Standup", datetime(2026, 3, 3, 9, 0), recurrent=True, recurrence_type="daily")
+    index = CalendarIndex([standup], recurring=[weekly, standup])
+
+    march = index.month(2026, 3)
+    mondays = [date(2026, 3, d).toordinal() for d in (2, 9, 16, 23, 30)]
+    for ordinal in mondays:
+        assert (weekly.id, True) in march[ordinal]
+    # The real instance of the event is not repeated as a preview
+    assert march[date(2026, 3, 3).toordinal()] == [(standup.id, False)]
+    assert march[date(2026, 3, 4).toordinal()] == [(standup.id, True)]
+    assert date(2026, 3, 2).toordinal() in march and (standup.id, True) not in march[date(2026, 3, 2).toordinal()]
+
+    # Years ahead, without walking through the months in between
+    assert len(index.month(2030, 2)) == 28
+
+
+def test_render_calendar_uses_the_index(data_dir, monkeypatch):
+    pytest.importorskip("rich")
+    from rich.console import Console
+    import ui
+
+    buffer = io.StringIO()
+    monkeypatch.setattr(ui, "console", Console(file=buffer, width=200, color_system=None))
+
+    tasks = [_event("Dentist", datetime(2026, 3, 14, 15, 0))]
+    weekly = Task(title="Gym", due_date=datetime(2026, 3, 2, 7, 0), recurrent=True, recurrence_type="weekly")
+    ui.render_calendar(tasks, 2026, 3, recurring=[weekly])
+
+    text = buffer.getvalue()
+    assert "• 📅 Dentis" in text
+    assert text.count("🔁 Gym") == 5
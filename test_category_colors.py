@@ -0,0 +1,44 @@
+"""
+Tests for batched category color assignment (ui.resolve_category_colors)
+"""
+import json
+
+import pytest
+
+pytest.importorskip("rich")
+
+import config_storage
+import ui
+from models import Task
+
+
+pytestmark = pytest.mark.usefixtures("data_dir")
+
+
+def test_new_categories_are_saved_in_one_write(tmp_path, monkeypatch):
+    (tmp_path / "config.json").write_text(json.dumps({"category_colors": {"Work": "bright_cyan"}}))
+    writes = []
+    original = config_storage.save_config
+    monkeypatch.setattr(config_storage, "save_config", lambda config: (writes.append(1), original(config)))
+
+    tasks = [Task(title=f"T{i}", category=[f"Cat{i % 40}", "Work"]) for i in range(400)]
+    palette = ui.task_palette(tasks)
+
+    assert len(writes) == 1
+    assert palette["Work"] == "bright_cyan"
+    assert all(f"Cat{i}" in palette for i in range(40))
+    # Unused colors are handed out first, in alphabetical order of the categories
+    first = sorted(f"Cat{i}" for i in range(40))[:len(ui.AVAILABLE_COLORS) - 1]
+    assert len({palette[name] for name in first}) == len(first)
+
+    assert ui.task_palette(tasks) == palette
+    assert len(writes) == 1
+
+
+def test_assignment_does_not_depend_on_task_order():
+    tasks = [Task(title="a", category=["Zeta"]), Task(title="b", category=["Alpha"])]
+    first = ui.task_palette(tasks)
+
+    config_storage.save_config({})
+    assert ui.task_palette(list(reversed(tasks))) == first
+    assert ui.get_category_color("Alpha") == first["Alpha"]
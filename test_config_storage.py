@@ -0,0 +1,48 @@
+"""
+Tests for the cached config (one parse per change of config.json)
+"""
+import json
+import os
+
+import pytest
+
+import config_storage
+
+
+pytestmark = pytest.mark.usefixtures("data_dir")
+
+
+def test_accessors_parse_the_file_once(tmp_path):
+    (tmp_path / "config.json").write_text(json.dumps({"theme": "neon"}))
+    reads = config_storage.read_count()
+
+    for _ in range(500):
+        assert config_storage.get_theme() == "neon"
+        assert config_storage.get_show_streak() is True
+        config_storage.get_category_colors()
+
+    assert config_storage.read_count() == reads + 1
+
+
+def test_outside_edit_is_picked_up(tmp_path):
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps({"theme": "neon"}))
+    assert config_storage.get_theme() == "neon"
+
+    path.write_text(json.dumps({"theme": "pastel", "simplicity": True}))
+    os.utime(path, ns=(1, 1))
+    assert config_storage.get_theme() == "pastel"
+    assert config_storage.get_simplicity() is True
+
+
+def test_loaded_config_is_a_copy():
+    config = config_storage.load_config()
+    config["category_colors"]["Work"] = "red"
+    config["theme"] = "dark"
+
+    assert config_storage.get_category_colors() == {}
+    assert config_storage.DEFAULT_CONFIG["category_colors"] == {}
+
+    config_storage.save_config(config)
+    assert config_storage.get_theme() == "dark"
+    assert config_storage.get_category_colors() == {"Work": "red"}
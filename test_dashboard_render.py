@@ -0,0 +1,99 @@
+"""
+Tests for the single-buffer dashboard renderer
+"""
+import io
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip("rich")
+
+from rich.console import Console
+
+import config_storage
+import ui
+from models import Task
+from task_table import TaskTable
+
+
+@pytest.fixture
+def output(data_dir, monkeypatch):
+    config_storage.save_config({"show_streak": False})
+    buffer = io.StringIO()
+    monkeypatch.setattr(ui, "console", Console(file=buffer, width=200, color_system=None))
+    return buffer
+
+
+def test_dashboard_is_written_with_one_print(output, monkeypatch):
+    now = datetime.now()
+    tasks = [Task(title=f"Task {i}", category=["Work"], due_date=now + timedelta(days=i % 40)) for i in range(50)]
+    prints = []
+    original = ui.console.print
+    monkeypatch.setattr(ui.console, "print", lambda *a, **k: (prints.append(1), original(*a, **k)))
+
+    ui.render_dashboard(tasks)
+
+    assert len(prints) == 1
+    lines = [line for line in output.getvalue().splitlines() if line.strip()]
+    assert lines[0] == "Today"
+    assert len([line for line in lines if "#Work" in line]) == 50
+
+
+def test_ids_follow_dashboard_order_and_titles_are_not_markup(output):
+    now = datetime.now()
+    tasks = [
+        Task(title="Later [b]bold?[/b]", due_date=now + timedelta(days=3)),
+        Task(title="Undated", category=["Home"]),
+        Task(title="Due today", priority=1, due_date=now),
+    ]
+    ui.render_dashboard(tasks)
+
+    table = TaskTable(tasks)
+    expected = [table.tasks[row].title for row in table.dashboard_order()]
+    rendered = [line for line in output.getvalue().splitlines() if line[:1].isdigit()]
+    assert [line.split("  ")[0] for line in rendered] == ["1", "2", "3"]
+    assert [title for title in expected if any(title in line for line in rendered)] == expected
+    assert "[b]bold?[/b]" in output.getvalue()
+
+
+def test_page_renders_only_its_window(output):
+    import display_index
+    import storage
+
+    now = datetime.now()
+    tasks = [Task(title=f"Soon {i}", due_date=now + timedelta(days=2)) for i in range(10)]
+    tasks += [Task(title=f"Later {i}", due_date=now + timedelta(days=90)) for i in range(30)]
+    storage.save_tasks(tasks)
+    entries = display_index.get_index()["tasks"]
+
+    ui.render_dashboard_page(entries, storage.get_tasks(e[-1] for e in entries[5:10]), 5, 5)
+
+    text = output.getvalue()
+    rows = [line for line in text.splitlines() if line[:1].isdigit()]
+    assert [line.split("  ")[0] for line in rows] == ["6", "7", "8", "9", "10"]
+    assert "… 5 above" in text
+    assert "Future: 30 tasks" in text
+    assert "Tasks 6-10 of 40" in text and "page 2/8" in text
+
+
+def test_page_orders_tags_like_the_full_dashboard(output):
+    import display_index
+    import storage
+
+    now = datetime.now()
+    # "Work" is the most used category overall, but not on the first page
+    tasks = [Task(title="Both", category=["Home", "Work"], due_date=now),
+             Task(title="Chores", category=["Home"], due_date=now)]
+    tasks += [Task(title=f"Later {i}", category=["Work"], due_date=now + timedelta(days=90)) for i in range(5)]
+    storage.save_tasks(tasks)
+
+    ui.render_dashboard(tasks)
+    full = next(line for line in output.getvalue().splitlines() if "Both" in line)
+    output.truncate(0)
+
+    entries = display_index.get_index()["tasks"]
+    ui.render_dashboard_page(entries, storage.get_tasks(e[-1] for e in entries[:2]), 0, 2)
+    paged = next(line for line in output.getvalue().splitlines() if "Both" in line)
+
+    assert "#Work #Home" in full
+    assert paged.split("Both")[0].strip() == full.split("Both")[0].strip()
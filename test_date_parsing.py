@@ -0,0 +1,59 @@
+"""
+Tests for the due date parser (fast paths, dateutil fallback, memoization)
+"""
+import sys
+from datetime import datetime
+
+import pytest
+
+import date_parsing
+from date_parsing import parse_due
+
+NOW = datetime(2026, 10, 16, 11, 22, 33)  # A Friday
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("today", datetime(2026, 10, 16, 11, 22, 33)),
+    ("Tomorrow", datetime(2026, 10, 17, 11, 22, 33)),
+    ("2026-03-14", datetime(2026, 3, 14)),
+    ("2026-03-14T10:30:05", datetime(2026, 3, 14, 10, 30, 5)),
+    ("fri", datetime(2026, 10, 16)),
+    ("next fri", datetime(2026, 10, 23)),
+    ("saturday", datetime(2026, 10, 17)),
+    ("+2d", datetime(2026, 10, 18, 11, 22, 33)),
+    ("+3w", datetime(2026, 11, 6, 11, 22, 33)),
+    ("14:00", datetime(2026, 10, 16, 14, 0)),
+    ("12am", datetime(2026, 10, 16, 0, 0)),
+    ("tomorrow 3pm", datetime(2026, 10, 17, 15, 0)),
+    ("next  fri 14:00", datetime(2026, 10, 23, 14, 0)),
+])
+def test_fast_path_forms(text, expected):
+    assert date_parsing._match_fast(" ".join(text.lower().split()), NOW.date())
+    assert parse_due(text, NOW) == expected
+
+
+def test_other_forms_fall_back_to_dateutil():
+    pytest.importorskip("dateutil")
+    assert date_parsing._match_fast("march 3", NOW.date()) is None
+    assert parse_due("March 3", NOW) == datetime(2026, 3, 3)
+    assert parse_due("15", NOW) == datetime(2026, 10, 15)
+    with pytest.raises(ValueError):
+        parse_due("2026-02-30", NOW)
+
+
+def test_fast_path_does_not_import_dateutil(monkeypatch):
+    monkeypatch.delitem(sys.modules, "dateutil.parser", raising=False)
+    monkeypatch.delitem(sys.modules, "dateutil", raising=False)
+    parse_due("next fri 14:00", NOW)
+    assert "dateutil" not in sys.modules
+
+
+def test_repeated_inputs_hit_the_cache():
+    date_parsing._resolve.cache_clear()
+    for _ in range(100):
+        parse_due("+2d", NOW)
+        parse_due("+2D", NOW)
+    info = date_parsing.cache_info()
+    assert info.misses == 1 and info.hits == 199
+    # Keyed on the current date as well
+    assert parse_due("+2d", datetime(2026, 10, 17, 8, 0)) == datetime(2026, 10, 19, 8, 0)
@@ -0,0 +1,144 @@
+"""Tests for the persistent display-ID index (incremental upkeep vs full rebuild)."""
+from datetime import datetime, timedelta
+
+import pytest
+
+import atomic_io
+import display_index
+import storage
+from models import Task
+from task_table import TaskTable
+
+
+pytestmark = pytest.mark.usefixtures("data_dir")
+
+
+def dashboard_ids(tasks, events):
+    table = TaskTable(tasks)
+    return [table.tasks[row].id for row in table.dashboard_order(events=events)]
+
+
+def index_ids(section):
+    return [entry[-1] for entry in display_index.get_index()[section]]
+
+
+def sample_tasks():
+    now = datetime.now()
+    return [
+        Task(title="Gym", category=["Health"], due_date=now),
+        Task(title="Report", category=["Work"], due_date=now + timedelta(days=3), priority=1),
+        Task(title="Taxes", due_date=now - timedelta(days=2)),
+        Task(title="Someday"),
+        Task(title="📅 Dentist", due_date=now + timedelta(days=1)),
+    ]
+
+
+def test_incremental_updates_match_rebuild():
+    storage.save_tasks(sample_tasks())
+    tasks = storage.load_tasks()
+    assert index_ids("tasks") == dashboard_ids(tasks, events=False)
+
+    storage.add_task(Task(title="Alpha", category=["Health"], due_date=datetime.now()))
+    tasks = storage.load_tasks()
+    tasks[0].priority = 1
+    tasks[1].due_date = datetime.now() + timedelta(days=40)
+    storage.save_tasks(tasks)
+    storage.delete_tasks([tasks[2].id])
+
+    tasks = storage.load_tasks()
+    built_before = display_index._index
+    assert index_ids("tasks") == dashboard_ids(tasks, events=False)
+    assert index_ids("events") == dashboard_ids(tasks, events=True)
+    # Served from the maintained index, not rebuilt
+    assert display_index._index is built_before
+
+
+def test_resolve_and_id_map():
+    storage.save_tasks(sample_tasks())
+    tasks = storage.load_tasks()
+    first = dashboard_ids(tasks, events=False)[0]
+
+    assert display_index.resolve("1") == first
+    assert display_index.resolve("#1") == next(t.id for t in tasks if t.title.startswith("📅"))
+    assert display_index.resolve("9") is None
+    assert display_index.resolve("x") is None
+    assert display_index.id_map()[first] == 1
+
+
+def test_external_edit_or_new_day_triggers_rebuild(monkeypatch):
+    storage.save_tasks(sample_tasks())
+    display_index.get_index()
+
+    index = atomic_io.read_json(display_index.INDEX_FILE)
+    index["day"] = "2000-01-01"
+    atomic_io.write_json(display_index.INDEX_FILE, index)
+    display_index._index = None
+    assert display_index.current() is None
+    assert display_index.get_index()["day"] == datetime.now().date().isoformat()
+
+    with open("tasks.json", "a") as f:
+        f.write(" ")
+    assert display_index.current() is None
+
+
+def test_deferred_block_commits_index_with_data():
+    storage.save_tasks(sample_tasks())
+    tasks = storage.load_tasks()
+    display_index.get_index(tasks)
+
+    with atomic_io.deferred_writes():
+        tasks[3].priority = 1
+        storage.save_tasks(tasks)
+        assert display_index.current()["version"] is None
+
+    assert display_index.current()["version"] == storage.data_version()
+    assert index_ids("tasks") == dashboard_ids(storage.load_tasks(), events=False)
+
+
+def test_add_appends_to_log_without_touching_index(tmp_path, monkeypatch):
+    storage.save_tasks(sample_tasks())
+    display_index.get_index()
+    index_mtime = (tmp_path / display_index.INDEX_FILE).stat().st_mtime_ns
+
+    # A new process: nothing in memory, and adding must not read the index
+    display_index._index = None
+    load = display_index._load
+    monkeypatch.setattr(display_index, "_load", lambda: pytest.fail("index read on add"))
+    storage.add_task(Task(title="Alpha", due_date=datetime.now()))
+    storage.add_task(Task(title="📅 Party", due_date=datetime.now()))
+    monkeypatch.setattr(display_index, "_load", load)
+
+    assert (tmp_path / display_index.INDEX_FILE).stat().st_mtime_ns == index_mtime
+    assert len((tmp_path / display_index.LOG_FILE).read_text().splitlines()) == 2
+
+    tasks = storage.load_tasks()
+    assert display_index.current() is not None  # replayed, not rebuilt
+    assert index_ids("tasks") == dashboard_ids(tasks, events=False)
+    assert index_ids("events") == dashboard_ids(tasks, events=True)
+
+
+def test_failed_block_leaves_no_logged_changes():
+    storage.save_tasks(sample_tasks())
+    tasks = storage.load_tasks()
+    display_index.get_index(tasks)
+
+    with pytest.raises(RuntimeError):
+        with atomic_io.deferred_writes():
+            storage.add_task(Task(title="Ghost"))
+            raise RuntimeError("interrupted")
+
+    assert not atomic_io.exists(display_index.LOG_FILE)
+    assert "Ghost" not in [t.title for t in storage.load_tasks()]
+    assert index_ids("tasks") == dashboard_ids(storage.load_tasks(), events=False)
+
+
+def test_bucket_ranges_split_sorted_entries():
+    storage.save_tasks(sample_tasks())
+    entries = display_index.get_index()["tasks"]
+    ranges = display_index.bucket_ranges(entries)
+
+    assert len(ranges) == 6
+    assert ranges[0][0] == 0 and ranges[-1][1] == len(entries)
+    table = TaskTable(storage.load_tasks())
+    buckets = table.dashboard_buckets(events=False)
+    assert [high - low for low, high in ranges] == [len(rows) for rows in buckets]
@@ -0,0 +1,90 @@
+"""
+Tests for the month-partitioned history store
+"""
+import json
+from datetime import date, datetime
+
+import pytest
+
+import atomic_io
+import history_storage
+from models import Task
+
+
+def _done(title, when, duration=None):
+    return Task(title=title, completed=True, completed_at=when, time_duration=duration)
+
+
+def test_appends_only_touch_their_segment(data_dir):
+    history_storage.add_to_history([_done("Jan", datetime(2026, 1, 5)), _done("Feb", datetime(2026, 2, 1))])
+    jan_mtime = (data_dir / "history" / "2026-01.jsonl").stat().st_mtime_ns
+
+    history_storage.add_to_history([_done("Feb again", datetime(2026, 2, 20))])
+
+    assert (data_dir / "history" / "2026-01.jsonl").stat().st_mtime_ns == jan_mtime
+    manifest = history_storage.load_manifest()["segments"]
+    assert manifest["2026-01"]["count"] == 1
+    assert manifest["2026-02"]["count"] == 2
+
+
+def test_ranged_load_reads_only_needed_segments(data_dir, monkeypatch):
+    history_storage.add_to_history([
+        _done("Old", datetime(2024, 6, 1)),
+        _done("Recent", datetime(2026, 3, 15)),
+        Task(title="No dates", completed=True),
+    ])
+
+    read = []
+    original = history_storage.load_segment
+    monkeypatch.setattr(history_storage, "load_segment", lambda key: (read.append(key), original(key))[1])
+
+    tasks = history_storage.load_history(start=date(2026, 3, 1), end=date(2026, 12, 31))
+    assert [t.title for t in tasks] == ["Recent"]
+    assert read == ["2026-03"]
+
+    assert len(history_storage.load_history()) == 3
+
+
+def test_legacy_history_json_is_migrated(data_dir):
+    legacy = [_done("Legacy", datetime(2025, 12, 31), 1200).to_dict()]
+    (data_dir / "history.json").write_text(json.dumps(legacy))
+
+    assert [t.title for t in history_storage.load_history()] == ["Legacy"]
+    assert not (data_dir / "history.json").exists()
+    assert history_storage.find_longest_segment() == "2025-12"
+
+
+def test_migration_in_failed_block_keeps_legacy_history(data_dir):
+    legacy = [_done("Legacy", datetime(2025, 12, 31)).to_dict()]
+    (data_dir / "history.json").write_text(json.dumps(legacy))
+
+    with pytest.raises(RuntimeError):
+        with atomic_io.deferred_writes():
+            history_storage.add_to_history([_done("New", datetime(2026, 1, 2))])
+            raise RuntimeError("interrupted")
+
+    assert (data_dir / "history.json").exists()
+    assert [t.title for t in history_storage.load_history()] == ["Legacy"]
+
+
+def test_migration_interrupted_before_rename_is_not_repeated(data_dir, monkeypatch):
+    legacy = [_done("Legacy", datetime(2025, 12, 31)).to_dict()]
+    (data_dir / "history.json").write_text(json.dumps(legacy))
+
+    set_aside = history_storage._set_aside_legacy_history
+    monkeypatch.setattr(history_storage, "_set_aside_legacy_history", lambda: None)
+    history_storage.load_manifest()
+    monkeypatch.setattr(history_storage, "_set_aside_legacy_history", set_aside)
+    assert (data_dir / "history.json").exists()
+
+    assert [t.title for t in history_storage.load_history()] == ["Legacy"]
+    assert not (data_dir / "history.json").exists()
+    assert history_storage.count_history() == 1
+
+
+def test_save_history_replaces_everything(data_dir):
+    history_storage.add_to_history([_done("A", datetime(2026, 1, 1))])
+    history_storage.save_history([])
+
+    assert history_storage.load_history() == []
+    assert not (data_dir / "history" / "2026-01.jsonl").exists()
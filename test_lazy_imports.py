@@ -0,0 +1,27 @@
+"""
+Tests for deferred module imports (lazy_imports)
+"""
+import sys
+
+from lazy_imports import LazyModule, lazy_module
+
+
+def test_lazy_module_imports_on_first_attribute_access(monkeypatch):
+    monkeypatch.delitem(sys.modules, "colorsys", raising=False)
+    colorsys = lazy_module("colorsys")
+
+    assert isinstance(colorsys, LazyModule)
+    assert "colorsys" not in sys.modules
+
+    assert colorsys.rgb_to_hsv(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
+    assert "colorsys" in sys.modules
+
+
+def test_lazy_module_returns_already_imported_module():
+    import json
+    assert lazy_module("json") is json
+
+
+def test_lazy_submodule():
+    parse = lazy_module("email.utils").parseaddr
+    assert parse("Zenith <zenith@example.com>") == ("Zenith", "zenith@example.com")
@@ -0,0 +1,37 @@
+"""Tests for the slotted Task model (lazy date parsing, to_dict parity)."""
+from datetime import datetime
+
+from models import Task
+
+
+def test_from_dict_keeps_raw_iso_until_accessed():
+    row = {"id": "abc", "title": "Write report", "due_date": "2026-03-01T09:30:00",
+           "completed": True, "completed_at": "2026-03-01T11:00:00"}
+    task = Task.from_dict(row)
+
+    assert not hasattr(task, "__dict__")
+    assert task._due_date == "2026-03-01T09:30:00"
+    assert task.due_date == datetime(2026, 3, 1, 9, 30)
+    assert isinstance(task._due_date, datetime)
+    assert task.completed_at == datetime(2026, 3, 1, 11, 0)
+
+
+def test_to_dict_roundtrip_matches_input():
+    task = Task(title="Gym", category=["Health"], due_date=datetime(2026, 3, 2, 18, 0), priority=1)
+    row = task.to_dict()
+    again = Task.from_dict(row)
+
+    assert again.to_dict() == row
+    assert again == task
+    assert row["due_date"] == "2026-03-02T18:00:00"
+    assert row["completed_at"] is None
+
+
+def test_setters_and_membership():
+    task = Task(title="Call mom")
+    other = Task.from_dict(task.to_dict())
+    task.due_date = datetime(2026, 3, 3)
+    other.due_date = "2026-03-03T00:00:00"
+
+    assert task in [other]
+    assert Task().id != Task().id
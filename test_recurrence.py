@@ -0,0 +1,152 @@
+"""
+Tests for the recurrence engine (rule compilation, window expansion, catch-up)
+"""
+import calendar
+from datetime import date, datetime, timedelta
+from itertools import islice
+
+import pytest
+
+import recurrence
+from models import Task
+from recurrence import catch_up, compile_rule, materialize, previews
+
+ANCHOR = datetime(2024, 1, 31, 9, 30)  # A Wednesday, last day of the month
+
+
+def _expected(kind, interval, days, start, end):
+    """Occurrence days of a rule in a window, by testing every single day."""
+    anchor = ANCHOR.date()
+    anchor_week = anchor.toordinal() - anchor.weekday()
+    result = []
+    day = max(start, anchor)
+    while day <= end:
+        weeks = (day.toordinal() - day.weekday() - anchor_week) // 7
+        if kind == "daily" or (kind == "custom" and not days):
+            hit = (day - anchor).days % interval == 0
+        elif kind == "weekdays":
+            hit = day.weekday() < 5 and weeks % interval == 0
+        elif kind in ("weekly", "biweekly"):
+            span = interval * (2 if kind == "biweekly" else 1)
+            hit = day.weekday() == anchor.weekday() and weeks % span == 0
+        elif kind == "custom":
+            hit = day.weekday() in days and weeks % interval == 0
+        else:
+            months = (day.year - anchor.year) * 12 + day.month - anchor.month
+            last = calendar.monthrange(day.year, day.month)[1]
+            hit = months % interval == 0 and day.day == min(anchor.day, last)
+        if hit:
+            result.append(datetime.combine(day, ANCHOR.time()))
+        day += timedelta(days=1)
+    return result
+
+
+@pytest.mark.parametrize("kind, interval, days", [
+    ("daily", 1, None),
+    ("daily", 3, None),
+    ("weekdays", 1, None),
+    ("weekly", 1, None),
+    ("weekly", 3, None),
+    ("biweekly", 1, None),
+    ("monthly", 1, None),
+    ("monthly", 5, None),
+    ("custom", 1, [0, 4]),
+    ("custom", 2, [1, 2, 6]),
+    ("custom", 4, None),
+])
+@pytest.mark.parametrize("start, end", [
+    (date(2024, 1, 1), date(2027, 12, 31)),    # Around the anchor, four years
+    (date(2031, 2, 1), date(2031, 3, 31)),     # A window years later
+    (date(2023, 1, 1), date(2023, 12, 31)),    # Before the anchor
+])
+def test_windows_match_a_day_by_day_scan(kind, interval, days, start, end):
+    rule = compile_rule(kind, ANCHOR, interval, days)
+    assert list(rule.between(start, end)) == _expected(kind, interval, days, start, end)
+
+
+def test_monthly_is_clamped_to_short_months():
+    rule = compile_rule("monthly", ANCHOR)
+    assert [d.date() for d in islice(rule.after(ANCHOR), 4)] == [
+        date(2024, 2, 29), date(2024, 3, 31), date(2024, 4, 30), date(2024, 5, 31),
+    ]
+
+
+def test_custom_days_are_honoured():
+    rule = compile_rule("custom", ANCHOR, 1, [0, 4])  # Mon, Fri
+    assert [d.date() for d in islice(rule.after(ANCHOR), 3)] == [
+        date(2024, 2, 2), date(2024, 2, 5), date(2024, 2, 9),
+    ]
+
+
+def test_after_is_strict_and_keeps_the_time():
+    rule = compile_rule("daily", ANCHOR)
+    assert rule.next_after(ANCHOR) == datetime(2024, 2, 1, 9, 30)
+    assert rule.next_after(datetime(2024, 2, 1, 9, 29)) == datetime(2024, 2, 1, 9, 30)
+
+
+def test_far_windows_start_without_walking_from_the_anchor():
+    rule = compile_rule("custom", ANCHOR, 2, [1, 3])
+    window = list(rule.between(date(9000, 1, 1), date(9000, 1, 31)))
+    assert window and all(d.year == 9000 for d in window)
+    assert list(rule.between(date(9999, 12, 1), date.max))  # Stops at the end of time
+
+
+def test_unknown_rule():
+    assert compile_rule("yearly", ANCHOR) is None
+
+
+def test_catch_up_splits_missed_and_upcoming():
+    rule = compile_rule("daily", ANCHOR)
+    missed, upcoming = catch_up(rule, ANCHOR, datetime(2024, 2, 14, 12, 0))
+    assert len(missed) == 14
+    assert missed[0] == datetime(2024, 2, 1, 9, 30)
+    assert upcoming == datetime(2024, 2, 15, 9, 30)
+
+    missed, upcoming = catch_up(rule, ANCHOR, datetime(2026, 1, 1), limit=5)
+    assert len(missed) == 5
+    assert missed[-1] == datetime(2025, 12, 31, 9, 30)
+
+
+def _recurring(**fields):
+    return Task(title="Water plants", category=["Home"], due_date=ANCHOR, recurrent=True, **fields)
+
+
+def test_materialize_a_stale_daily_task():
+    instances = materialize(_recurring(recurrence_type="daily"), now=datetime(2024, 2, 14, 12, 0))
+    assert len(instances) == 15
+    assert not any(t.recurrent for t in instances[:-1])
+    assert instances[-1].recurrent
+    assert instances[-1].due_date == datetime(2024, 2, 15, 9, 30)
+    assert instances[-1].category == ["Home"]
+
+
+def test_materialize_on_time_creates_only_the_next_instance():
+    task = _recurring(recurrence_type="weekly", recurrence_interval=2)
+    instances = materialize(task, now=datetime(2024, 1, 31, 8, 0))
+    assert [t.due_date for t in instances] == [datetime(2024, 2, 14, 9, 30)]
+
+
+def test_materialize_undated_task_starts_now():
+    task = Task(title="Stretch", recurrent=True, recurrence_type="daily")
+    instances = materialize(task, now=datetime(2024, 3, 1, 7, 0))
+    assert [t.due_date for t in instances] == [datetime(2024, 3, 2, 7, 0)]
+
+
+def test_previews_skip_completed_and_one_off_tasks():
+    weekly = _recurring(recurrence_type="weekly")
+    done = _recurring(recurrence_type="daily", completed=True)
+    plain = Task(title="Once", due_date=ANCHOR)
+    found = list(previews([weekly, done, plain], date(2024, 1, 1), date(2024, 2, 29)))
+    assert [when.date() for when, _ in found] == [date(2024, 1, 31), date(2024, 2, 7), date(2024, 2, 14),
+                                                  date(2024, 2, 21), date(2024, 2, 28)]
+    assert all(task is weekly for _, task in found)
+
+
+@pytest.mark.parametrize("fields, text", [
+    ({"recurrence_type": "daily"}, "Daily"),
+    ({"recurrence_type": "weekly", "recurrence_interval": 2}, "Every 2 weeks"),
+    ({"recurrence_type": "custom", "recurrence_days": [4, 0]}, "Every Mon, Fri"),
+    ({"recurrence_type": "weekdays"}, "Weekdays"),
+])
+def test_describe(fields, text):
+    assert recurrence.describe(_recurring(**fields)) == text
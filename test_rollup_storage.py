@@ -0,0 +1,69 @@
+"""
+Tests for the daily statistics rollup kept alongside the history
+"""
+from datetime import datetime, timedelta
+
+import atomic_io
+import history_storage
+import rollup_storage
+from models import Task
+from stats_calculator import aggregate, aggregate_rollup
+
+
+def _done(title, when, duration=None, category=None):
+    return Task(title=title, category=category, completed=True, completed_at=when, time_duration=duration)
+
+
+def _history():
+    now = datetime.now()
+    return [
+        _done("Report", now, 3600, ["Work"]),
+        _done("Mail", now, 600, ["Work", "Home"]),
+        _done("Gym", now - timedelta(days=3), None, ["Health"]),
+        _done("Taxes", now - timedelta(days=50), 7200),
+        Task(title="No dates", completed=True),
+    ]
+
+
+def test_appends_keep_rollup_equal_to_rebuild(data_dir):
+    tasks = _history()
+    history_storage.add_to_history(tasks[:2])
+    history_storage.add_to_history(tasks[2:])
+
+    incremental = rollup_storage.load_rollup()
+    assert incremental["tasks"] == 5
+    assert incremental == rollup_storage.rebuild()
+    assert incremental["longest"]["title"] == "Taxes"
+
+
+def test_rollup_summary_matches_history_pass(data_dir):
+    history_storage.add_to_history(_history())
+
+    from_rollup = aggregate_rollup(rollup_storage.load_rollup(), days=90, by_category=True, by_weekday=True)
+    from_history = aggregate(history_storage.load_history(), days=90, by_category=True, by_weekday=True)
+
+    assert from_rollup.daily_count == from_history.daily_count
+    assert from_rollup.daily_time == from_history.daily_time
+    assert from_rollup.by_category == from_history.by_category
+    assert from_rollup.by_weekday == from_history.by_weekday
+    assert from_rollup.longest_task[1] == from_history.longest_task[1] == 7200
+
+
+def test_missing_or_stale_rollup_is_rebuilt(data_dir):
+    history_storage.add_to_history(_history()[:2])
+    (data_dir / rollup_storage.ROLLUP_FILE).unlink()
+
+    history_storage.add_to_history(_history()[2:3])  # Can't be added to a missing rollup
+    assert not (data_dir / rollup_storage.ROLLUP_FILE).exists()
+    assert rollup_storage.load_rollup()["tasks"] == 3
+
+    atomic_io.write_json(rollup_storage.ROLLUP_FILE, {"tasks": 99, "days": {}, "longest": None})
+    history_storage.add_to_history(_history()[3:4])
+    assert rollup_storage.load_rollup()["tasks"] == 4
+
+
+def test_reset_with_history(data_dir):
+    history_storage.add_to_history(_history())
+    history_storage.save_history([])
+
+    assert rollup_storage.load_rollup() == {"tasks": 0, "days": {}, "longest": None}
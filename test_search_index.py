@@ -0,0 +1,169 @@
+"""
+Tests for full-text search (incremental index over tasks, history, notes and goals)
+"""
+import os
+from datetime import datetime
+
+import pytest
+
+import history_storage
+import search_index
+import storage
+from goals_storage import save_goals
+from models import Goal, Task
+from notes_storage import Note, save_notes
+
+
+@pytest.fixture
+def store(store):
+    try:
+        search_index.get_connection()
+    except RuntimeError:
+        pytest.skip("SQLite without FTS5")
+    return store
+
+
+def _titles(query, kinds=None):
+    hits, _ = search_index.search(query, kinds)
+    return [hit.title for hit in hits]
+
+
+def test_query_translation():
+    assert search_index.to_match("milk") == '"milk"'
+    assert search_index.to_match('rep* "buy  the milk"') == '"rep"* "buy the milk"'
+    # Punctuation can't reach FTS5 syntax
+    assert search_index.to_match("AND (x) -y:z") == '"AND" "x" "y" "z"'
+    with pytest.raises(ValueError):
+        search_index.to_match(' ** "" ')
+
+
+def test_task_writes_are_followed_without_reindexing(store, monkeypatch):
+    storage.add_tasks([Task(title="Buy milk", category="Home"), Task(title="Call bank")])
+    assert _titles("milk") == ["Buy milk"]
+
+    # From now on, a search must only replay the logged changes
+    monkeypatch.setattr(storage, "find_tasks", lambda **kw: pytest.fail("re-indexed all tasks"))
+    storage.add_task(Task(title="Milkshake recipe"))
+    tasks = storage.load_tasks()
+    for task in tasks:
+        if task.title == "Call bank":
+            task.title = "Call bank about milk money"
+    tasks = [task for task in tasks if task.title != "Buy milk"]
+    storage.save_tasks(tasks)
+
+    assert sorted(_titles("milk*")) == ["Call bank about milk money", "Milkshake recipe"]
+    assert _titles("home") == []
+
+
+def test_records_appended_during_a_search_are_not_lost(store, monkeypatch):
+    storage.add_tasks([Task(title="Buy milk")])
+    assert _titles("milk") == ["Buy milk"]
+    storage.add_tasks([Task(title="Warm milk")])
+
+    # Another process writes once this one has caught up with the log
+    refresh_history = search_index._refresh_history
+
+    def write_then_refresh(conn):
+        monkeypatch.setattr(search_index, "_refresh_history", refresh_history)
+        storage.add_tasks([Task(title="Milk the cow")])
+        refresh_history(conn)
+    monkeypatch.setattr(search_index, "_refresh_history", write_then_refresh)
+    assert sorted(_titles("milk")) == ["Buy milk", "Warm milk"]
+
+    # Its record is still there to replay: no full re-index
+    monkeypatch.setattr(storage, "find_tasks", lambda **kw: pytest.fail("re-indexed all tasks"))
+    storage.add_tasks([Task(title="Oat milk")])
+    assert sorted(_titles("milk")) == ["Buy milk", "Milk the cow", "Oat milk", "Warm milk"]
+
+
+def test_dropped_log_is_read_again_from_the_start(store):
+    storage.add_tasks([Task(title="Buy milk")])
+    _titles("milk")
+    storage.add_tasks([Task(title="Warm milk"), Task(title="Hot milk")])
+    _titles("milk")
+
+    os.remove(search_index.LOG_FILE)  # As when it grew past MAX_LOG_BYTES
+    storage.add_tasks([Task(title="Milk the cow")])
+    assert sorted(_titles("milk")) == ["Buy milk", "Hot milk", "Milk the cow", "Warm milk"]
+
+
+def test_changes_behind_its_back_trigger_a_reindex(store, monkeypatch):
+    storage.add_tasks([Task(title="Buy milk")])
+    assert _titles("milk") == ["Buy milk"]
+
+    # A write the index never heard of (another tool, an older version): the chain is broken
+    record_changes = search_index.record_changes
+    monkeypatch.setattr(search_index, "record_changes", lambda *args, **kwargs: None)
+    storage.add_tasks([Task(title="Warm milk")])
+    monkeypatch.setattr(search_index, "record_changes", record_changes)
+    storage.add_tasks([Task(title="Milk the cow")])
+
+    assert sorted(_titles("milk")) == ["Buy milk", "Milk the cow", "Warm milk"]
+
+
+def test_history_is_read_from_where_it_was_left(store, monkeypatch):
+    when = datetime(2026, 3, 14, 10, 0)
+    history_storage.add_to_history([Task(title="Paint fence", completed=True, completed_at=when)])
+    assert _titles("fence", ["history"]) == ["Paint fence"]
+
+    history_storage.add_to_history([Task(title="Fix fence gate", completed=True, completed_at=when)])
+    offsets = []
+    tail_segment = history_storage.tail_segment
+    monkeypatch.setattr(history_storage, "tail_segment",
+                        lambda key, offset=0: offsets.append(offset) or tail_segment(key, offset))
+
+    assert sorted(_titles("fence", ["history"])) == ["Fix fence gate", "Paint fence"]
+    assert len(offsets) == 1 and offsets[0] > 0
+
+
+def test_reset_history_is_reindexed(store):
+    when = datetime(2026, 3, 14, 10, 0)
+    history_storage.add_to_history([Task(title="Paint fence", completed=True, completed_at=when)])
+    assert _titles("fence") == ["Paint fence"]
+
+    # Segment replaced by a longer one starting with a different task
+    for name in os.listdir(history_storage.HISTORY_DIR):
+        if name.endswith(".jsonl"):
+            os.remove(os.path.join(history_storage.HISTORY_DIR, name))
+    history_storage.add_to_history([Task(title="Mow lawn near the fence", completed=True, completed_at=when),
+                                    Task(title="Rake leaves", completed=True, completed_at=when)])
+    assert _titles("fence") == ["Mow lawn near the fence"]
+
+
+def test_notes_and_goals(store):
+    save_notes([Note("Wifi password is on the fridge")])
+    save_goals([Goal(title="Run a marathon")])
+    assert _titles("fridge") == ["Wifi password is on the fridge"]
+    assert _titles("marathon", ["goal"]) == ["Run a marathon"]
+
+    save_notes([Note("Door code 1234")])
+    assert _titles("fridge") == []
+    assert _titles("1234", ["note"]) == ["Door code 1234"]
+
+
+def test_titles_rank_above_descriptions(store):
+    storage.add_tasks([
+        Task(title="Quarterly report", description="mention the budget"),
+        Task(title="Budget review"),
+        Task(title="Lunch", category="Budget"),
+    ])
+    hits, total = search_index.search("budget")
+    assert total == 3
+    assert [hit.title for hit in hits] == ["Budget review", "Lunch", "Quarterly report"]
+    assert hits[0].marked == f"{search_index.MATCH_START}Budget{search_index.MATCH_END} review"
+
+    hits, total = search_index.search("budget", limit=1)
+    assert total == 3 and len(hits) == 1
+
+
+def test_phrases_and_accents(store):
+    storage.add_tasks([Task(title="Café order for the team"), Task(title="Team order café")])
+    assert _titles('"cafe order"') == ["Café order for the team"]
+
+
+def test_rebuild(store):
+    storage.add_tasks([Task(title="Buy milk")])
+    _titles("milk")
+    search_index.rebuild()
+    assert search_index.count() == 1
+    assert _titles("milk") == ["Buy milk"]
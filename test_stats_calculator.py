@@ -0,0 +1,53 @@
+"""
+Tests for the single-pass statistics aggregation
+"""
+from datetime import datetime, timedelta
+
+from models import Task
+import stats_calculator
+from stats_calculator import aggregate
+
+
+def sample_history():
+    now = datetime.now().replace(hour=12, minute=0, second=0, microsecond=0)
+    return [
+        Task(title="Report", category=["Work"], completed=True, completed_at=now, time_duration=3600),
+        Task(title="Mail", category=["Work", "Home"], completed=True, completed_at=now, time_duration=600),
+        Task(title="Gym", category=["Health"], completed=True, completed_at=now - timedelta(days=3)),
+        Task(title="Old", completed=True, completed_at=now - timedelta(days=40), time_duration=7200),
+        Task(title="Open", completed=False, completed_at=now, time_duration=9999),
+        Task(title="Undated", completed=True, time_duration=60),
+    ]
+
+
+def test_matches_the_separate_passes():
+    history = [Task.from_dict(task.to_dict()) for task in sample_history()]  # Raw ISO dates
+    summary = aggregate(history, days=30)
+
+    assert summary.daily_time == stats_calculator.calculate_daily_time(history, 30)
+    assert summary.daily_count == stats_calculator.calculate_daily_task_count(history, 30)
+    assert summary.date_range == stats_calculator.get_date_range(30)
+    longest, duration = summary.longest_task
+    assert (longest.title, duration) == ("Old", 7200)
+    assert summary.total_tasks == 3 and summary.total_time == 4200
+
+
+def test_custom_window_and_groupings():
+    today = datetime.now().date()
+    summary = aggregate(sample_history(), start=today - timedelta(days=45), end=today - timedelta(days=1),
+                        by_category=True, by_weekday=True)
+
+    assert summary.days == 45
+    assert summary.by_category == {"General": [1, 7200], "Health": [1, 0]}
+    old_day = today - timedelta(days=40)
+    assert summary.by_weekday[old_day.weekday()][0] >= 1
+    assert sum(count for count, _ in summary.by_weekday) == 2
+
+
+def test_long_windows_group_chart_bars():
+    summary = aggregate(sample_history(), days=365)
+    bars = summary.chart_bars(max_bars=31)
+
+    assert len(bars) <= 31
+    assert bars[0][0] == summary.start.isoformat()
+    assert sum(seconds for _, seconds in bars) == summary.total_time
@@ -0,0 +1,179 @@
+"""
+Tests for the pluggable task storage backends (JSON and SQLite)
+"""
+import json
+
+import journal_storage
+import storage
+import sqlite_storage
+from models import Task
+
+
+def test_json_roundtrip(data_dir):
+    storage.add_task(Task(title="First"))
+    storage.add_task(Task(title="Second", priority=1))
+
+    tasks = storage.load_tasks()
+    assert [t.title for t in tasks] == ["First", "Second"]
+
+    storage.delete_tasks([tasks[0].id])
+    assert [t.title for t in storage.load_tasks()] == ["Second"]
+
+
+def test_migrate_to_sqlite_and_back(data_dir):
+    storage.save_tasks([Task(title=f"Task {i}") for i in range(5)])
+    assert storage.migrate_tasks("sqlite") == 5
+    assert storage.get_backend() == "sqlite"
+    assert [t.title for t in storage.load_tasks()] == [f"Task {i}" for i in range(5)]
+
+    storage.migrate_tasks("json")
+    with open("tasks.json") as f:
+        assert len(json.load(f)) == 5
+
+
+def test_sqlite_save_only_writes_changed_rows(data_dir, monkeypatch):
+    storage.migrate_tasks("sqlite")
+    storage.add_tasks([Task(title=f"Task {i}") for i in range(10)])
+
+    tasks = storage.load_tasks()
+    tasks[3].completed = True
+    del tasks[5]
+
+    written = []
+    original = sqlite_storage.apply_changes
+    monkeypatch.setattr(sqlite_storage, "apply_changes",
+                        lambda upserts, deletes: (written.append((upserts, deletes)), original(upserts, deletes)))
+    storage.save_tasks(tasks)
+
+    upserts, deletes = written[0]
+    assert [r["title"] for r in upserts] == ["Task 3"]
+    assert len(deletes) == 1
+
+    reloaded = storage.load_tasks()
+    assert len(reloaded) == 9
+    assert reloaded[3].completed
+    assert [t.title for t in storage.find_tasks(completed=True)] == ["Task 3"]
+
+
+def test_sqlite_imports_existing_json_once(data_dir):
+    storage.save_tasks([Task(title="Legacy")])
+
+    with open("config.json", "w") as f:
+        json.dump({"storage_backend": "sqlite"}, f)
+
+    assert [t.title for t in storage.load_tasks()] == ["Legacy"]
+    sqlite_storage.close()
+
+
+def test_json_add_appends_to_journal(data_dir):
+    storage.save_tasks([Task(title="Snapshot")])
+    snapshot_mtime = (data_dir / "tasks.json").stat().st_mtime_ns
+
+    storage.add_task(Task(title="Journaled"))
+
+    assert (data_dir / "tasks.json").stat().st_mtime_ns == snapshot_mtime
+    assert [op["op"] for op in journal_storage.read_ops()] == ["add"]
+    assert [t.title for t in storage.load_tasks()] == ["Snapshot", "Journaled"]
+
+
+def test_json_save_journals_field_updates(data_dir):
+    storage.save_tasks([Task(title="A"), Task(title="B")])
+
+    tasks = storage.load_tasks()
+    tasks[1].completed = True
+    storage.save_tasks(tasks)
+
+    ops = journal_storage.read_ops()
+    assert len(ops) == 1 and ops[0]["op"] == "update"
+    assert ops[0]["fields"] == {"completed": True}
+
+    # A torn trailing record (crash mid-append) is ignored on replay
+    with open(journal_storage.JOURNAL_FILE, "a") as f:
+        f.write('{"op": "delete", "id"')
+    assert [t.completed for t in storage.load_tasks()] == [False, True]
+
+    storage.add_task(Task(title="After crash"))
+    assert [t.title for t in storage.load_tasks()] == ["A", "B", "After crash"]
+
+
+def test_journal_compaction(data_dir, monkeypatch):
+    monkeypatch.setattr(journal_storage, "COMPACT_THRESHOLD_BYTES", 2048)
+
+    for i in range(30):
+        storage.add_task(Task(title=f"Task {i}"))
+
+    assert journal_storage.journal_size() < 2048
+    with open("tasks.json") as f:
+        assert len(json.load(f)) >= 1
+    assert [t.title for t in storage.load_tasks()] == [f"Task {i}" for i in range(30)]
+
+
+def test_loads_reuse_snapshot_until_files_change(data_dir, monkeypatch):
+    storage.save_tasks([Task(title="First")])
+    storage.load_tasks()
+
+    reads = []
+    original = storage._json_load_rows
+    monkeypatch.setattr(storage, "_json_load_rows", lambda: reads.append(1) or original())
+
+    assert [t.title for t in storage.load_tasks()] == ["First"]
+    storage.add_task(Task(title="Second"))
+    assert [t.title for t in storage.load_tasks()] == ["First", "Second"]
+    assert reads == []
+
+    # An edit from another process is picked up
+    with open("tasks.json", "w") as f:
+        json.dump([Task(title="Edited").to_dict()], f)
+    journal_storage.clear_journal()
+    assert [t.title for t in storage.load_tasks()] == ["Edited"]
+    assert reads == [1]
+
+
+def test_save_after_outside_edit_diffs_against_disk(data_dir):
+    storage.save_tasks([Task(title="First")])
+    storage.load_tasks()
+
+    # Another process adds a task while this one holds a snapshot
+    journal_storage.append_ops([journal_storage.add_op(Task(title="External").to_dict())])
+
+    storage.save_tasks([])
+    assert storage.load_tasks() == []
+    storage._snapshot = None
+    assert storage.load_tasks() == []
+
+
+def test_add_after_outside_edit_keeps_outside_task(data_dir):
+    storage.save_tasks([Task(title="First")])
+    storage.load_tasks()
+
+    journal_storage.append_ops([journal_storage.add_op(Task(title="External").to_dict())])
+    storage.add_task(Task(title="Mine"))
+
+    assert [t.title for t in storage.load_tasks()] == ["First", "External", "Mine"]
+
+
+def test_sqlite_connection_follows_working_directory(data_dir, monkeypatch):
+    first, second = data_dir / "a", data_dir / "b"
+    first.mkdir()
+    second.mkdir()
+    for directory in (first, second):
+        (directory / "config.json").write_text(json.dumps({"storage_backend": "sqlite"}))
+
+    monkeypatch.chdir(first)
+    storage.add_task(Task(title="In A"))
+    monkeypatch.chdir(second)
+    storage.add_task(Task(title="In B"))
+    assert [t.title for t in storage.load_tasks()] == ["In B"]
+
+    monkeypatch.chdir(first)
+    assert [t.title for t in storage.load_tasks()] == ["In A"]
+    assert (second / "tasks.db").exists()
+
+
+def test_get_tasks_builds_only_requested_tasks(data_dir):
+    tasks = [Task(title=f"Task {i}") for i in range(5)]
+    storage.save_tasks(tasks)
+
+    found = storage.get_tasks([tasks[3].id, tasks[1].id, "missing"])
+    assert {task_id: task.title for task_id, task in found.items()} == {
+        tasks[3].id: "Task 3", tasks[1].id: "Task 1"}
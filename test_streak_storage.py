@@ -0,0 +1,62 @@
+"""
+Tests for the completion-day calendar behind the streak
+"""
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+import history_storage
+import storage
+import streak_storage
+from models import Task
+
+
+pytestmark = pytest.mark.usefixtures("data_dir")
+
+
+def _done(days_ago):
+    return Task(title=f"Done {days_ago}", completed=True,
+                completed_at=datetime.now() - timedelta(days=days_ago))
+
+
+def test_calendar_is_built_from_history_and_tasks():
+    history_storage.add_to_history([_done(d) for d in (1, 2, 3, 10, 11)])
+    storage.save_tasks([_done(0), Task(title="Open")])
+
+    assert streak_storage.get_streak_status() == (4, True)
+    assert streak_storage.get_longest_streak() == 4
+    assert streak_storage.streak_at(datetime.now().date() - timedelta(days=10)) == 2
+    assert streak_storage.streak_at(datetime.now().date() - timedelta(days=5)) == 0
+
+
+def test_completion_marks_today_and_joins_runs():
+    history_storage.add_to_history([_done(d) for d in (1, 2)])
+    assert streak_storage.get_streak_status() == (2, False)  # Alive until today is missed
+
+    streak_storage.update_streak()
+    assert streak_storage.get_streak_status() == (3, True)
+    assert streak_storage.get_longest_streak() == 3
+
+    streak_storage.mark_day(datetime.now().date() - timedelta(days=40))  # Before the first day
+    assert streak_storage.get_streak_status() == (3, True)
+    assert streak_storage.streak_at(datetime.now().date() - timedelta(days=40)) == 1
+
+
+def test_broken_streak_and_legacy_backfill(tmp_path):
+    history_storage.add_to_history([_done(d) for d in (3, 4)])
+    assert streak_storage.get_streak_status() == (0, False)
+
+    yesterday = (datetime.now().date() - timedelta(days=1)).isoformat()
+    (tmp_path / "streak.json").write_text(json.dumps({"streak": 5, "last_date": yesterday}))
+    streak_storage.rebuild()
+    assert streak_storage.get_streak_status() == (5, False)
+
+
+def test_history_change_triggers_rebuild():
+    streak_storage.update_streak()
+    assert streak_storage.get_streak_status() == (1, True)
+
+    history_storage.save_history([_done(d) for d in (1, 2, 3)])
+    # Today's mark came from neither history nor tasks: the rebuilt calendar drops it
+    assert streak_storage.get_streak_status() == (3, False)
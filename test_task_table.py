@@ -0,0 +1,130 @@
+"""Tests for the columnar TaskTable (filters, ordering, dashboard order parity)."""
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+import storage
+import task_table
+from models import Task
+from task_table import TaskTable, due_parts
+
+TODAY = datetime(2026, 3, 10, 12, 0)
+
+
+def make_tasks(count=300, seed=7):
+    rng = random.Random(seed)
+    tasks = []
+    for i in range(count):
+        due = None
+        if rng.random() < 0.8:
+            due = TODAY + timedelta(days=rng.randint(-10, 60), hours=rng.randint(-5, 5))
+        category = rng.choice([None, ["Work"], ["home", "Work"], ["Errands"], "Legacy"])
+        title = ("📅 " if rng.random() < 0.2 else "") + f"Task {rng.randint(0, 50)}"
+        tasks.append(Task(title=title, category=category, due_date=due,
+                          priority=rng.choice([-1, 0, 1]), completed=rng.random() < 0.3,
+                          recurrent=rng.random() < 0.1))
+    return tasks
+
+
+def reference_dashboard_order(tasks, today):
+    """The list-based ordering the dashboard used before TaskTable."""
+    tomorrow = today + timedelta(days=1)
+    week_end = today + timedelta(days=7)
+    month_end = today + timedelta(days=30)
+    groups = [[], [], [], [], [], []]
+    for task in tasks:
+        if not task.due_date:
+            groups[0].append(task)
+            continue
+        d = task.due_date.date()
+        if d == today:
+            groups[1].append(task)
+        elif d == tomorrow:
+            groups[2].append(task)
+        elif d <= week_end:
+            groups[3].append(task)
+        elif d <= month_end:
+            groups[4].append(task)
+        else:
+            groups[5].append(task)
+    ordered = []
+    for group in groups:
+        group.sort(key=lambda t: (
+            (t.category[0].lower() if isinstance(t.category, list) and t.category else (t.category.lower() if isinstance(t.category, str) else "")) if t.category else "",
+            -t.priority,
+            t.due_date if t.due_date else datetime.max,
+            t.title.lower()
+        ))
+        ordered.extend(group)
+    return ordered
+
+
+def test_dashboard_order_matches_list_implementation():
+    tasks = make_tasks()
+    table = TaskTable(tasks)
+    for events in (False, True):
+        subset = [t for t in tasks if t.title.startswith("📅") == events]
+        expected = reference_dashboard_order(subset, TODAY.date())
+        got = table.materialize(table.dashboard_order(events=events, today=TODAY.date()))
+        assert [t.id for t in got] == [t.id for t in expected]
+
+
+def test_select_filters_match_list_comprehensions():
+    tasks = make_tasks()
+    table = TaskTable(tasks)
+    start, end = TODAY.date(), TODAY.date() + timedelta(days=7)
+
+    rows = table.select(due_from=start, due_to=end, completed=False, category="Work")
+    expected = [t for t in tasks if t.due_date and start <= t.due_date.date() <= end
+                and not t.completed and isinstance(t.category, list) and "Work" in t.category]
+    assert table.materialize(rows) == expected
+
+    assert table.materialize(table.select(priority=1, events=False)) == \
+        [t for t in tasks if t.priority == 1 and not t.title.startswith("📅")]
+    assert table.materialize(table.select(table.select(recurrent=True), due_to=start)) == \
+        [t for t in tasks if t.recurrent and t.due_date and t.due_date.date() <= start]
+
+
+def test_columns_and_visible_position():
+    tasks = [Task(title="b", due_date=TODAY), Task(title="a"), Task(title="c", due_date=TODAY), Task(title="d")]
+    table = TaskTable(tasks)
+
+    assert [table.title(row) for row in range(4)] == ["b", "a", "c", "d"]
+    assert table.undated() == [1, 3]
+    assert table.argsort([0, 1, 2, 3], keys=("title",)) == [1, 0, 2, 3]
+    # Undated rows are numbered first, then dated rows in load order
+    assert [table.visible_position(row) for row in range(4)] == [3, 1, 4, 2]
+    assert table.materialize([2])[0] is tasks[2]
+    assert len(TaskTable([])) == 0
+
+
+def test_table_from_disk_rows_leaves_dates_unparsed():
+    tasks = make_tasks()
+    loaded = [Task.from_dict(t.to_dict()) for t in tasks]
+    table = TaskTable(loaded)
+
+    assert all(isinstance(t._due_date, (str, type(None))) for t in loaded)
+    assert list(table.due_key) == list(TaskTable(tasks).due_key)
+    assert table.materialize(table.dashboard_order(today=TODAY.date())) == \
+        TaskTable(tasks).materialize(TaskTable(tasks).dashboard_order(today=TODAY.date()))
+
+
+def test_load_table_is_reused_until_tasks_change(data_dir):
+    storage.add_task(Task(title="First"))
+
+    table = task_table.load_table()
+    assert task_table.load_table() is table
+
+    storage.add_task(Task(title="Second"))
+    assert [t.title for t in task_table.load_table().tasks] == ["First", "Second"]
+
+
+@pytest.mark.parametrize("raw", [
+    "2026-10-16", "2026-10-16T14:00", "2026-10-16 14:05", "2026-10-16T14:05:30",
+    "2026-10-16T14:05:30.250000", "2026-10-16T14", "20261016T1405",
+])
+def test_due_parts_of_raw_strings_agree_with_parsed_dates(raw):
+    due = datetime.fromisoformat(raw)
+    expected = (due.toordinal(), due.hour * 3600 + due.minute * 60 + due.second)
+    assert due_parts(Task.from_dict({"title": "T", "due_date": raw})) == expected
@@ -0,0 +1,80 @@
+"""Tests for the daemon protocol and the client's direct-mode fallback."""
+import io
+import json
+import socket
+import threading
+
+import pytest
+
+import zenith_client
+import zenith_daemon
+from cli_args import can_run_in_daemon, normalize_argv
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs Unix domain sockets")
+
+
+def serve_once(request: dict) -> tuple:
+    """Run one request through zenith_daemon.handle over a socket pair."""
+    server, client = socket.socketpair()
+    thread = threading.Thread(target=lambda: zenith_daemon.handle(server))
+    thread.start()
+    with client:
+        client.sendall((json.dumps(request) + "\n").encode())
+        out = io.StringIO()
+        lines = client.makefile("r", encoding="utf-8")
+        code = None
+        for line in lines:
+            message = json.loads(line)
+            if "out" in message:
+                out.write(message["out"])
+            else:
+                code = message["exit"]
+                break
+    thread.join()
+    server.close()
+    return code, out.getvalue()
+
+
+def test_commands_run_in_daemon_process(data_dir):
+    code, output = serve_once({"argv": ["add", "Water plants", "-d", "today"], "cwd": str(data_dir),
+                               "width": 100, "terminal": False})
+    assert code == 0
+    assert "Task added" in output
+
+    code, output = serve_once({"argv": ["today"], "cwd": str(data_dir), "width": 100, "terminal": False})
+    assert code == 0
+    assert "Water plants" in output
+    assert "\x1b[" not in output  # no colors for a non-terminal client
+
+
+def test_ping_and_usage_errors(data_dir):
+    assert serve_once({"control": "ping"}) == (0, "")
+    code, output = serve_once({"argv": ["no-such-command"], "cwd": str(data_dir), "width": 80, "terminal": False})
+    assert code != 0
+    assert "No such command" in output
+
+
+def test_bad_requests_still_get_an_exit_code(data_dir):
+    assert serve_once({"argv": ["today"], "cwd": str(data_dir), "width": "wide"})[0] == 1
+    code, output = serve_once({"argv": ["today"], "cwd": str(data_dir / "gone"), "width": 80})
+    assert code == 1
+    assert "Error" in output
+
+
+def test_client_falls_back_without_daemon(data_dir, monkeypatch):
+    monkeypatch.setenv(zenith_client.SOCKET_ENV, str(data_dir / "missing.sock"))
+    assert zenith_client.run_remote(["today"]) is None
+
+
+def test_only_non_interactive_commands_go_to_daemon():
+    assert can_run_in_daemon(normalize_argv(["today"]))
+    assert can_run_in_daemon(["add", "Task", "-d", "today"])
+    assert can_run_in_daemon(["check", "1,2"])
+    assert not can_run_in_daemon(["add"])
+    assert not can_run_in_daemon(["add", "Task", "-r"])
+    assert not can_run_in_daemon(["add", "*standup"])
+    assert not can_run_in_daemon(["check"])
+    assert can_run_in_daemon(["db", "-p", "2"])
+    assert not can_run_in_daemon(["dashboard", "-i"])
+    assert not can_run_in_daemon(normalize_argv(["1", "-c", "2"]))
+    assert not can_run_in_daemon([])
@@ -1,25 +1,18 @@
 from rich import box
 from rich.console import Console
-from rich.layout import Layout
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
-from rich.style import Style
 from rich.align import Align
-from rich.columns import Columns
 from datetime import datetime
 from models import Task
-from typing import List
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 import calendar
 
-from config_storage import get_theme, get_category_colors, update_category_color
+from config_storage import get_theme, get_category_colors, update_category_colors
 from categories_storage import load_categories
-
-def get_current_theme():
-    # Helper to get theme dict
-    import config_storage
-    theme_name = config_storage.get_theme()
-    return THEMES.get(theme_name, THEMES["rainbow"])
+import recurrence
+from calendar_index import CalendarIndex
 
 AVAILABLE_COLORS = [
     "bright_cyan", "bright_magenta", "bright_green", "bright_yellow", "bright_blue", "bright_red",
@@ -28,32 +21,50 @@ AVAILABLE_COLORS = [
     "spring_green1", "medium_orchid1", "deep_sky_blue1"
 ]
 
-def get_category_color(category_name: str) -> str:
-    """Get consistent, persistent color for a category."""
-    if not category_name:
-        return "white"
-        
-    colors = get_category_colors()
-    if category_name in colors:
-        return colors[category_name]
-    
-    # Assign new color (try to be unique)
-    used_colors = set(colors.values())
-    
-    # Find first unused color
+def _task_categories(task: Task) -> List[str]:
+    if not task.category:
+        return []
+    return task.category if isinstance(task.category, list) else [task.category]
+
+def _new_color(category_name: str, used_colors: set) -> str:
+    # First unused color, or cycle using a hash once all are taken
     for color in AVAILABLE_COLORS:
         if color not in used_colors:
-            update_category_color(category_name, color)
             return color
-            
-    # If all used, cycle using hash
     import hashlib
     hash_val = int(hashlib.md5(category_name.encode()).hexdigest(), 16)
-    idx = hash_val % len(AVAILABLE_COLORS)
-    color = AVAILABLE_COLORS[idx]
-    
-    update_category_color(category_name, color)
-    return color
+    return AVAILABLE_COLORS[hash_val % len(AVAILABLE_COLORS)]
+
+def resolve_category_colors(categories: Iterable[str]) -> Dict[str, str]:
+    """
+    Palette (category -> color) covering all given categories.
+
+    Categories without a color yet are assigned one in a single pass (in
+    alphabetical order, so the result doesn't depend on task order) and
+    saved with one config write.
+    """
+    colors = get_category_colors()
+    missing = sorted({name for name in categories if name} - colors.keys())
+    if missing:
+        used_colors = set(colors.values())
+        assigned = {}
+        for name in missing:
+            color = _new_color(name, used_colors)
+            used_colors.add(color)
+            assigned[name] = color
+        update_category_colors(assigned)
+        colors.update(assigned)
+    return colors
+
+def task_palette(tasks: Iterable[Task]) -> Dict[str, str]:
+    """Resolve the colors of every category used by the given tasks up front."""
+    return resolve_category_colors(cat for task in tasks for cat in _task_categories(task))
+
+def get_category_color(category_name: str) -> str:
+    """Get consistent, persistent color for a category."""
+    if not category_name:
+        return "white"
+    return resolve_category_colors([category_name])[category_name]
 
 console = Console(force_terminal=True)
 
@@ -105,227 +116,297 @@ def get_rainbow_style(index: int) -> str:
     colors = theme["rainbow_colors"]
     return colors[index % len(colors)]
 
+# Dashboard buckets, in the order TaskTable.dashboard_buckets() returns them
+GROUP_NAMES = ["non-assigned", "Today", "Tomorrow", "This week", "This month", "Future"]
+
+# Pre-styled group headers, keyed by (name, color)
+_header_cache = {}
+
+def _group_header(name: str, color: str) -> Text:
+    header = _header_cache.get((name, color))
+    if header is None:
+        header = _header_cache[(name, color)] = Text(name, style=f"bold {color}")
+    return header
+
+def _category_counts(tasks: Iterable[Task]) -> Dict[str, int]:
+    """Category frequency (lowercased) used to order a task's tags."""
+    from collections import Counter
+    counter = Counter()
+    for task in tasks:
+        for cat in _task_categories(task):
+            counter[cat.lower()] += 1
+    return counter
+
+# (storage.data_version(), palette, category counts) over all dashboard tasks
+_dashboard_categories = None
+
+def _dashboard_category_styles() -> Tuple[Dict[str, str], Dict[str, int]]:
+    """
+    Palette and tag counts of the whole dashboard, as render_dashboard computes
+    them, so a page orders and colors tags like the full view. Kept while the
+    task files are unchanged (the pager renders many pages per version).
+    """
+    global _dashboard_categories
+    from storage import data_version
+    from task_table import load_table
+    version = data_version()
+    if _dashboard_categories is None or _dashboard_categories[0] != version:
+        tasks = [task for task in load_table().tasks if not task.title.startswith("📅")]
+        _dashboard_categories = (version, task_palette(tasks), _category_counts(tasks))
+    return _dashboard_categories[1], _dashboard_categories[2]
+
+class _LineStyles:
+    """Styles for one render, resolved once: theme colors, palette and tag segments."""
+
+    def __init__(self, palette: Dict[str, str], category_counter: Dict[str, int]):
+        theme = get_current_theme()
+        self.id_style = f"bold {theme['primary']}"
+        self.recurrence_style = theme["secondary"]
+        self.description_style = theme["warning"]
+        self.palette = palette
+        self.category_counter = category_counter
+        self._tags = {}
+
+    def tag(self, category: str, modifier: str) -> Text:
+        """'#Category' in its color, with the priority/completion modifier applied."""
+        key = (category, modifier)
+        tag = self._tags.get(key)
+        if tag is None:
+            color = self.palette.get(category, "white")
+            tag = Text()
+            tag.append("#", style=modifier)
+            tag.append(category, style=f"{modifier} bold {color}".strip())
+            self._tags[key] = tag
+        return tag
+
+def _task_line(task: Task, display_id, styles: _LineStyles) -> Text:
+    """
+    One dashboard/list line as styled Text:
+    ID [ ] due_date #category task_title duration 🔁 📝
+    """
+    # Text style of the date, tags, title and duration by completion and priority
+    if task.completed:
+        modifier = title_style = other_style = "dim strike"
+    elif task.priority == 1:
+        modifier, title_style, other_style = "", "bold red", "red"
+    elif task.priority == -1:
+        modifier = title_style = other_style = "dim"
+    else:
+        modifier = title_style = other_style = ""
+
+    parts = [(str(display_id), styles.id_style)]
+
+    # Checkbox
+    if task.title.startswith("📅"):
+        parts.append(("   ", ""))
+    elif task.completed:
+        parts.append(("[✓]", "dim"))
+    else:
+        parts.append(("[ ]", ""))
+
+    if task.due_date:
+        parts.append((task.due_date.strftime('%a %b %d'), other_style))
+
+    # Category tags (most common first, then alphabetically)
+    categories = _task_categories(task)
+    if categories:
+        if len(categories) > 1:
+            counter = styles.category_counter
+            categories = sorted(categories, key=lambda cat: (-counter[cat.lower()], cat.lower()))
+        tags = Text(" ").join(styles.tag(cat, modifier) for cat in categories)
+        parts.append((tags, None))
+
+    parts.append((task.title, title_style))
+
+    duration = task.get_duration_str()
+    if duration:
+        parts.append((duration, other_style))
+    if getattr(task, 'recurrent', False):
+        parts.append(("🔁", styles.recurrence_style))
+    if getattr(task, 'description', None):
+        parts.append(("📝", styles.description_style))
+
+    line = Text()
+    for i, (part, style) in enumerate(parts):
+        if i:
+            line.append("  ")
+        if isinstance(part, Text):
+            line.append_text(part)
+        else:
+            line.append(part, style=style)
+    return line
+
 def render_dashboard(tasks: List[Task]):
-    """Render dashboard grouped by time relative to current date"""
-    
-    from collections import defaultdict
-    from datetime import timedelta
+    """
+    Render dashboard grouped by time relative to current date.
+
+    The whole dashboard is built as one styled Text (no markup to re-parse)
+    and written to the terminal with a single print.
+    """
+    from rich.console import Group
     from streak_storage import get_streak_display
     from config_storage import get_show_streak
+    from task_table import TaskTable
+    
+    renderables = []
     
     # Show Streak at top right (compact)
     if get_show_streak():
-        console.print(Align.right(get_streak_display() + " "))
-    
-    now = datetime.now()
-    today = now.date()
-    tomorrow = today + timedelta(days=1)
-    week_end = today + timedelta(days=7)
-    month_end = today + timedelta(days=30)
-    
-    # Group tasks by time bucket
-    grouped = {
-        "non-assigned": [],
-        "Today": [],
-        "Tomorrow": [],
-        "This week": [],
-        "This month": [],
-        "Future": []
-    }
-    
-
+        renderables.append(Align.right(get_streak_display() + " "))
     
     if not tasks:
-        console.print(Align.center("[dim]No tasks to display.[/dim]"))
-        console.print()
+        renderables.append(Align.center("[dim]No tasks to display.[/dim]"))
+        renderables.append(Text())
+        console.print(Group(*renderables))
         return
-
-    for task in tasks:
-        if not task.due_date:
-            grouped["non-assigned"].append(task)
-        else:
-            task_date = task.due_date.date()
-            if task_date == today:
-                grouped["Today"].append(task)
-            elif task_date == tomorrow:
-                grouped["Tomorrow"].append(task)
-            elif task_date <= week_end:
-                grouped["This week"].append(task)
-            elif task_date <= month_end:
-                grouped["This month"].append(task)
-            else:
-                grouped["Future"].append(task)
-    
-    # Sort each group by category (alphabetically), then priority, then due date
-    for group in grouped.values():
-        def get_sort_key(task):
-            # Get primary category for sorting (first one if multiple, or empty string if none)
-            if task.category:
-                if isinstance(task.category, list) and task.category:
-                    primary_category = task.category[0].lower()
-                elif isinstance(task.category, str):
-                    primary_category = task.category.lower()
-                else:
-                    primary_category = ""
-            else:
-                primary_category = ""
-            
-            return (
-                primary_category,  # Group by category alphabetically
-                -task.priority,     # Then by priority (important first)
-                task.due_date if task.due_date else datetime.max,  # Then by due date
-                task.title.lower()  # Finally alphabetically by title
-            )
-        
-        group.sort(key=get_sort_key)
     
-    # Define display order with rainbow colors for headers
+    # Bucketed and sorted like the display index, so IDs match other views
+    table = TaskTable(tasks)
     theme = get_current_theme()
-    group_order = ["non-assigned", "Today", "Tomorrow", "This week", "This month", "Future"]
     group_colors = theme["header_colors"]
+    styles = _LineStyles(task_palette(tasks), _category_counts(tasks))
     
-    # Count category frequency across all tasks
-    from collections import Counter
-    category_counter = Counter()
-    for task in tasks:
-        if task.category:
-            if isinstance(task.category, list):
-                for cat in task.category:
-                    category_counter[cat.lower()] += 1
-            else:
-                category_counter[task.category.lower()] += 1
+    body = Text()
+    task_id = 1
+    for idx, rows in enumerate(table.dashboard_buckets()):
+        # Skip empty groups
+        if not rows:
+            continue
+        
+        body.append("\n")
+        body.append_text(_group_header(GROUP_NAMES[idx], group_colors[idx % len(group_colors)]))
+        body.append("\n")
+        
+        for row in rows:
+            body.append_text(_task_line(table.tasks[row], task_id, styles))
+            body.append("\n")
+            task_id += 1
     
-    # Create consistent color mapping for categories
-    # Remove local helper, use global get_category_color
+    renderables.append(body)  # Trailing newline leaves the final blank line
+    console.print(Group(*renderables))
+
+def render_dashboard_page(entries: List[list], tasks_by_id: Dict[str, Task], start: int, size: int):
+    """
+    Render one window of the dashboard: `size` rows from position `start` of
+    the display index's sorted task entries (display ID = position + 1).
 
+    Only the visible rows are looked up and styled; tag order and colors come
+    from the whole dashboard, as in render_dashboard. Buckets outside the
+    window collapse to a count ("Future: 4,210 tasks").
+    """
+    import display_index
     
-    # Track global task ID
-    task_id = 1
+    total = len(entries)
+    end = min(start + size, total)
+    theme = get_current_theme()
+    group_colors = theme["header_colors"]
     
-    # Render each time group
-    for idx, group_name in enumerate(group_order):
-        group_tasks = grouped[group_name]
-        
-        # Skip empty groups
-        if not group_tasks:
+    page_tasks = [tasks_by_id[entry[-1]] for entry in entries[start:end]]
+    styles = _LineStyles(*_dashboard_category_styles())
+    
+    body = Text()
+    for idx, (low, high) in enumerate(display_index.bucket_ranges(entries)):
+        if low == high:
             continue
+        color = group_colors[idx % len(group_colors)]
+        count = f"{high - low:,} task{'s' if high - low != 1 else ''}"
         
-        # Print group header with rainbow color
-        group_color = group_colors[idx % len(group_colors)]
-        console.print(f"\n[bold {group_color}]{group_name}[/bold {group_color}]")
+        if high <= start or low >= end:
+            body.append(f"\n{GROUP_NAMES[idx]}: {count}", style=f"dim {color}")
+            continue
         
-        # Print each task in the group
-        for task in group_tasks:
-            # Build task line: ID [ ] due_date #category task_title duration
-            
-            # ID
-            theme = get_current_theme()
-            id_str = f"[bold {theme['primary']}]{task_id}[/bold {theme['primary']}]"
-            
-            # Checkbox
-            if task.title.startswith("📅"):
-                check = "   "
-            elif task.completed:
-                check = "[dim][✓][/dim]"
-            else:
-                check = "[ ]"
-            
-            # Due date (if exists)
-            if task.due_date:
-                due_str = task.due_date.strftime('%a %b %d')
-            else:
-                due_str = ""
-            
-            # Category tags (support multiple) with consistent rainbow colors
-            tags = ""
-            if task.category:
-                if isinstance(task.category, list):
-                    # Sort categories by frequency (most common first), then alphabetically
-                    sorted_cats = sorted(
-                        task.category,
-                        key=lambda cat: (-category_counter[cat.lower()], cat.lower())
-                    )
-                    tag_parts = []
-                    for cat in sorted_cats:
-                        cat_color = get_category_color(cat)
-                        tag_parts.append(f"#[bold {cat_color}]{cat}[/bold {cat_color}]")
-                    tags = " ".join(tag_parts)
-                else:
-                    # Backward compatibility with old single-category tasks
-                    cat_color = get_category_color(task.category)
-                    tags = f"#[bold {cat_color}]{task.category}[/bold {cat_color}]"
-            
-            # Task title
-            title = task.title
-            
-            # Duration (if exists)
-            duration = task.get_duration_str() or ""
-            
-            # Recurrence icon
-            recurrence_icon = f"[{theme['secondary']}]🔁[/{theme['secondary']}]" if getattr(task, 'recurrent', False) else ""
-            
-            # Description icon
-            description_icon = f"[{theme['warning']}]📝[/{theme['warning']}]" if getattr(task, 'description', None) else ""
+        body.append("\n")
+        body.append_text(_group_header(GROUP_NAMES[idx], color))
+        body.append(f"  ({count})", style="dim")
+        if low < start:
+            body.append(f"\n  … {start - low:,} above", style="dim")
+        for position in range(max(low, start), min(high, end)):
+            body.append("\n")
+            body.append_text(_task_line(page_tasks[position - start], position + 1, styles))
+        if high > end:
+            body.append(f"\n  … {high - end:,} below", style="dim")
+    
+    pages = max(1, -(-total // size))
+    body.append(f"\n\nTasks {start + 1 if total else 0}-{end} of {total:,}  ·  page {start // size + 1}/{pages}\n",
+                style=f"bold {theme['primary']}")
+    console.print(body)
+
+def _read_key() -> str:
+    """Read one key press: a character, or "left"/"right"/"up"/"down"/"pageup"/"pagedown"/"esc"."""
+    import os
+    import sys
+    if os.name == 'nt':
+        import msvcrt
+        key = msvcrt.getch()
+        if key in (b'\xe0', b'\x00'):  # Special key prefix
+            return {b'K': "left", b'M': "right", b'H': "up", b'P': "down",
+                    b'I': "pageup", b'Q': "pagedown"}.get(msvcrt.getch(), "")
+        if key == b'\x1b':
+            return "esc"
+        return key.decode(errors="ignore")
+    
+    import select
+    import termios
+    import tty
+    fd = sys.stdin.fileno()
+    saved = termios.tcgetattr(fd)
+    try:
+        tty.setraw(fd)
+        key = os.read(fd, 1).decode(errors="ignore")
+        if key != "\x1b":
+            return key
+        # Escape sequence (arrows, page keys) or a lone Esc
+        sequence = ""
+        while select.select([fd], [], [], 0.05)[0]:
+            sequence += os.read(fd, 1).decode(errors="ignore")
+            if sequence[-1:].isalpha() or sequence[-1:] == "~":
+                break
+        return {"[D": "left", "[C": "right", "[A": "up", "[B": "down",
+                "[5~": "pageup", "[6~": "pagedown", "": "esc"}.get(sequence, "")
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, saved)
 
-            
-            # Apply styling based on priority and completion
-            if task.completed:
-                # Completed tasks: dimmed and strikethrough
-                line_parts = [
-                    id_str,
-                    check,
-                    f"[dim strike]{due_str}[/dim strike]" if due_str else "",
-                    f"[dim strike]{tags}[/dim strike]" if tags else "",
-                    f"[dim strike]{title}[/dim strike]",
-                    f"[dim strike]{duration}[/dim strike]" if duration else "",
-                    recurrence_icon,
-                    description_icon
-                ]
-            elif task.priority == 1:
-                # Important tasks: red
-                line_parts = [
-                    id_str,
-                    check,
-                    f"[red]{due_str}[/red]" if due_str else "",
-                    tags,
-                    f"[bold red]{title}[/bold red]",
-                    f"[red]{duration}[/red]" if duration else "",
-                    recurrence_icon,
-                    description_icon
-                ]
-            elif task.priority == -1:
-                # Unimportant tasks: dimmed
-                line_parts = [
-                    id_str,
-                    check,
-                    f"[dim]{due_str}[/dim]" if due_str else "",
-                    f"[dim]{tags}[/dim]" if tags else "",
-                    f"[dim]{title}[/dim]",
-                    f"[dim]{duration}[/dim]" if duration else "",
-                    recurrence_icon,
-                    description_icon
-                ]
-            else:
-                # Normal tasks: white
-                line_parts = [
-                    id_str,
-                    check,
-                    due_str,
-                    tags,
-                    title,
-                    duration,
-                    recurrence_icon,
-                    description_icon
-                ]
+def run_dashboard_pager(entries: List[list], get_tasks: Callable[[Iterable[str]], Dict[str, Task]],
+                        size: int, start: int = 0):
+    """
+    Page through the dashboard with the keyboard. `get_tasks` loads the tasks
+    of each page by id, so only what is on screen is ever built.
 
-            
-            # Filter out empty parts and join
-            line = "  ".join(part for part in line_parts if part)
-            console.print(line)
-            
-            task_id += 1
+    n / → / Space / PgDn next page, p / ← / PgUp previous page, ↓ / ↑ one row,
+    1-6 jump to a bucket, g / G first / last page, q / Esc quit.
+    """
+    import os
+    import display_index
+    
+    ranges = display_index.bucket_ranges(entries)
+    last_start = max(0, (len(entries) - 1) // size * size)
     
-    console.print()  # Final newline
+    while True:
+        os.system('cls' if os.name == 'nt' else 'clear')
+        tasks_by_id = get_tasks(entry[-1] for entry in entries[start:start + size])
+        render_dashboard_page(entries, tasks_by_id, start, size)
+        console.print("[dim]n/p or ←/→ page  |  ↑/↓ row  |  1-6 jump to " + ", ".join(GROUP_NAMES)
+                      + "  |  g/G first/last  |  q quit[/dim]")
+        
+        key = _read_key()
+        if key in ("q", "Q", "esc", "\x03"):
+            break
+        elif key in ("n", " ", "right", "pagedown"):
+            start = min(start + size, last_start)
+        elif key in ("p", "left", "pageup"):
+            start = max(start - size, 0)
+        elif key == "down":
+            start = min(start + 1, max(0, len(entries) - size))
+        elif key == "up":
+            start = max(start - 1, 0)
+        elif key == "g":
+            start = 0
+        elif key == "G":
+            start = last_start
+        elif key in ("1", "2", "3", "4", "5", "6"):
+            low, high = ranges[int(key) - 1]
+            if low < high:
+                start = low
 
 def render_task_list(tasks: List[Task], global_id_map: dict = None):
     """Render a simple list of tasks without grouping.
@@ -334,19 +415,7 @@ def render_task_list(tasks: List[Task], global_id_map: dict = None):
         tasks: List of tasks to render
         global_id_map: Optional dict mapping task.id -> display_id for consistent IDs across views
     """
-    from collections import Counter
-    
-    # Count category frequency across all tasks for consistent coloring
-    category_counter = Counter()
-    for task in tasks:
-        if task.category:
-            if isinstance(task.category, list):
-                for cat in task.category:
-                    category_counter[cat.lower()] += 1
-            else:
-                category_counter[task.category.lower()] += 1
-    
-
+    styles = _LineStyles(task_palette(tasks), _category_counts(tasks))
     
     # Sort by priority then due date
     sorted_tasks = sorted(tasks, key=lambda x: (
@@ -355,103 +424,26 @@ def render_task_list(tasks: List[Task], global_id_map: dict = None):
         x.title.lower()
     ))
     
-    # Render each task
-    local_id = 1
-    for task in sorted_tasks:
+    body = Text()
+    for local_id, task in enumerate(sorted_tasks, 1):
         # Use global ID if provided, otherwise use local numbering
         if global_id_map and task.id in global_id_map:
             display_id = global_id_map[task.id]
         else:
             display_id = local_id
-        
-        # ID
-        theme = get_current_theme()
-        id_str = f"[bold {theme['primary']}]{display_id}[/bold {theme['primary']}]"
-        
-        # Checkbox
-        if task.title.startswith("📅"):
-            check = "   "
-        elif task.completed:
-            check = "[dim][✓][/dim]"
-        else:
-            check = "[ ]"
-        
-        # Due date
-        due_str = task.due_date.strftime('%a %b %d') if task.due_date else ""
-        
-        # Category tags with consistent colors
-        tags = ""
-        if task.category:
-            if isinstance(task.category, list):
-                sorted_cats = sorted(
-                    task.category,
-                    key=lambda cat: (-category_counter[cat.lower()], cat.lower())
-                )
-                tag_parts = []
-                for cat in sorted_cats:
-                    cat_color = get_category_color(cat)
-                    tag_parts.append(f"#[bold {cat_color}]{cat}[/bold {cat_color}]")
-                tags = " ".join(tag_parts)
-            else:
-                cat_color = get_category_color(task.category)
-                tags = f"#[bold {cat_color}]{task.category}[/bold {cat_color}]"
-        
-        # Task title
-        title = task.title
-        
-        # Duration
-        duration = task.get_duration_str() or ""
-        
-        # Recurrence icon
-        recurrence_icon = f"[{theme['secondary']}]🔁[/{theme['secondary']}]" if getattr(task, 'recurrent', False) else ""
-        
-        # Description icon
-        description_icon = f"[{theme['warning']}]📝[/{theme['warning']}]" if getattr(task, 'description', None) else ""
-        
-        # Apply styling based on priority and completion
-        if task.completed:
-            line_parts = [
-                id_str, check,
-                f"[dim strike]{due_str}[/dim strike]" if due_str else "",
-                f"[dim strike]{tags}[/dim strike]" if tags else "",
-                f"[dim strike]{title}[/dim strike]",
-                f"[dim strike]{duration}[/dim strike]" if duration else "",
-                recurrence_icon,
-                description_icon
-            ]
-        elif task.priority == 1:
-            line_parts = [
-                id_str, check,
-                f"[red]{due_str}[/red]" if due_str else "",
-                tags,
-                f"[bold red]{title}[/bold red]",
-                f"[red]{duration}[/red]" if duration else "",
-                recurrence_icon,
-                description_icon
-            ]
-        elif task.priority == -1:
-            line_parts = [
-                id_str, check,
-                f"[dim]{due_str}[/dim]" if due_str else "",
-                f"[dim]{tags}[/dim]" if tags else "",
-                f"[dim]{title}[/dim]",
-                f"[dim]{duration}[/dim]" if duration else "",
-                recurrence_icon,
-                description_icon
-            ]
-        else:
-            line_parts = [
-                id_str, check, due_str, tags, title, duration, recurrence_icon, description_icon
-            ]
-        
-        line = "  ".join(part for part in line_parts if part)
-        console.print(line)
-        local_id += 1
+        body.append_text(_task_line(task, display_id, styles))
+        body.append("\n")
     
-    console.print()
+    console.print(body)
 
-def render_calendar(tasks: List[Task], year: int = None, month: int = None):
-    """Render a monthly calendar view with rainbow styling."""
+def render_calendar(tasks: List[Task], year: int = None, month: int = None, recurring: Optional[List[Task]] = None,
+                    index: Optional[CalendarIndex] = None, palette: Optional[Dict[str, str]] = None):
+    """
+    Render a monthly calendar view with rainbow styling.
+
+    Upcoming occurrences of the `recurring` tasks are previewed (marked 🔁).
+    Pass the session's `index` (and `palette`) to skip rebuilding them.
+    """
     import os
     
     # Use current date if not specified
@@ -483,16 +475,14 @@ def render_calendar(tasks: List[Task], year: int = None, month: int = None):
         color = rainbow_colors[i % len(rainbow_colors)]
         table.add_column(day, justify="center", header_style=f"bold {color}", width=12)
 
-    # Map dates to tasks
-    tasks_by_date = {}
-    for task in tasks:
-        if task.due_date and not task.completed:
-            d = task.due_date.date()
-            if d not in tasks_by_date:
-                tasks_by_date[d] = []
-            tasks_by_date[d].append(task)
-            
+    if index is None:
+        index = CalendarIndex(tasks, recurring)
+    buckets = index.month(year, month)
+
     # Category color helper
+    if palette is None:
+        palette = task_palette(index.tasks.values())
+    
     def get_task_color(task):
         if not task.category:
              return "white"
@@ -504,7 +494,7 @@ def render_calendar(tasks: List[Task], year: int = None, month: int = None):
         if not cat_to_use:
             return "white"
             
-        return get_category_color(cat_to_use)
+        return palette.get(cat_to_use, "white")
 
     for week in month_cal:
         row_cells = []
@@ -526,8 +516,10 @@ def render_calendar(tasks: List[Task], year: int = None, month: int = None):
                 current_date = None
             
             # Check for tasks on this day
-            if current_date and current_date in tasks_by_date:
-                for idx, task in enumerate(tasks_by_date[current_date]):
+            bucket = buckets.get(current_date.toordinal()) if current_date else None
+            if bucket:
+                for task_id, preview in bucket:
+                    task = index.tasks[task_id]
                     color = get_task_color(task)
                     
                     # Add description indicator
@@ -538,7 +530,8 @@ def render_calendar(tasks: List[Task], year: int = None, month: int = None):
                     limit = 8 if has_desc else 10
                     title_trunc = task.title[:limit] + ".." if len(task.title) > limit else task.title
                     
-                    cell_text.append(f"• {title_trunc}{desc_mark}\n", style=color)
+                    bullet = "🔁" if preview else "•"
+                    cell_text.append(f"{bullet} {title_trunc}{desc_mark}\n", style=color)
             
             row_cells.append(cell_text)
         
@@ -549,9 +542,13 @@ def render_calendar(tasks: List[Task], year: int = None, month: int = None):
     
     return year, month
 
-def render_calendar_interactive(tasks: List[Task], global_id_map: dict = None):
-    """Interactive calendar with arrow key navigation and day selection."""
-    import msvcrt
+def render_calendar_interactive(tasks: List[Task], global_id_map: dict = None, recurring: Optional[List[Task]] = None):
+    """
+    Interactive calendar with arrow key navigation and day selection.
+
+    The day buckets are indexed once for the session (see calendar_index), so
+    changing months and opening a day only touch the tasks shown.
+    """
     import os
     import calendar as cal_module
     
@@ -560,11 +557,11 @@ def render_calendar_interactive(tasks: List[Task], global_id_map: dict = None):
     month = now.month
     digit_buffer = ""
     
-    # Sort tasks by date to ensure IDs match other views
-    tasks.sort(key=lambda t: t.due_date if t.due_date else datetime.max)
+    # Local IDs (without a global map) follow due date order, like other views
+    index = CalendarIndex(tasks, recurring)
+    palette = task_palette(index.tasks.values())
     
     def get_task_color(task):
-        theme = get_current_theme()
         if not task.category:
              return "white"
              
@@ -575,7 +572,7 @@ def render_calendar_interactive(tasks: List[Task], global_id_map: dict = None):
         if not cat_to_use:
             return "white"
             
-        return get_category_color(cat_to_use)
+        return palette.get(cat_to_use, "white")
     
     def show_day_events(day: int):
         """Display events for a specific day."""
@@ -586,17 +583,19 @@ def render_calendar_interactive(tasks: List[Task], global_id_map: dict = None):
         except ValueError:
             console.print(f"[red]Invalid day: {day}[/]")
             console.print("[dim]Press any key to continue...[/]")
-            msvcrt.getch()
+            _read_key()
             return
         
         # Find tasks for this day
-        day_tasks = [t for t in tasks if t.due_date and t.due_date.date() == target_date and not t.completed]
+        entries = index.day(target_date)
+        day_tasks = [task for task, preview in entries if not preview]
+        previews = [task for task, preview in entries if preview]
         
         date_str = target_date.strftime('%A, %B %d, %Y')
         theme = get_current_theme()
         console.print(f"\n[bold {theme['primary']}]📅 {date_str}[/bold {theme['primary']}]\n")
         
-        if not day_tasks:
+        if not day_tasks and not previews:
             console.print("[dim]No events scheduled for this day.[/dim]")
         else:
             for i, task in enumerate(day_tasks):
@@ -612,7 +611,7 @@ def render_calendar_interactive(tasks: List[Task], global_id_map: dict = None):
                     display_id = global_id_map[task.id]
                 else:
                     # Fallback to local index if not found
-                    display_id = f"#{tasks.index(task) + 1}"
+                    display_id = f"#{index.local_id(task.id)}"
                 
                 if time_str:
                     console.print(f"  [dim]{display_id}[/dim] [{color}]• {time_str}[/{color}] [{color}]{task.title}{desc_icon}[/{color}]")
@@ -631,15 +630,19 @@ def render_calendar_interactive(tasks: List[Task], global_id_map: dict = None):
                     console.print(f"    [italic white]{task.description}[/italic white]")
                     console.print() # Extra spacing
         
+        for task in previews:
+            color = get_task_color(task)
+            console.print(f"  [dim]🔁[/dim] [{color}]{task.title}[/{color}] [dim]({recurrence.describe(task)})[/dim]")
+
         console.print("\n[dim]Press any key to return to calendar...[/dim]")
-        msvcrt.getch()
+        _read_key()
     
     while True:
         # Clear screen
         os.system('cls' if os.name == 'nt' else 'clear')
         
         # Render current month
-        render_calendar(tasks, year, month)
+        render_calendar(tasks, year, month, recurring, index=index, palette=palette)
         
         # Show digit buffer if typing
         if digit_buffer:
@@ -647,28 +650,25 @@ def render_calendar_interactive(tasks: List[Task], global_id_map: dict = None):
         
         # Wait for key press
         try:
-            key = msvcrt.getch()
+            key = _read_key()
             
-            # Handle arrow keys (they come as two bytes on Windows)
-            if key == b'\xe0':  # Special key prefix
-                key2 = msvcrt.getch()
-                if key2 == b'K':  # Left arrow
-                    month -= 1
-                    if month < 1:
-                        month = 12
-                        year -= 1
-                    digit_buffer = ""
-                elif key2 == b'M':  # Right arrow
-                    month += 1
-                    if month > 12:
-                        month = 1
-                        year += 1
-                    digit_buffer = ""
-            elif key == b'q' or key == b'Q' or key == b'\x1b':  # q, Q, or Escape
+            if key == "left":
+                month -= 1
+                if month < 1:
+                    month = 12
+                    year -= 1
+                digit_buffer = ""
+            elif key == "right":
+                month += 1
+                if month > 12:
+                    month = 1
+                    year += 1
+                digit_buffer = ""
+            elif key in ("q", "Q", "esc", "\x03"):  # q, Q, Escape (or Ctrl+C in raw mode)
                 break
-            elif key in [b'0', b'1', b'2', b'3', b'4', b'5', b'6', b'7', b'8', b'9']:
+            elif key.isdigit():
                 # Numeric input for day selection
-                digit_buffer += key.decode()
+                digit_buffer += key
                 if len(digit_buffer) >= 2:
                     # Try to show events for this day
                     day = int(digit_buffer)
@@ -676,7 +676,7 @@ def render_calendar_interactive(tasks: List[Task], global_id_map: dict = None):
                     if 1 <= day <= max_day:
                         show_day_events(day)
                     digit_buffer = ""
-            elif key == b'\r':  # Enter key
+            elif key in ("\r", "\n"):  # Enter key
                 if digit_buffer:
                     day = int(digit_buffer)
                     max_day = cal_module.monthrange(year, month)[1]
@@ -804,46 +804,33 @@ def render_notes(notes: List):
 
 def render_activity_heatmap():
     """Render Current Year activity heatmap (Jan 1 - Dec 31)."""
-    from history_storage import load_history
+    from rollup_storage import load_rollup
+    from activity_kernels import day_series, heatmap_grid
     from config_storage import get_show_heatmap, get_theme
-    from datetime import datetime, timedelta
+    from datetime import datetime
     
     if not get_show_heatmap():
         return
 
-    history = load_history()
-    # Count per date
-    counts = {}
-    for t in history:
-        if t.completed_at:
-             d = t.completed_at.date()
-             counts[d] = counts.get(d, 0) + 1
-             
     # Grid logic: Current Year
     now = datetime.now()
     year = now.year
     jan1 = datetime(year, 1, 1).date()
     
-    # Prepare rows
+    # Completions per day, from the daily rollup (no history segment is read),
+    # laid out as weekday rows x week columns
+    counts, _ = day_series(load_rollup()["days"], jan1, datetime(year, 12, 31).date())
+    grid = heatmap_grid(counts, jan1.weekday())
+    
     rows = [""] * 7
     theme = get_current_theme()
     
-    # 54 columns is safe max for any year layout (53 weeks + partial)
-    for c in range(54):
-        for r in range(7):
-             # Calculate date
-             # Grid starts at first week's Monday. 
-             # jan1 might be Wed (2). So offset 0-1 are empty. Offset 2 is Jan 1.
-             offset = c * 7 + r - jan1.weekday()
-             date = jan1 + timedelta(days=offset)
-             
-             if offset < 0 or date.year != year:
+    for r, cells in enumerate(grid):
+        for cnt in cells:
+             if cnt < 0:
                  # Outside current year boundaries -> Empty space
                  rows[r] += "  " 
                  continue
-                 
-             # Get count
-             cnt = counts.get(date, 0)
              
              # Determine style
              if cnt == 0:
@@ -878,6 +865,7 @@ def print_welcome_screen():
     
     from rich.panel import Panel
     from rich.text import Text
+    from rich.columns import Columns
     from streak_storage import get_streak_display
     from config_storage import get_show_streak, get_simplicity
     
@@ -954,7 +942,8 @@ def print_welcome_screen():
             f"[{theme['success']}]TDL stat[/]           - View statistics\n"
             f"[{theme['success']}]TDL settings[/]       - App settings\n"
             f"[{theme['success']}]TDL clear[/]          - Archive done\n"
-            f"[{theme['success']}]TDL hist[/]           - View history",
+            f"[{theme['success']}]TDL hist[/]           - View history\n"
+            f"[{theme['success']}]TDL search <words>[/] - Search everything",
             title=f"[bold {theme['success']}]🗂 Organize[/]",
             border_style=theme["success"],
             padding=(1, 2)
@@ -1,17 +1,11 @@
-from rich import box
 from rich.console import Console
-from rich.layout import Layout
 from rich.panel import Panel
-from rich.table import Table
 from rich.text import Text
-from rich.style import Style
 from rich.align import Align
 from datetime import datetime
-from models import Task
-from typing import List, Dict, Tuple, Optional
-import calendar
 
 from config_storage import get_theme
+from stats_calculator import StatsSummary
 
 console = Console(force_terminal=True)
 
@@ -60,26 +54,19 @@ def get_current_theme():
     return THEMES.get(theme_name, THEMES["rainbow"])
 
 
-def render_statistics(
-    daily_time: Dict[str, int],
-    daily_count: Dict[str, int],
-    longest_day: Optional[Tuple[str, int]],
-    most_productive_day: Optional[Tuple[str, int]],
-    longest_task: Optional[Tuple[Task, int]],
-    date_range: List[str]
-):
+def render_statistics(summary: StatsSummary):
     """
-    Render task statistics with 30-day bar chart and key metrics.
+    Render task statistics with a time bar chart and key metrics.
     
     Args:
-        daily_time: Dict mapping dates to total seconds worked
-        daily_count: Dict mapping dates to number of tasks completed
-        longest_day: Tuple of (date, total_seconds) for day with most time
-        most_productive_day: Tuple of (date, task_count) for day with most tasks
-        longest_task: Tuple of (task, duration) for longest task
-        date_range: List of date strings for last 30 days
+        summary: Aggregated window from stats_calculator.aggregate()
     """
-    from stats_calculator import format_duration
+    from stats_calculator import format_duration, WEEKDAY_NAMES
+    
+    bars = summary.chart_bars()
+    longest_day = summary.longest_day
+    most_productive_day = summary.most_productive_day
+    longest_task = summary.longest_task
     
     theme = get_current_theme()
     rainbow_colors = theme["rainbow_colors"]
@@ -99,7 +86,7 @@ def render_statistics(
     
     # === BAR CHART ===
     # Calculate max value for scaling in seconds
-    max_seconds = max(daily_time.values()) if daily_time else 1
+    max_seconds = max((seconds for _, seconds in bars), default=0) or 1
     
     # Calculate max minutes for display
     max_minutes = max_seconds / 60
@@ -117,18 +104,21 @@ def render_statistics(
         
     y_max_seconds = y_max * 60
     
-    # Create bar chart (30 days)
+    # Create bar chart (one bar per day, or per few days for long windows)
     chart_lines = []
     bar_height = 10  # Height of chart in lines
     
     # Title
-    chart_lines.append(Text("Last 30 Days - Time Spent", style="bold white", justify="center"))
+    if summary.end == datetime.now().date():
+        title = f"Last {summary.days} Days - Time Spent"
+    else:
+        title = f"{summary.start.strftime('%b %d, %Y')} - {summary.end.strftime('%b %d, %Y')} - Time Spent"
+    chart_lines.append(Text(title, style="bold white", justify="center"))
     chart_lines.append(Text())  # Empty line
     
     # Calculate bar heights (0-bar_height) relative to y_max_seconds
     bar_heights = []
-    for date_str in date_range:
-        time_value = daily_time.get(date_str, 0)
+    for _, time_value in bars:
         if y_max_seconds > 0:
             # Calculate height proportional to y_max
             # If time_value >= y_max_seconds, it fills the chart (shouldn't happen due to rounding up)
@@ -184,12 +174,12 @@ def render_statistics(
     # Previous line ends with " ┤ ".
     # We need padding equal to y_label_width + 1 (for the space before ┤)
     axis_indent = " " * (y_label_width) + " └─"
-    chart_lines.append(Text(f"{axis_indent}" + "─" * 30, style="dim"))
+    chart_lines.append(Text(f"{axis_indent}" + "─" * len(bars), style="dim"))
     
     # Date labels (show every 5 days)
     # Alignment: y_label_width + " ┤ " (3 chars)
     date_labels = Text(" " * (y_label_width + 3)) # Indent to align with bars
-    for i, date_str in enumerate(date_range):
+    for i, (date_str, _) in enumerate(bars):
         if i % 5 == 0:
             day = date_str.split("-")[2]  # Get day
             date_labels.append(day, style="dim")
@@ -234,6 +224,29 @@ def render_statistics(
         stats.append("Most Productive Day\n", style="bold cyan")
         stats.append("   No data yet\n\n", style="dim")
     
+    # Window totals and breakdowns
+    stats.append("✅ ", style="green")
+    stats.append("Completed\n", style="bold green")
+    stats.append(f"   {summary.total_tasks} tasks", style=f"bold {rainbow_colors[3]}")
+    stats.append(f" · {format_duration(summary.total_time)}\n\n", style="white")
+    
+    if summary.by_category:
+        stats.append("🏷  ", style="magenta")
+        stats.append("By Category\n", style="bold magenta")
+        top = sorted(summary.by_category.items(), key=lambda item: (-item[1][0], item[0]))[:5]
+        for name, (count, seconds) in top:
+            stats.append(f"   #{name[:15]:<15}", style=f"bold {rainbow_colors[5]}")
+            stats.append(f" {count:>4} · {format_duration(seconds)}\n", style="white")
+        stats.append("\n")
+    
+    if summary.by_weekday:
+        stats.append("📅 ", style="blue")
+        stats.append("By Weekday\n", style="bold blue")
+        for name, (count, seconds) in zip(WEEKDAY_NAMES, summary.by_weekday):
+            stats.append(f"   {name}", style=f"bold {rainbow_colors[4]}")
+            stats.append(f" {count:>4} · {format_duration(seconds)}\n", style="white")
+        stats.append("\n")
+    
     # Longest task
     if longest_task:
         task, duration = longest_task
@@ -0,0 +1,111 @@
+"""
+Thin TDL entry point that forwards commands to a running zenith daemon.
+
+Only imports the standard library. Commands the daemon can serve (see
+cli_args.can_run_in_daemon) are sent over its Unix domain socket and the
+rendered output is streamed back; everything else, or any command when no
+daemon is running, runs main.py directly in this process as before.
+
+Usage:
+    python zenith_client.py <TDL command and arguments>
+"""
+import json
+import os
+import runpy
+import shutil
+import socket
+import sys
+import tempfile
+from typing import List, Optional
+
+from cli_args import can_run_in_daemon, normalize_argv
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Override the socket location with ZENITH_SOCKET
+SOCKET_ENV = "ZENITH_SOCKET"
+
+CONNECT_TIMEOUT = 0.5
+
+
+def socket_path() -> str:
+    """Path of the daemon's socket (one per user)."""
+    if os.environ.get(SOCKET_ENV):
+        return os.environ[SOCKET_ENV]
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    return os.path.join(runtime_dir, f"zenith-{uid}.sock")
+
+
+def supported() -> bool:
+    return hasattr(socket, "AF_UNIX")
+
+
+def send_request(request: dict, out=None) -> Optional[int]:
+    """
+    Send one request and stream the daemon's output to `out`.
+
+    Returns the command's exit code, or None if no daemon answered.
+    """
+    if not supported():
+        return None
+    out = out or sys.stdout
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.settimeout(CONNECT_TIMEOUT)
+    try:
+        client.connect(socket_path())
+    except OSError:
+        client.close()
+        return None
+
+    client.settimeout(None)
+    with client:
+        client.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        received_output = False
+        with client.makefile("r", encoding="utf-8") as replies:
+            for line in replies:
+                message = json.loads(line)
+                if "out" in message:
+                    out.write(message["out"])
+                    out.flush()
+                    received_output = True
+                elif "exit" in message:
+                    return message["exit"]
+        # The daemon went away mid-command
+        return 1 if received_output else None
+
+
+def run_remote(args: List[str]) -> Optional[int]:
+    """Run a normalized command in the daemon; None if it isn't running."""
+    return send_request({
+        "argv": args,
+        "cwd": os.getcwd(),
+        "width": shutil.get_terminal_size().columns,
+        "terminal": sys.stdout.isatty(),
+    })
+
+
+def run_direct(argv: List[str]):
+    """Run main.py in this process, exactly like `python main.py ...`."""
+    main_path = os.path.join(SCRIPT_DIR, "main.py")
+    sys.argv = [main_path] + list(argv)
+    sys.path.insert(0, SCRIPT_DIR)
+    runpy.run_path(main_path, run_name="__main__")
+
+
+def main(argv: Optional[List[str]] = None):
+    argv = sys.argv[1:] if argv is None else argv
+    args = normalize_argv(argv)
+    if can_run_in_daemon(args):
+        try:
+            code = run_remote(args)
+        except BrokenPipeError:
+            # Output closed early (e.g. piped into head)
+            sys.exit(1)
+        if code is not None:
+            sys.exit(code)
+    run_direct(argv)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+"""
+Resident zenith daemon: serves TDL commands from one warm process.
+
+The daemon imports the app once and keeps the task snapshot, display index and
+other module caches in memory between commands; each cache still checks the
+files on disk, so edits made without the daemon are picked up. zenith_client.py
+forwards commands over a Unix domain socket and falls back to running main.py
+directly when no daemon is listening.
+
+Protocol (one JSON object per line):
+    client -> {"argv": [...], "cwd": "...", "width": 120, "terminal": true}
+              {"control": "ping"} | {"control": "stop"}
+    daemon -> {"out": "..."}   zero or more chunks of rendered output
+              {"exit": 0}      exit code, always last
+
+Usage:
+    TDL daemon start | stop | status
+    python zenith_daemon.py serve    (run in the foreground)
+
+Restart the daemon after updating the code; it keeps running the old modules.
+"""
+import io
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from contextlib import contextmanager, redirect_stderr, redirect_stdout
+from typing import Optional
+
+from zenith_client import send_request, socket_path, supported
+
+# Modules whose module-level `console` is swapped for one writing to the client
+CONSOLE_MODULES = ("main", "ui", "ui_stats", "repl")
+
+START_TIMEOUT = 10.0
+
+
+class _SocketWriter(io.TextIOBase):
+    """Text stream that forwards every write to the client as an {"out": ...} message."""
+
+    def __init__(self, conn: socket.socket, terminal: bool):
+        self._conn = conn
+        self._terminal = terminal
+
+    def writable(self) -> bool:
+        return True
+
+    def isatty(self) -> bool:
+        return self._terminal
+
+    def write(self, text: str) -> int:
+        if text:
+            _send(self._conn, {"out": text})
+        return len(text)
+
+
+def _send(conn: socket.socket, message: dict):
+    conn.sendall(json.dumps(message).encode("utf-8") + b"\n")
+
+
+@contextmanager
+def _client_output(writer: _SocketWriter, width: int, terminal: bool):
+    """Point stdout/stderr and the app's rich consoles at the client for one command."""
+    import rich
+    from rich.console import Console
+
+    saved_consoles = {}
+    saved_columns = os.environ.get("COLUMNS")
+    saved_stdin = sys.stdin
+    os.environ["COLUMNS"] = str(width)
+    # Nothing to read from: a prompt gets EOF instead of hanging the daemon
+    sys.stdin = io.StringIO("")
+    try:
+        for name in CONSOLE_MODULES:
+            module = sys.modules.get(name)
+            if module is not None and hasattr(module, "console"):
+                saved_consoles[module] = module.console
+                module.console = Console(file=writer, width=width, force_terminal=terminal)
+        rich.reconfigure(file=writer, width=width, force_terminal=terminal)
+        with redirect_stdout(writer), redirect_stderr(writer):
+            yield
+    finally:
+        for module, console in saved_consoles.items():
+            module.console = console
+        rich.reconfigure()
+        sys.stdin = saved_stdin
+        if saved_columns is None:
+            os.environ.pop("COLUMNS", None)
+        else:
+            os.environ["COLUMNS"] = saved_columns
+
+
+def handle(conn: socket.socket) -> bool:
+    """
+    Serve one request. Returns False when the daemon should stop.
+
+    Always answers with an exit code (unless the client is gone), so a failing
+    command can't leave the client waiting.
+    """
+    with conn.makefile("r", encoding="utf-8") as requests:
+        line = requests.readline()
+    try:
+        request = json.loads(line)
+    except json.JSONDecodeError:
+        request = None
+    if not isinstance(request, dict):
+        _send(conn, {"exit": 2})
+        return True
+
+    control = request.get("control")
+    if control in ("ping", "stop"):
+        _send(conn, {"exit": 0})
+        return control != "stop"
+
+    terminal = bool(request.get("terminal"))
+    writer = _SocketWriter(conn, terminal)
+    try:
+        import repl
+        width = int(request.get("width") or 80)
+        os.chdir(request.get("cwd") or os.getcwd())
+        with _client_output(writer, width, terminal):
+            code = repl.dispatch(list(request.get("argv") or []))
+    except Exception as e:
+        # Includes OSError: a missing working directory or a client that went away
+        code = 1
+        try:
+            writer.write(f"Error: {e}\n")
+        except OSError:
+            return True
+    try:
+        _send(conn, {"exit": code})
+    except OSError:
+        pass  # Client disconnected (e.g. Ctrl-C)
+    return True
+
+
+def serve(path: Optional[str] = None):
+    """Listen on the socket and serve commands one at a time until stopped."""
+    path = path or socket_path()
+    if os.path.exists(path):
+        if send_request({"control": "ping"}, io.StringIO()) is not None:
+            print("zenith daemon is already running.")
+            return
+        os.remove(path)
+
+    # Warm up: the whole point is to pay for these imports once
+    import main  # noqa: F401
+    import repl  # noqa: F401
+    import activity_kernels
+    activity_kernels.preload()  # Vectorized stats kernels, if NumPy is installed
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o177)  # socket only accessible by this user
+    try:
+        server.bind(path)
+    finally:
+        os.umask(old_umask)
+    server.listen(8)
+    try:
+        running = True
+        while running:
+            conn, _ = server.accept()
+            with conn:
+                try:
+                    running = handle(conn)
+                except Exception:
+                    # One bad request must not take the daemon down
+                    continue
+    finally:
+        server.close()
+        if os.path.exists(path):
+            os.remove(path)
+
+
+# --- Lifecycle (used by `TDL daemon`) ---
+
+def is_running() -> bool:
+    return send_request({"control": "ping"}, io.StringIO()) is not None
+
+
+def start() -> bool:
+    """Start the daemon in the background. Returns True once it answers."""
+    if not supported():
+        return False
+    if is_running():
+        return True
+    subprocess.Popen(
+        [sys.executable, os.path.abspath(__file__), "serve"],
+        stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    deadline = time.time() + START_TIMEOUT
+    while time.time() < deadline:
+        if is_running():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def stop() -> bool:
+    """Ask a running daemon to exit. Returns False if none was running."""
+    return send_request({"control": "stop"}, io.StringIO()) is not None
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "serve":
+        serve()
+    else:
+        print(__doc__)